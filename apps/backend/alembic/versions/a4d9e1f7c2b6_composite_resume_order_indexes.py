@@ -0,0 +1,56 @@
+"""Composite (resume_id, display_order) indexes on resume child tables
+
+Revision ID: a4d9e1f7c2b6
+Revises: f3b7d2c9e8a4
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d9e1f7c2b6'
+down_revision: Union[str, None] = 'f3b7d2c9e8a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index prefix, table) for every ordered resume child table
+CHILD_TABLES = (
+    ('idx_exp', 'resume_experiences'),
+    ('idx_edu', 'resume_education'),
+    ('idx_skill', 'resume_skills'),
+    ('idx_cert', 'resume_certifications'),
+    ('idx_proj', 'resume_projects'),
+    ('idx_custom', 'resume_custom_sections'),
+)
+
+
+def upgrade() -> None:
+    """Serve `WHERE resume_id = ? ORDER BY display_order` from one index, without a sort node."""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for prefix, table in CHILD_TABLES:
+            op.create_index(
+                f'{prefix}_resume_order', table, ['resume_id', 'display_order'],
+                unique=False, postgresql_concurrently=True
+            )
+            op.drop_index(
+                f'{prefix}_resume', table_name=table, postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    """Restore the single-column resume_id indexes."""
+    with op.get_context().autocommit_block():
+        for prefix, table in CHILD_TABLES:
+            op.create_index(
+                f'{prefix}_resume', table, ['resume_id'],
+                unique=False, postgresql_concurrently=True
+            )
+            op.drop_index(
+                f'{prefix}_resume_order', table_name=table, postgresql_concurrently=True
+            )
@@ -0,0 +1,52 @@
+"""Store resumes.processing_status as a native resume_status enum
+
+Revision ID: a7b2d9f4c6e1
+Revises: f1a7c3e5b9d2
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b2d9f4c6e1'
+down_revision: Union[str, None] = 'f1a7c3e5b9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+resume_status = postgresql.ENUM(
+    'Pending', 'Processing', 'Completed', 'Failed', name='resume_status'
+)
+
+
+def upgrade() -> None:
+    """VARCHAR(20) -> resume_status (4 bytes per row; unknown values are rejected)."""
+    resume_status.create(op.get_bind(), checkfirst=True)
+    op.alter_column('resumes', 'processing_status', server_default=None)
+    op.alter_column(
+        'resumes', 'processing_status',
+        existing_type=sa.String(length=20),
+        type_=resume_status,
+        postgresql_using='initcap(processing_status)::resume_status',
+        existing_nullable=False,
+    )
+    op.alter_column('resumes', 'processing_status', server_default='Pending')
+
+
+def downgrade() -> None:
+    """resume_status -> VARCHAR(20)."""
+    op.alter_column('resumes', 'processing_status', server_default=None)
+    op.alter_column(
+        'resumes', 'processing_status',
+        existing_type=resume_status,
+        type_=sa.String(length=20),
+        postgresql_using='processing_status::text',
+        existing_nullable=False,
+    )
+    op.alter_column('resumes', 'processing_status', server_default='Pending')
+    resume_status.drop(op.get_bind(), checkfirst=True)
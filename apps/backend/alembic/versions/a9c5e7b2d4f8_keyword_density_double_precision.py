@@ -0,0 +1,41 @@
+"""analysis_results.keyword_density as double precision
+
+Revision ID: a9c5e7b2d4f8
+Revises: f6b9d3a7e2c5
+Create Date: 2026-10-16 19:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c5e7b2d4f8'
+down_revision: Union[str, None] = 'f6b9d3a7e2c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store keyword_density as float8 so it reads back as a Python float."""
+    op.alter_column(
+        'analysis_results',
+        'keyword_density',
+        type_=sa.Double(),
+        existing_type=sa.Numeric(precision=6, scale=3),
+        existing_nullable=True,
+    )
+
+
+def downgrade() -> None:
+    """Restore keyword_density as NUMERIC(6, 3)."""
+    op.alter_column(
+        'analysis_results',
+        'keyword_density',
+        type_=sa.Numeric(precision=6, scale=3),
+        existing_type=sa.Double(),
+        existing_nullable=True,
+        postgresql_using='keyword_density::numeric(6, 3)',
+    )
@@ -0,0 +1,47 @@
+"""Denormalize user_id onto resume child tables
+
+Revision ID: b3e8f1a6d4c7
+Revises: a7b2d9f4c6e1
+Create Date: 2026-10-16 17:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8f1a6d4c7'
+down_revision: Union[str, None] = 'a7b2d9f4c6e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CHILD_TABLES = (
+    'resume_experiences',
+    'resume_education',
+    'resume_skills',
+    'resume_certifications',
+    'resume_projects',
+    'resume_custom_sections',
+)
+
+
+def upgrade() -> None:
+    """Copy each parent resume's user_id onto its child rows (partition key for all resume data)."""
+    for table in CHILD_TABLES:
+        op.add_column(table, sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True))
+        op.execute(
+            f'UPDATE {table} c SET user_id = r.user_id FROM resumes r WHERE r.id = c.resume_id'
+        )
+        # Rows whose parent resume no longer exists are unreachable; drop them
+        op.execute(f'DELETE FROM {table} WHERE user_id IS NULL')
+        op.alter_column(table, 'user_id', nullable=False)
+
+
+def downgrade() -> None:
+    """Drop the denormalized user_id columns."""
+    for table in CHILD_TABLES:
+        op.drop_column(table, 'user_id')
@@ -0,0 +1,47 @@
+"""Store resumes.content_hash as raw bytea with a hash index
+
+Revision ID: b8e3c5a2d7f1
+Revises: a4d9e1f7c2b6
+Create Date: 2026-10-16 14:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e3c5a2d7f1'
+down_revision: Union[str, None] = 'a4d9e1f7c2b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert hex SHA-256 strings to 32-byte digests; equality lookups use a hash index."""
+    op.drop_index('idx_resumes_content_hash', table_name='resumes')
+    op.alter_column(
+        'resumes', 'content_hash',
+        existing_type=sa.VARCHAR(length=64),
+        type_=sa.LargeBinary(length=32),
+        postgresql_using="decode(content_hash, 'hex')",
+        existing_nullable=True,
+    )
+    op.create_index(
+        'idx_resumes_content_hash', 'resumes', ['content_hash'],
+        unique=False, postgresql_using='hash'
+    )
+
+
+def downgrade() -> None:
+    """Restore hex VARCHAR(64) content hashes with a BTREE index."""
+    op.drop_index('idx_resumes_content_hash', table_name='resumes')
+    op.alter_column(
+        'resumes', 'content_hash',
+        existing_type=sa.LargeBinary(length=32),
+        type_=sa.VARCHAR(length=64),
+        postgresql_using="encode(content_hash, 'hex')",
+        existing_nullable=True,
+    )
+    op.create_index('idx_resumes_content_hash', 'resumes', ['content_hash'], unique=False)
@@ -0,0 +1,53 @@
+"""Add denormalized JSONB sections snapshot to resumes
+
+Revision ID: c2f6a8d4e9b3
+Revises: b8e3c5a2d7f1
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f6a8d4e9b3'
+down_revision: Union[str, None] = 'b8e3c5a2d7f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Section key -> child table aggregated into the snapshot
+SECTION_TABLES = (
+    ('experiences', 'resume_experiences'),
+    ('education', 'resume_education'),
+    ('skills', 'resume_skills'),
+    ('certifications', 'resume_certifications'),
+    ('projects', 'resume_projects'),
+    ('custom_sections', 'resume_custom_sections'),
+)
+
+
+def upgrade() -> None:
+    """Add resumes.sections, backfill it from the child tables, and index its skills."""
+    op.add_column('resumes', sa.Column('sections', postgresql.JSONB(), nullable=True))
+
+    sections = ', '.join(
+        f"'{key}', COALESCE((SELECT jsonb_agg(to_jsonb(c) ORDER BY c.display_order) "
+        f"FROM {table} c WHERE c.resume_id = resumes.id), '[]'::jsonb)"
+        for key, table in SECTION_TABLES
+    )
+    op.execute(f'UPDATE resumes SET sections = jsonb_build_object({sections})')
+
+    op.execute(
+        "CREATE INDEX idx_resumes_sections_skills ON resumes "
+        "USING gin ((sections -> 'skills') jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the sections snapshot."""
+    op.drop_index('idx_resumes_sections_skills', table_name='resumes')
+    op.drop_column('resumes', 'sections')
@@ -0,0 +1,31 @@
+"""Check users.email format in the database
+
+Revision ID: c6d2a9e4f1b8
+Revises: b3e8f1a6d4c7
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6d2a9e4f1b8'
+down_revision: Union[str, None] = 'b3e8f1a6d4c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add ck_users_email_format (NOT VALID: enforced for new writes, existing rows not rescanned)."""
+    op.execute(
+        "ALTER TABLE users ADD CONSTRAINT ck_users_email_format "
+        r"CHECK (email ~* '^[^@\s]+@[^@\s]+\.[^@\s]+$') NOT VALID"
+    )
+
+
+def downgrade() -> None:
+    """Drop the email format check."""
+    op.drop_constraint('ck_users_email_format', 'users', type_='check')
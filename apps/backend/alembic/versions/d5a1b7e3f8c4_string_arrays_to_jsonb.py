@@ -0,0 +1,65 @@
+"""Convert whole-value string array columns to JSONB
+
+Revision ID: d5a1b7e3f8c4
+Revises: c2f6a8d4e9b3
+Create Date: 2026-10-16 15:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a1b7e3f8c4'
+down_revision: Union[str, None] = 'c2f6a8d4e9b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, nullable) for columns that are only ever read and written whole;
+# user preferences stay nullable because profile updates may send null
+ARRAY_COLUMNS = (
+    ('resume_experiences', 'achievements', False),
+    ('resume_experiences', 'skills_used', False),
+    ('resume_education', 'achievements', False),
+    ('resume_education', 'relevant_coursework', False),
+    ('resume_projects', 'technologies_used', False),
+    ('resume_projects', 'achievements', False),
+    ('users', 'preferred_roles', True),
+    ('users', 'preferred_locations', True),
+)
+
+
+def upgrade() -> None:
+    """text[] -> jsonb (default '[]'); NULL arrays become empty lists."""
+    for table, column, nullable in ARRAY_COLUMNS:
+        op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table, column,
+            existing_type=postgresql.ARRAY(sa.String()),
+            type_=postgresql.JSONB(),
+            postgresql_using=f"COALESCE(to_jsonb({column}), '[]'::jsonb)",
+        )
+        op.alter_column(
+            table, column,
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=nullable,
+        )
+
+
+def downgrade() -> None:
+    """jsonb -> text[] with the original '{}' defaults."""
+    for table, column, _ in ARRAY_COLUMNS:
+        op.alter_column(table, column, server_default=None, nullable=True)
+        op.alter_column(
+            table, column,
+            existing_type=postgresql.JSONB(),
+            type_=postgresql.ARRAY(sa.String()),
+            postgresql_using=(
+                f"ARRAY(SELECT jsonb_array_elements_text({column}))::varchar[]"
+            ),
+        )
+        op.alter_column(table, column, server_default='{}')
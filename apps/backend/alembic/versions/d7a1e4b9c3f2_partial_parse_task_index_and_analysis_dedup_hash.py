@@ -0,0 +1,68 @@
+"""Partial index on active parse tasks and hashed analysis dedup key
+
+Revision ID: d7a1e4b9c3f2
+Revises: c5f9d3e1a2b4
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a1e4b9c3f2'
+down_revision: Union[str, None] = 'c5f9d3e1a2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Deterministic analysis columns, in AnalysisResult.DEDUP_FIELDS order
+_DEDUP_COLUMNS = (
+    'resume_id', 'job_description_id', 'resume_content_hash', 'job_description_hash',
+    'skills_version', 'keywords_rules_version', 'analysis_version',
+)
+# "<len>:<text>" per column, so no value can forge a column boundary
+_DEDUP_KEY_SQL = " || ".join(
+    f"length({column}::text) || ':' || {column}::text" for column in _DEDUP_COLUMNS
+)
+_DEDUP_NOT_NULL_SQL = " AND ".join(f"{column} IS NOT NULL" for column in _DEDUP_COLUMNS)
+
+
+def upgrade() -> None:
+    """Replace full status index and 7-column unique constraint with smaller equivalents."""
+    # Only queued/processing parse tasks are polled
+    op.drop_index('ix_parse_tasks_status', table_name='parse_tasks')
+    op.create_index(
+        'idx_parse_tasks_active', 'parse_tasks', ['status'], unique=False,
+        postgresql_where=sa.text("status IN ('queued', 'processing')")
+    )
+
+    # 32-byte SHA-256 of the length-prefixed deterministic columns, NULL if any
+    # column is NULL (must match AnalysisResult.compute_dedup_hash). Rows the old
+    # constraint covered had no NULLs and were already unique, so the new
+    # constraint can't fail on existing data
+    op.add_column('analysis_results',
+        sa.Column('dedup_hash', sa.LargeBinary(length=32), nullable=True)
+    )
+    op.execute(f"""
+        UPDATE analysis_results SET dedup_hash = sha256(convert_to(
+            {_DEDUP_KEY_SQL},
+            'UTF8'
+        ))
+        WHERE {_DEDUP_NOT_NULL_SQL}
+    """)
+    op.drop_constraint('uniq_analysis_deterministic', 'analysis_results', type_='unique')
+    op.create_unique_constraint('uq_analysis_dedup_hash', 'analysis_results', ['dedup_hash'])
+
+
+def downgrade() -> None:
+    """Restore full status index and 7-column unique constraint."""
+    op.drop_constraint('uq_analysis_dedup_hash', 'analysis_results', type_='unique')
+    op.create_unique_constraint(
+        'uniq_analysis_deterministic', 'analysis_results', list(_DEDUP_COLUMNS)
+    )
+    op.drop_column('analysis_results', 'dedup_hash')
+
+    op.drop_index('idx_parse_tasks_active', table_name='parse_tasks')
+    op.create_index('ix_parse_tasks_status', 'parse_tasks', ['status'], unique=False)
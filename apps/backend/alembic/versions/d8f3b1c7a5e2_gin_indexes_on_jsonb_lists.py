@@ -0,0 +1,45 @@
+"""GIN jsonb_path_ops indexes on searchable JSONB list columns
+
+Revision ID: d8f3b1c7a5e2
+Revises: c6d2a9e4f1b8
+Create Date: 2026-10-16 18:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f3b1c7a5e2'
+down_revision: Union[str, None] = 'c6d2a9e4f1b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index, table, column)
+GIN_INDEXES = (
+    ('idx_exp_skills_gin', 'resume_experiences', 'skills_used'),
+    ('idx_proj_technologies_gin', 'resume_projects', 'technologies_used'),
+    ('idx_users_preferred_roles_gin', 'users', 'preferred_roles'),
+    ('idx_users_preferred_locations_gin', 'users', 'preferred_locations'),
+)
+
+
+def upgrade() -> None:
+    """Serve containment (@>) searches like skills_used @> '["python"]' from GIN indexes."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, column in GIN_INDEXES:
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} '
+                f'ON {table} USING gin ({column} jsonb_path_ops)'
+            )
+
+
+def downgrade() -> None:
+    """Drop the JSONB list GIN indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in GIN_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
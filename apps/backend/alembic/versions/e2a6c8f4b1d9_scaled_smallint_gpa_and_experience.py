@@ -0,0 +1,50 @@
+"""Store gpa and years_of_experience as scaled SMALLINT
+
+Revision ID: e2a6c8f4b1d9
+Revises: d8f3b1c7a5e2
+Create Date: 2026-10-16 18:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a6c8f4b1d9'
+down_revision: Union[str, None] = 'd8f3b1c7a5e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, numeric column, scaled column, scale, numeric precision, numeric scale)
+SCALED_COLUMNS = (
+    ('resume_education', 'gpa', 'gpa_x100', 100, 3, 2),
+    ('resume_skills', 'years_of_experience', 'years_of_experience_x10', 10, 4, 1),
+    ('users', 'years_of_experience', 'years_of_experience_x10', 10, 4, 1),
+)
+
+
+def upgrade() -> None:
+    """Replace NUMERIC columns with SMALLINT holding the value times 10 or 100."""
+    for table, column, scaled, factor, _, _ in SCALED_COLUMNS:
+        op.add_column(table, sa.Column(scaled, sa.SmallInteger(), nullable=True))
+        op.execute(
+            f'UPDATE {table} SET {scaled} = round({column} * {factor})::smallint '
+            f'WHERE {column} IS NOT NULL'
+        )
+        op.drop_column(table, column)
+
+
+def downgrade() -> None:
+    """Restore the NUMERIC columns from their scaled SMALLINT values."""
+    for table, column, scaled, factor, precision, scale in SCALED_COLUMNS:
+        op.add_column(
+            table, sa.Column(column, sa.Numeric(precision, scale), nullable=True)
+        )
+        op.execute(
+            f'UPDATE {table} SET {column} = {scaled}::numeric / {factor} '
+            f'WHERE {scaled} IS NOT NULL'
+        )
+        op.drop_column(table, scaled)
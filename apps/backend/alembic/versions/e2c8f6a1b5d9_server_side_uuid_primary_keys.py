@@ -0,0 +1,54 @@
+"""Generate primary key UUIDs server-side with gen_random_uuid()
+
+Revision ID: e2c8f6a1b5d9
+Revises: d7a1e4b9c3f2
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c8f6a1b5d9'
+down_revision: Union[str, None] = 'd7a1e4b9c3f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose UUID primary key is named "id"
+TABLES = (
+    'resume_templates',
+    'resumes',
+    'resume_experiences',
+    'resume_education',
+    'resume_skills',
+    'resume_certifications',
+    'resume_projects',
+    'resume_custom_sections',
+    'users',
+    'uploaded_files',
+    'parse_tasks',
+    'job_descriptions',
+    'analysis_results',
+    'suggestions',
+    'suggestion_interactions',
+    'skill_corrections',
+    'industry_keywords',
+)
+
+
+def upgrade() -> None:
+    """Add gen_random_uuid() server default to every UUID primary key."""
+    # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto provides it on older servers
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    """Remove server-side UUID defaults (ids generated in Python again)."""
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
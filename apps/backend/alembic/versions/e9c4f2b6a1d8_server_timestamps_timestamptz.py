@@ -0,0 +1,69 @@
+"""Make server-defaulted timestamps TIMESTAMPTZ
+
+Revision ID: e9c4f2b6a1d8
+Revises: d5a1b7e3f8c4
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9c4f2b6a1d8'
+down_revision: Union[str, None] = 'd5a1b7e3f8c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columns filled by DEFAULT now() (existing naive values are UTC)
+TIMESTAMP_COLUMNS = (
+    ('analysis_results', ('analyzed_at',)),
+    ('industry_keywords', ('created_at', 'updated_at')),
+    ('job_descriptions', ('created_at',)),
+    ('parse_tasks', ('created_at', 'updated_at')),
+    ('resume_certifications', ('created_at',)),
+    ('resume_custom_sections', ('created_at', 'updated_at')),
+    ('resume_education', ('created_at', 'updated_at')),
+    ('resume_experiences', ('created_at', 'updated_at')),
+    ('resume_projects', ('created_at', 'updated_at')),
+    ('resume_skills', ('created_at',)),
+    ('resume_templates', ('created_at',)),
+    ('resumes', ('created_at', 'updated_at')),
+    ('skill_corrections', ('created_at',)),
+    ('suggestion_interactions', ('created_at',)),
+    ('suggestions', ('created_at',)),
+    ('uploaded_files', ('created_at', 'updated_at')),
+    ('user_onboarding_progress', ('updated_at',)),
+    ('users', ('created_at', 'updated_at')),
+)
+
+
+def upgrade() -> None:
+    """timestamp -> timestamptz, DEFAULT now() NOT NULL."""
+    for table, columns in TIMESTAMP_COLUMNS:
+        for column in columns:
+            op.alter_column(
+                table, column,
+                existing_type=sa.DateTime(),
+                type_=sa.DateTime(timezone=True),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                server_default=sa.text('now()'),
+                nullable=False,
+            )
+
+
+def downgrade() -> None:
+    """timestamptz -> timestamp (UTC wall time)."""
+    for table, columns in TIMESTAMP_COLUMNS:
+        for column in columns:
+            op.alter_column(
+                table, column,
+                existing_type=sa.DateTime(timezone=True),
+                type_=sa.DateTime(),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                existing_server_default=sa.text('now()'),
+                existing_nullable=False,
+            )
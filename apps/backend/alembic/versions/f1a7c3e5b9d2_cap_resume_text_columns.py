@@ -0,0 +1,48 @@
+"""Cap resume free-text columns with CHECK constraints
+
+Revision ID: f1a7c3e5b9d2
+Revises: e9c4f2b6a1d8
+Create Date: 2026-10-16 16:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a7c3e5b9d2'
+down_revision: Union[str, None] = 'e9c4f2b6a1d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TEXT_MAX_LENGTH = 16384
+
+TEXT_COLUMNS = (
+    ('resumes', 'professional_summary'),
+    ('resumes', 'error_message'),
+    ('resume_experiences', 'description'),
+    ('resume_projects', 'description'),
+)
+
+
+def upgrade() -> None:
+    """Truncate oversized values, add length CHECKs, and pin compressed out-of-line storage."""
+    for table, column in TEXT_COLUMNS:
+        op.execute(
+            f'UPDATE {table} SET {column} = left({column}, {TEXT_MAX_LENGTH}) '
+            f'WHERE char_length({column}) > {TEXT_MAX_LENGTH}'
+        )
+        op.create_check_constraint(
+            f'chk_{table}_{column}_length', table,
+            f'char_length({column}) <= {TEXT_MAX_LENGTH}'
+        )
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTENDED')
+
+
+def downgrade() -> None:
+    """Drop the length CHECKs (storage stays EXTENDED, the text default)."""
+    for table, column in TEXT_COLUMNS:
+        op.drop_constraint(f'chk_{table}_{column}_length', table, type_='check')
@@ -0,0 +1,41 @@
+"""Add GIN indexes on keyword array columns
+
+Revision ID: f3b7d2c9e8a4
+Revises: e2c8f6a1b5d9
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b7d2c9e8a4'
+down_revision: Union[str, None] = 'e2c8f6a1b5d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index keyword arrays so containment/overlap (@>, &&) queries use GIN lookups."""
+    op.create_index(
+        'idx_jd_keywords_gin', 'job_descriptions', ['extracted_keywords'],
+        unique=False, postgresql_using='gin'
+    )
+    op.create_index(
+        'idx_analysis_matched_keywords_gin', 'analysis_results', ['matched_keywords'],
+        unique=False, postgresql_using='gin'
+    )
+    op.create_index(
+        'idx_analysis_missing_keywords_gin', 'analysis_results', ['missing_keywords'],
+        unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Drop keyword array GIN indexes."""
+    op.drop_index('idx_analysis_missing_keywords_gin', table_name='analysis_results')
+    op.drop_index('idx_analysis_matched_keywords_gin', table_name='analysis_results')
+    op.drop_index('idx_jd_keywords_gin', table_name='job_descriptions')
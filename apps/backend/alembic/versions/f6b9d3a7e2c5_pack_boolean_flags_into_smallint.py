@@ -0,0 +1,81 @@
+"""Pack resume and template boolean flags into a SMALLINT
+
+Revision ID: f6b9d3a7e2c5
+Revises: e2a6c8f4b1d9
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b9d3a7e2c5'
+down_revision: Union[str, None] = 'e2a6c8f4b1d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, boolean column, bit, boolean default)
+FLAG_COLUMNS = (
+    ('resumes', 'is_primary', 1, False),
+    ('resume_templates', 'is_default', 2, False),
+    ('resume_templates', 'is_active', 4, True),
+)
+
+
+def upgrade() -> None:
+    """Replace boolean flag columns with bits of a single flags column."""
+    op.add_column(
+        'resumes',
+        sa.Column('flags', sa.SmallInteger(), nullable=False, server_default=sa.text('0')),
+    )
+    op.add_column(
+        'resume_templates',
+        sa.Column('flags', sa.SmallInteger(), nullable=False, server_default=sa.text('4')),
+    )
+    op.execute(
+        'UPDATE resumes SET flags = CASE WHEN is_primary THEN 1 ELSE 0 END'
+    )
+    op.execute(
+        'UPDATE resume_templates SET flags = '
+        '(CASE WHEN is_default THEN 2 ELSE 0 END) | (CASE WHEN is_active THEN 4 ELSE 0 END)'
+    )
+
+    op.drop_index('idx_resumes_primary', table_name='resumes')
+    for table, column, _, _ in FLAG_COLUMNS:
+        op.drop_column(table, column)
+    op.create_index(
+        'idx_resumes_primary',
+        'resumes',
+        ['user_id'],
+        unique=True,
+        postgresql_where=sa.text('(flags & 1) <> 0'),
+    )
+
+
+def downgrade() -> None:
+    """Restore the boolean flag columns from the flags bits."""
+    op.drop_index('idx_resumes_primary', table_name='resumes')
+    for table, column, bit, default in FLAG_COLUMNS:
+        op.add_column(
+            table,
+            sa.Column(
+                column,
+                sa.Boolean(),
+                nullable=False,
+                server_default=sa.text('true' if default else 'false'),
+            ),
+        )
+        op.execute(f'UPDATE {table} SET {column} = (flags & {bit}) <> 0')
+    op.drop_column('resume_templates', 'flags')
+    op.drop_column('resumes', 'flags')
+    op.create_index(
+        'idx_resumes_primary',
+        'resumes',
+        ['user_id'],
+        unique=True,
+        postgresql_where=sa.text('is_primary = TRUE'),
+    )
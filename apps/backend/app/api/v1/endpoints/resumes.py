@@ -1,12 +1,12 @@
 import re
 import uuid
-from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, status, BackgroundTasks, Response
+from fastapi import APIRouter, Depends, File, Header, UploadFile, HTTPException, status, BackgroundTasks, Response
 from sqlmodel import Session
 from uuid import UUID
 from typing import List
 
 from app.core.config import settings
-from app.core.dependencies import get_current_user_id
+from app.core.dependencies import get_current_user_id, json_body, json_body_openapi
 from app.core.logging_config import log_info, log_error, log_warning
 from app.db.session import get_db
 from app.models.analysis_model import AnalysisResult, Suggestion, SuggestionInteraction, SkillCorrection
@@ -23,14 +23,10 @@ from app.schemas.resume_schema import (
     ResumeParseStatusResponse,
     ResumeRead,
     ResumeListItem,
+    ResumeListAdapter,
     ResumeCreate,
     ResumeUpdate,
     ResumeComplete,
-    ExperienceRead,
-    EducationRead,
-    SkillRead,
-    CertificationRead,
-    ProjectRead,
 )
 from app.services.storage_service import upload_file, delete_file
 from app.services.resume_service import (
@@ -38,6 +34,7 @@ from app.services.resume_service import (
     get_parse_status,
     get_active_resume,
     get_resume_complete,
+    get_resume_sections_snapshot,
     create_resume,
     duplicate_resume,
 )
@@ -51,9 +48,14 @@ ALLOWED_MIME_TYPES = [
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 ]
 
-@router.post("", response_model=ResumeRead, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=ResumeRead,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(ResumeCreate),
+)
 async def create_resume_endpoint(
-    resume_data: ResumeCreate,
+    resume_data: ResumeCreate = Depends(json_body(ResumeCreate)),
     current_user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
@@ -77,7 +79,7 @@ async def create_resume_endpoint(
     try:
         resume = create_resume(db, resume_data)
         log_info(f"Resume created successfully: id={resume.id}, user_id={current_user_id}")
-        return resume
+        return ResumeRead.from_orm_fast(resume)
     
     except Exception as e:
         error_msg = str(e)
@@ -129,7 +131,11 @@ async def list_user_resumes(
         resumes = db.exec(statement).all()
         
         log_info(f"Retrieved {len(resumes)} resumes for user: {current_user_id}")
-        return resumes
+        # Serialize the page with the prebuilt list adapter; response_model still documents it
+        items = [ResumeListItem.from_orm_fast(resume) for resume in resumes]
+        return Response(
+            content=ResumeListAdapter.dump_json(items), media_type="application/json"
+        )
         
     except Exception as e:
         log_error(f"Failed to retrieve resumes for user {current_user_id}: {str(e)}")
@@ -452,7 +458,7 @@ async def get_active_resume_endpoint(
             detail="No resume found for user"
         )
     
-    return resume
+    return ResumeRead.from_orm_fast(resume)
 
 
 @router.get(
@@ -482,18 +488,19 @@ async def get_resume(
             detail="Resume not found or access denied"
         )
     
-    return resume
+    return ResumeRead.from_orm_fast(resume)
 
 
 @router.put(
     "/{resume_id}",
     response_model=ResumeRead,
     status_code=status.HTTP_200_OK,
-    summary="Update resume"
+    summary="Update resume",
+    openapi_extra=json_body_openapi(ResumeUpdate),
 )
 async def update_resume(
     resume_id: UUID,
-    resume_update: ResumeUpdate,
+    resume_update: ResumeUpdate = Depends(json_body(ResumeUpdate)),
     current_user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ) -> ResumeRead:
@@ -526,11 +533,10 @@ async def update_resume(
             detail="Resume not found or access denied"
         )
     
-    # Update only provided fields
-    update_data = resume_update.model_dump(exclude_unset=True)
-    
-    for field, value in update_data.items():
-        setattr(resume, field, value)
+    # Update only provided fields, read straight off the validated model
+    # (no model_dump dict or nested copies)
+    for field in resume_update.model_fields_set:
+        setattr(resume, field, getattr(resume_update, field))
     
     try:
         db.add(resume)
@@ -545,7 +551,7 @@ async def update_resume(
             detail="Failed to update resume"
         )
     
-    return resume
+    return ResumeRead.from_orm_fast(resume)
 
 
 @router.post(
@@ -595,7 +601,7 @@ async def duplicate_resume_endpoint(
             )
         
         log_info(f"Resume duplicated via API: original_id={resume_id}, new_id={new_resume.id}, user_id={current_user_id}")
-        return new_resume
+        return ResumeRead.from_orm_fast(new_resume)
         
     except HTTPException:
         raise
@@ -704,7 +710,9 @@ async def delete_resume(
 )
 async def get_resume_parse_status(
     resume_id: UUID,
+    response: Response,
     current_user_id: UUID = Depends(get_current_user_id),
+    if_none_match: str | None = Header(default=None),
     db: Session = Depends(get_db)
 ) -> ResumeParseStatusResponse:
     """
@@ -713,9 +721,15 @@ async def get_resume_parse_status(
     Returns the current processing status and any error messages
     for a resume that was uploaded for parsing.
     
+    Responses carry an ETag derived from the status and updated_at;
+    pollers that send it back in If-None-Match get an empty 304 until
+    the status changes.
+    
     Args:
         resume_id: UUID of the resume to check parsing status for
+        response: Outgoing response (for the ETag header)
         current_user_id: Authenticated user's ID (from token)
+        if_none_match: ETag from the client's previous poll, if any
         db: Database session
         
     Returns:
@@ -724,27 +738,25 @@ async def get_resume_parse_status(
     Raises:
         404: Resume not found or user doesn't have access
     """
-    # Verify the resume belongs to the user before returning parsing status
-    statement = select(Resume).where(
-        Resume.id == resume_id,
-        Resume.user_id == current_user_id
+    # The service verifies the resume belongs to the user
+    status_response = get_parse_status(
+        resume_id=resume_id,
+        user_id=current_user_id,
+        db=db
     )
-    result = db.exec(statement)
-    resume = result.first()
     
-    if not resume:
+    if not status_response:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume not found or access denied"
         )
     
-    # Use the service layer to get parse status
-    status_response = get_parse_status(
-        resume_id=resume_id,
-        user_id=current_user_id,
-        db=db
-    )
+    etag = f'W/"{status_response.status}-{status_response.updated_at.timestamp()}"'
+    
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
     
+    response.headers["ETag"] = etag
     return status_response
 
 
@@ -776,8 +788,9 @@ async def get_resume_complete_endpoint(
     Raises:
         404: Resume not found or user doesn't have access
     """
-    # Single call to service layer — handles auth check + data fetch (no double query)
-    complete_resume_data = get_resume_complete(
+    # Single call to service layer — handles auth check + data fetch (one row read
+    # from the sections snapshot)
+    complete_resume_data = get_resume_sections_snapshot(
         resume_id=resume_id,
         user_id=current_user_id,
         db=db
@@ -791,36 +804,6 @@ async def get_resume_complete_endpoint(
     
     resume = complete_resume_data["resume"]
     
-    # Build the complete response
-    return ResumeComplete(
-        id=resume.id,
-        user_id=resume.user_id,
-        version_name=resume.version_name,
-        template_id=resume.template_id,
-        is_primary=resume.is_primary,
-        section_order=resume.section_order,
-        content_hash=resume.content_hash,
-        file_path=resume.file_path,
-        file_url=resume.file_url,
-        full_name=resume.full_name,
-        email=resume.email,
-        phone=resume.phone,
-        location=resume.location,
-        linkedin_url=resume.linkedin_url,
-        github_url=resume.github_url,
-        portfolio_url=resume.portfolio_url,
-        professional_summary=resume.professional_summary,
-        raw_text=resume.raw_text,
-        processing_status=resume.processing_status,
-        error_message=resume.error_message,
-        last_analyzed_at=resume.last_analyzed_at,
-        created_at=resume.created_at,
-        updated_at=resume.updated_at,
-        deleted_at=resume.deleted_at,
-        experiences=[ExperienceRead.model_validate(e) for e in complete_resume_data["experiences"]],
-        education=[EducationRead.model_validate(e) for e in complete_resume_data["education"]],
-        skills=[SkillRead.model_validate(s) for s in complete_resume_data["skills"]],
-        certifications=[CertificationRead.model_validate(c) for c in complete_resume_data["certifications"]],
-        projects=[ProjectRead.model_validate(p) for p in complete_resume_data["projects"]],
-        custom_sections=[],
-    )
\ No newline at end of file
+    # Resume columns come straight from the ORM row; each section list is
+    # validated in a single adapter call
+    return ResumeComplete.build(resume, complete_resume_data)
\ No newline at end of file
@@ -4,10 +4,10 @@ Handles both system monitoring and frontend log ingestion.
 """
 
 import uuid
-import json
 from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy import text
 from sqlmodel import Session
@@ -20,7 +20,11 @@ from app.core.logging_config import (
     log_info,
     log_error,
 )
-from app.schemas.log_schema import FrontendLogPayload, LogResponse
+from app.schemas.log_schema import (
+    FrontendLogPayload,
+    FrontendLogPayloadSchema,
+    LogResponse,
+)
 
 router = APIRouter()
 
@@ -51,11 +55,20 @@ async def check_system_health(db: Session = Depends(get_db)):
         }
 
 
-@router.post("/log", response_model=LogResponse)
-async def submit_frontend_log(
-    log_data: FrontendLogPayload,
-    request: Request,
-) -> LogResponse:
+# The body is parsed by hand (see FrontendLogPayload.from_json); the pydantic
+# schema only documents it
+_LOG_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": FrontendLogPayloadSchema.model_json_schema()}
+        },
+    }
+}
+
+
+@router.post("/log", response_model=LogResponse, openapi_extra=_LOG_REQUEST_BODY)
+async def submit_frontend_log(request: Request) -> LogResponse:
     """
     Endpoint for frontend to submit logs.
     
@@ -63,8 +76,7 @@ async def submit_frontend_log(
     This allows client-side events and errors to be tracked server-side.
 
     Args:
-        log_data: Frontend log payload containing level, message, context, etc.
-        request: FastAPI request object (for IP and metadata)
+        request: FastAPI request object (JSON log body, client IP and metadata)
 
     Returns:
         LogResponse with success status and log ID
@@ -80,6 +92,9 @@ async def submit_frontend_log(
             "url": "http://localhost:3000/login"
         }
     """
+    # Malformed bodies raise ValueError, answered as 400 by the global handler
+    log_data = FrontendLogPayload.from_json(orjson.loads(await request.body()))
+
     try:
         # Generate unique log ID for tracking
         log_id = str(uuid.uuid4())
@@ -90,7 +105,7 @@ async def submit_frontend_log(
             "level": log_data.level,
             "message": log_data.message,
             "source": log_data.source,
-            "timestamp": log_data.timestamp.isoformat(),
+            "timestamp": log_data.logged_at.isoformat(),
             "user_id": log_data.user_id,
             "session_id": log_data.session_id,
             "url": log_data.url,
@@ -100,8 +115,9 @@ async def submit_frontend_log(
             "extra_data": log_data.extra_data or {},
         }
 
-        # Convert to JSON for consistent formatting
-        log_message = json.dumps(log_record)
+        # Convert to JSON for consistent formatting; orjson encodes the client's
+        # context/extra_data objects in C instead of re-walking them in Python
+        log_message = orjson.dumps(log_record).decode()
 
         # Log based on level
         level = log_data.level.upper()
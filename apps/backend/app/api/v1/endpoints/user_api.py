@@ -3,7 +3,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session
 
-from app.core.dependencies import get_current_user, get_current_user_id, require_scopes
+from app.core.dependencies import (
+    get_current_user,
+    get_current_user_id,
+    json_body,
+    json_body_openapi,
+    require_scopes,
+)
 from app.core.utils import require_found
 from app.db.session import get_db
 from app.schemas.user_schema import UserCreate, UserRead, UserUpdate
@@ -12,9 +18,9 @@ from app.services import user_service
 router = APIRouter()
 
 
-@router.post("/", response_model=UserRead, status_code=201, dependencies=[Depends(require_scopes(["users:create"]))])
+@router.post("/", response_model=UserRead, status_code=201, dependencies=[Depends(require_scopes(["users:create"]))], openapi_extra=json_body_openapi(UserCreate))
 async def create_new_user(
-    user: UserCreate,
+    user: UserCreate = Depends(json_body(UserCreate)),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
@@ -30,7 +36,7 @@ async def create_new_user(
             detail="You can only create your own user profile"
         )
     
-    return user_service.create_user(db=db, user_data=user)
+    return UserRead.from_orm_fast(user_service.create_user(db=db, user_data=user))
 
 
 @router.get("/profile", response_model=UserRead, dependencies=[Depends(require_scopes(["users:read"]))])
@@ -43,12 +49,12 @@ async def get_current_user_profile(
     Returns the profile information without requiring user_id as a path parameter.
     """
     user = user_service.get_user_by_id(db=db, user_id=current_user_id)
-    return require_found(user, "User")
+    return UserRead.from_orm_fast(require_found(user, "User"))
 
 
-@router.put("/profile", response_model=UserRead, dependencies=[Depends(require_scopes(["users:update"]))])
+@router.put("/profile", response_model=UserRead, dependencies=[Depends(require_scopes(["users:update"]))], openapi_extra=json_body_openapi(UserUpdate))
 async def update_current_user_profile(
-    user_data: UserUpdate,
+    user_data: UserUpdate = Depends(json_body(UserUpdate)),
     db: Session = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id),
 ):
@@ -57,7 +63,7 @@ async def update_current_user_profile(
     Updates profile information without requiring user_id as a path parameter.
     """
     user = user_service.update_user(db=db, user_id=current_user_id, user_data=user_data)
-    return require_found(user, "User")
+    return UserRead.from_orm_fast(require_found(user, "User"))
 
 
 @router.get("/{user_id}", response_model=UserRead, dependencies=[Depends(require_scopes(["users:read"]))])
@@ -77,13 +83,13 @@ async def get_user(
         )
     
     user = user_service.get_user_by_id(db=db, user_id=user_id)
-    return require_found(user, "User")
+    return UserRead.from_orm_fast(require_found(user, "User"))
 
 
-@router.patch("/{user_id}", response_model=UserRead, dependencies=[Depends(require_scopes(["users:update"]))])
+@router.patch("/{user_id}", response_model=UserRead, dependencies=[Depends(require_scopes(["users:update"]))], openapi_extra=json_body_openapi(UserUpdate))
 async def update_user(
     user_id: UUID,
-    user_data: UserUpdate,
+    user_data: UserUpdate = Depends(json_body(UserUpdate)),
     db: Session = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id),
 ):
@@ -98,7 +104,7 @@ async def update_user(
         )
     
     user = user_service.update_user(db=db, user_id=user_id, user_data=user_data)
-    return require_found(user, "User")
+    return UserRead.from_orm_fast(require_found(user, "User"))
 
 
 @router.delete("/{user_id}", status_code=204, dependencies=[Depends(require_scopes(["users:delete"]))])
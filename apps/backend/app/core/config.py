@@ -16,6 +16,10 @@ class Settings(BaseSettings):
      # JWT Configuration for Supabase Auth
     JWT_AUDIENCE: str = "authenticated"  # Supabase default audience
 
+    # Request log batching (records per write / max seconds a record waits)
+    REQUEST_LOG_FLUSH_BUFFER: int = 100
+    REQUEST_LOG_FLUSH_INTERVAL: float = 0.2
+
     # Application settings
     PROJECT_NAME: str = "Optihire API"
     API_V1_STR: str = "/api/v1"
@@ -0,0 +1,25 @@
+"""
+Identifier generation helpers.
+"""
+
+import os
+import time
+from uuid import UUID
+
+_VERSION_MASK = 0xF << 76
+_VARIANT_MASK = 0x3 << 62
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The top 48 bits hold the Unix timestamp in milliseconds and the rest is
+    random, so new primary keys land on the rightmost BTREE leaf instead of
+    a random page.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms << 80) | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~_VERSION_MASK) | (0x7 << 76)
+    value = (value & ~_VARIANT_MASK) | (0x2 << 62)
+    return UUID(int=value)
@@ -1,15 +1,21 @@
+import hashlib
+import threading
+import time
 from datetime import datetime, timezone
 from functools import lru_cache
 
 import httpx
 import jwt
-from cachetools import TTLCache
+from cachetools import LRUCache
 from fastapi import HTTPException, status
 
 from app.core.config import settings
 
-# Cache for decoded tokens (5 minute TTL, max 1000 tokens)
-token_cache = TTLCache(maxsize=1000, ttl=300)
+# Cache for decoded tokens, keyed by SHA-256 digest of the raw token (max 10000 tokens).
+# Entries are (payload, expires_at, config_fingerprint); expires_at is capped at the exp claim.
+TOKEN_CACHE_TTL_SECONDS = 30
+token_cache: LRUCache = LRUCache(maxsize=10000)
+token_cache_lock = threading.Lock()
 
 # Cache for JWKS (JSON Web Key Set)
 jwks_cache = {"keys": None, "fetched_at": None}
@@ -22,14 +28,11 @@ class JWTValidator:
         self.audience = settings.JWT_AUDIENCE
         self.issuer = settings.jwt_issuer
         self.jwks_url = f"{settings.SUPABASE_URL}/auth/v1/.well-known/jwks.json"
+        # Cached payloads are only trusted while the verification config is unchanged
+        self.config_fingerprint = hash((self.audience, self.issuer, self.jwks_url))
     
-    def get_signing_key(self, token: str):
-        """Get the signing key from JWKS endpoint"""
-        # Decode header to get kid
-        unverified_header = jwt.get_unverified_header(token)
-        kid = unverified_header.get("kid")
-        
-        # Fetch JWKS if not cached or expired
+    def ensure_jwks(self) -> None:
+        """Fetch JWKS if not cached or expired"""
         if jwks_cache["keys"] is None or jwks_cache["fetched_at"] is None or \
            (datetime.now(timezone.utc).timestamp() - jwks_cache["fetched_at"]) > 3600:
             try:
@@ -44,6 +47,14 @@ class JWTValidator:
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail=f"Failed to fetch JWKS: {str(e)}"
                 )
+
+    def get_signing_key(self, token: str):
+        """Get the signing key from JWKS endpoint"""
+        # Decode header to get kid
+        unverified_header = jwt.get_unverified_header(token)
+        kid = unverified_header.get("kid")
+        
+        self.ensure_jwks()
         
         # Find the key with matching kid
         for key in jwks_cache["keys"]:
@@ -70,9 +81,19 @@ class JWTValidator:
         Validate JWT token and return decoded payload.
         Implements caching to reduce validation overhead.
         """
-        # Check cache first (TTLCache automatically handles expiry)
-        if token in token_cache:
-            return token_cache[token]
+        # Check cache first, evicting entries past their expiry
+        cache_key = hashlib.sha256(token.encode()).digest()
+        with token_cache_lock:
+            cached = token_cache.get(cache_key)
+            if cached is not None:
+                payload, expires_at, fingerprint = cached
+                if fingerprint != self.config_fingerprint:
+                    # Audience/issuer/JWKS source changed: nothing cached can be trusted
+                    token_cache.clear()
+                elif expires_at > time.time():
+                    return payload
+                else:
+                    token_cache.pop(cache_key, None)
         
         try:
             # Get algorithm from token header
@@ -106,8 +127,11 @@ class JWTValidator:
                 }
             )
             
-            # Cache the validated token
-            token_cache[token] = payload
+            # Cache the validated token (only when it carries an exp claim to evict on)
+            if "exp" in payload:
+                expires_at = min(payload["exp"], time.time() + TOKEN_CACHE_TTL_SECONDS)
+                with token_cache_lock:
+                    token_cache[cache_key] = (payload, expires_at, self.config_fingerprint)
             
             return payload
             
@@ -143,7 +167,7 @@ class JWTValidator:
             )
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_jwt_validator() -> JWTValidator:
     """Singleton instance of JWT validator"""
     return JWTValidator()
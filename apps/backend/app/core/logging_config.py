@@ -1,9 +1,17 @@
 """Centralized Logging Configuration for Optihire Backend."""
 
+import atexit
+import copy
 import logging
 import logging.handlers
+import queue
+import threading
 from pathlib import Path
 
+import orjson
+
+from app.core.config import settings
+
 LOG_DIR = Path(__file__).parent.parent.parent / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 
@@ -13,6 +21,127 @@ FRONTEND_LOG_FILE = LOG_DIR / "frontend.log"
 REQUEST_LOG_FILE = LOG_DIR / "requests.log"
 
 
+class OrjsonFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects using orjson."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage(),
+            **getattr(record, "extra_fields", {}),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener's handlers.
+
+    The stock prepare() formats the record up front, folding the traceback
+    into msg and clearing exc_info, so a structured formatter such as
+    OrjsonFormatter never sees it. Only msg % args is merged here.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BackgroundQueueListener(logging.handlers.QueueListener):
+    """QueueListener whose start/stop are idempotent, so app startup/shutdown can cycle it."""
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        if not self.is_running:
+            super().start()
+
+    def stop(self) -> None:
+        if self.is_running:
+            super().stop()
+            # Push out anything a batching handler is still holding
+            for handler in self.handlers:
+                handler.flush()
+
+
+class BatchingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that buffers formatted records and writes each
+    batch with a single write() call.
+
+    A batch is written once flush_buffer records are pending, or by a daemon
+    thread every flush_interval seconds, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        flush_buffer: int = 100,
+        flush_interval: float = 0.2,
+        **kwargs,
+    ) -> None:
+        super().__init__(filename, **kwargs)
+        self.flush_buffer = flush_buffer
+        self.flush_interval = flush_interval
+        self._pending: list[str] = []
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name=f"log-flusher-{Path(filename).name}",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Called with the handler lock held (see Handler.handle)
+        try:
+            self._pending.append(self.format(record) + self.terminator)
+            if len(self._pending) >= self.flush_buffer:
+                self._write_pending()
+        except Exception:
+            self.handleError(record)
+
+    def _write_pending(self) -> None:
+        """Write all pending lines in one call. Caller must hold the handler lock."""
+        if not self._pending:
+            return
+
+        data = "".join(self._pending)
+        self._pending.clear()
+
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes:
+            self.doRollover()
+
+        self.stream.write(data)
+        self.stream.flush()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._write_pending()
+        finally:
+            self.release()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        self._closed.set()
+        self.flush()
+        super().close()
+
+
 class LoggerSetup:
     """Setup and configure loggers for different parts of the application."""
 
@@ -23,6 +152,9 @@ class LoggerSetup:
         level: int = logging.INFO,
         max_bytes: int = 10485760,  # 10MB
         backup_count: int = 5,
+        formatter: logging.Formatter | None = None,
+        flush_buffer: int | None = None,
+        flush_interval: float = 0.2,
     ) -> logging.Logger:
         """
         Create and configure a logger instance.
@@ -33,6 +165,9 @@ class LoggerSetup:
             level: Logging level (default: INFO)
             max_bytes: Max file size before rotation (10MB)
             backup_count: Number of backup files to keep
+            formatter: Formatter to use (default: detailed text format)
+            flush_buffer: Batch up to this many records per write (default: write each record)
+            flush_interval: Max seconds a batched record waits before being written
 
         Returns:
             Configured logger instance
@@ -45,19 +180,30 @@ class LoggerSetup:
             return logger
 
         # File handler with rotation
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=max_bytes,
-            backupCount=backup_count,
-            encoding="utf-8",
-        )
+        if flush_buffer:
+            file_handler = BatchingRotatingFileHandler(
+                log_file,
+                flush_buffer=flush_buffer,
+                flush_interval=flush_interval,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                encoding="utf-8",
+            )
+        else:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                encoding="utf-8",
+            )
         file_handler.setLevel(level)
 
         # Formatter with detailed information
-        formatter = logging.Formatter(
-            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
+        if formatter is None:
+            formatter = logging.Formatter(
+                fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
 
         file_handler.setFormatter(formatter)
 
@@ -65,6 +211,31 @@ class LoggerSetup:
 
         return logger
 
+    @staticmethod
+    def attach_queue_listener(logger: logging.Logger) -> BackgroundQueueListener:
+        """
+        Move a logger's handlers behind a QueueHandler.
+
+        Callers only pay for a queue put; formatting and file I/O run on
+        the listener's background thread.
+
+        Args:
+            logger: Logger whose handlers should run in the background
+
+        Returns:
+            Started listener (stop it on shutdown to flush pending records)
+        """
+        handlers = list(logger.handlers)
+        for handler in handlers:
+            logger.removeHandler(handler)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        logger.addHandler(StructuredQueueHandler(log_queue))
+
+        listener = BackgroundQueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        return listener
+
 
 # Initialize loggers
 backend_logger = LoggerSetup.setup_logger(
@@ -83,54 +254,56 @@ request_logger = LoggerSetup.setup_logger(
     name="optihire.requests",
     log_file=REQUEST_LOG_FILE,
     level=logging.INFO,
+    formatter=OrjsonFormatter(),
+    flush_buffer=settings.REQUEST_LOG_FLUSH_BUFFER,
+    flush_interval=settings.REQUEST_LOG_FLUSH_INTERVAL,
 )
 
+# Request logs are written on every API call; keep file I/O off the request path
+request_log_listener = LoggerSetup.attach_queue_listener(request_logger)
+atexit.register(request_log_listener.stop)
+
+_LOGGERS = {
+    "backend": backend_logger,
+    "frontend": frontend_logger,
+    "requests": request_logger,
+}
+
+
+def _log(
+    level: int,
+    message: str,
+    logger_name: str,
+    context: dict,
+    exc_info: bool = False,
+) -> None:
+    """Dispatch to the named logger, as structured fields for JSON loggers or a text suffix otherwise."""
+    logger = _LOGGERS.get(logger_name, backend_logger)
+
+    if logger is request_logger:
+        logger.log(level, message, exc_info=exc_info, extra={"extra_fields": context})
+    else:
+        suffix = f" | {context}" if context else ""
+        logger.log(level, f"{message}{suffix}", exc_info=exc_info)
+
 
 # Convenience functions for logging
 def log_info(message: str, logger_name: str = "backend", **kwargs):
     """Log an info message with optional context."""
-    logger = {
-        "backend": backend_logger,
-        "frontend": frontend_logger,
-        "requests": request_logger,
-    }.get(logger_name, backend_logger)
-
-    context = f" | {kwargs}" if kwargs else ""
-    logger.info(f"{message}{context}")
+    _log(logging.INFO, message, logger_name, kwargs)
 
 
 def log_error(message: str, error: Exception | None = None, logger_name: str = "backend", **kwargs):
     """Log an error message with exception details."""
-    logger = {
-        "backend": backend_logger,
-        "frontend": frontend_logger,
-        "requests": request_logger,
-    }.get(logger_name, backend_logger)
-
     error_msg = str(error) if error else ""
-    context = f" | {kwargs}" if kwargs else ""
-    logger.error(f"{message} {error_msg}{context}", exc_info=error is not None)
+    _log(logging.ERROR, f"{message} {error_msg}", logger_name, kwargs, exc_info=error is not None)
 
 
 def log_warning(message: str, logger_name: str = "backend", **kwargs):
     """Log a warning message with optional context."""
-    logger = {
-        "backend": backend_logger,
-        "frontend": frontend_logger,
-        "requests": request_logger,
-    }.get(logger_name, backend_logger)
-
-    context = f" | {kwargs}" if kwargs else ""
-    logger.warning(f"{message}{context}")
+    _log(logging.WARNING, message, logger_name, kwargs)
 
 
 def log_debug(message: str, logger_name: str = "backend", **kwargs):
     """Log a debug message with optional context."""
-    logger = {
-        "backend": backend_logger,
-        "frontend": frontend_logger,
-        "requests": request_logger,
-    }.get(logger_name, backend_logger)
-
-    context = f" | {kwargs}" if kwargs else ""
-    logger.debug(f"{message}{context}")
+    _log(logging.DEBUG, message, logger_name, kwargs)
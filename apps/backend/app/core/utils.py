@@ -38,30 +38,24 @@ def create_error_response(status_code: Union[int, HTTPStatus], code: str, messag
      return JSONResponse(content=error_body, status_code=status_value)
 
 
+# Supabase role -> application scopes, built once at import
+_USER_SCOPES = ("users:read", "users:create", "users:update", "users:delete")
+
+_ROLE_SCOPES: Dict[str, tuple[str, ...]] = {
+    # Authenticated users get full user management scopes
+    "authenticated": _USER_SCOPES,
+    # Service role gets all scopes (admin)
+    "service_role": _USER_SCOPES + ("admin:read", "admin:write"),
+}
+
+# Unknown role gets minimal scopes
+_DEFAULT_SCOPES = ("users:read",)
+
+
 def map_role_to_scopes(role: str) -> List[str]:
     """
     Maps Supabase roles to application scopes.
     Centralizes scope assignment logic.
+    Returns a fresh list so callers may mutate it safely.
     """
-    if role == "authenticated":
-        # Authenticated users get full user management scopes
-        return [
-            "users:read",
-            "users:create", 
-            "users:update",
-            "users:delete"
-        ]
-    elif role == "service_role":
-        # Service role gets all scopes (admin)
-        return [
-            "users:read",
-            "users:create",
-            "users:update", 
-            "users:delete",
-            "admin:read",
-            "admin:write"
-        ]
-    else:
-        # Unknown role gets minimal scopes
-        return ["users:read"]
-      
+    return list(_ROLE_SCOPES.get(role, _DEFAULT_SCOPES))
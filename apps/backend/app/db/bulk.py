@@ -0,0 +1,159 @@
+"""
+Bulk insert helpers for resume child tables.
+Streams rows through PostgreSQL COPY FROM STDIN instead of one INSERT per row.
+"""
+
+import io
+from collections.abc import Callable, Iterable, Sequence
+from datetime import date, datetime
+from uuid import UUID
+
+import orjson
+from sqlalchemy import (
+    Boolean,
+    Date,
+    DateTime,
+    Integer,
+    Numeric,
+    String,
+    insert,
+    lambda_stmt,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlmodel import Session
+
+# COPY TEXT format escapes (backslash must be replaced first)
+_COPY_ESCAPES = str.maketrans({
+    "\\": "\\\\",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\r": "\\r",
+})
+
+
+def _format_value_for_copy(value) -> str:
+    """Format a single Python value as a COPY TEXT field."""
+    if value is None:
+        return "\\N"
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (list, dict)):
+        # List and dict columns are all JSONB
+        text = orjson.dumps(value).decode()
+    else:
+        text = str(value)
+    return text.translate(_COPY_ESCAPES)
+
+
+# Column type -> inline expression formatting a non-NULL value `{v}`
+_COPY_EXPRESSIONS = (
+    (Boolean, '("t" if {v} else "f")'),
+    ((Date, DateTime), "{v}.isoformat()"),
+    (PGUUID, "str({v})"),
+    ((Integer, Numeric), "str({v})"),
+    (JSONB, "_dumps({v}).decode().translate(_E)"),
+    (String, "{v}.translate(_E)"),
+)
+
+# Per-model generated line serializers, built on first use
+_COPY_LINE_CACHE: dict[type, Callable[[Sequence], str]] = {}
+
+
+def _copy_expression(column_type) -> str:
+    """Return the inline formatting expression for one column type."""
+    for types, expression in _COPY_EXPRESSIONS:
+        if isinstance(column_type, types):
+            return expression
+    return "_any({v})"
+
+
+def _build_copy_line(model: type) -> Callable[[Sequence], str]:
+    """
+    Generate a straight-line COPY TEXT serializer for a model's COPY_COLUMNS.
+
+    Column types are resolved once here, so formatting a row is a fixed
+    sequence of inline expressions with no per-value type dispatch.
+    """
+    columns = model.__table__.columns
+    names = [f"c{i}" for i in range(len(model.COPY_COLUMNS))]
+    fields = [
+        f"(NULL if {name} is None else "
+        f"{_copy_expression(columns[column].type).format(v=name)})"
+        for name, column in zip(names, model.COPY_COLUMNS, strict=True)
+    ]
+    source = (
+        "def _copy_line(row):\n"
+        f"    {', '.join(names)}, = row\n"
+        f"    return TAB.join(({', '.join(fields)},)) + NEWLINE\n"
+    )
+    namespace = {
+        "NULL": "\\N",
+        "TAB": "\t",
+        "NEWLINE": "\n",
+        "_dumps": orjson.dumps,
+        "_E": _COPY_ESCAPES,
+        "_any": _format_value_for_copy,
+    }
+    exec(compile(source, f"<copy_line {model.__tablename__}>", "exec"), namespace)
+    return namespace["_copy_line"]
+
+
+def _copy_line_for(model: type) -> Callable[[Sequence], str]:
+    """Return the cached COPY line serializer for a model."""
+    copy_line = _COPY_LINE_CACHE.get(model)
+    if copy_line is None:
+        copy_line = _COPY_LINE_CACHE[model] = _build_copy_line(model)
+    return copy_line
+
+
+def _encode_copy_rows(rows: Iterable[Sequence], model: type | None = None) -> io.BytesIO:
+    """Encode rows as a COPY TEXT stream, using the model's generated serializer if given."""
+    if model is not None:
+        copy_line = _copy_line_for(model)
+        payload = "".join(copy_line(row) for row in rows)
+    else:
+        payload = "".join(
+            "\t".join(_format_value_for_copy(value) for value in row) + "\n"
+            for row in rows
+        )
+    return io.BytesIO(payload.encode("utf-8"))
+
+
+def bulk_insert_with_copy(db: Session, model: type, rows: Sequence[Sequence]) -> None:
+    """
+    Insert many rows of a resume child table in a single round-trip.
+
+    Rows are tuples in the order of the model's COPY_COLUMNS; columns left
+    out (id, timestamps) take their server defaults. Runs inside the
+    session's current transaction, so the caller still owns the commit.
+
+    Args:
+        db: Database session
+        model: SQLModel table class defining COPY_COLUMNS
+        rows: Row tuples matching model.COPY_COLUMNS
+    """
+    if not rows:
+        return
+
+    columns = model.COPY_COLUMNS
+    connection = db.connection()
+
+    # Non-PostgreSQL engines (e.g. tests) fall back to an executemany INSERT
+    if connection.dialect.name != "postgresql":
+        # Lambda statement: the INSERT is compiled once per model, not rebuilt per call
+        statement = lambda_stmt(lambda: insert(model), track_on=[model])
+        connection.execute(
+            statement, [dict(zip(columns, row, strict=True)) for row in rows]
+        )
+        return
+
+    sql = f"COPY {model.__tablename__} ({', '.join(columns)}) FROM STDIN"
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(sql, _encode_copy_rows(rows, model))
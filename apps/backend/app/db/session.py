@@ -1,5 +1,6 @@
 from contextlib import contextmanager
 
+import orjson
 from sqlmodel import Session, create_engine
 
 from app.core.config import settings
@@ -11,6 +12,16 @@ engine = create_engine(
     echo=False,  # Set to True to see generated SQL queries
     pool_size=10,
     max_overflow=20,
+    # Room for every (table x filter shape) we issue, so each statement compiles once
+    query_cache_size=1200,
+    # Collapse ORM flushes of many rows into multi-row INSERT ... VALUES
+    # (UPDATE/DELETE executemany goes through psycopg2's execute_batch)
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+    # JSON/JSONB columns (analysis payloads, suggestion context, etc.) via orjson
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads,
 )
 
 
@@ -1,14 +1,25 @@
 import logging
+from typing import Any
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import IntegrityError
 
+from app import schemas
 from app.api.v1.endpoints import system_api, user_api, resumes
 from app.core.config import settings
-from app.core.logging_config import backend_logger, log_info, log_error
+from app.core.dependencies import fill_json_body_schemas
+from app.core.jwt import get_jwt_validator
+from app.core.logging_config import (
+    backend_logger,
+    log_error,
+    log_info,
+    log_warning,
+    request_log_listener,
+)
 from app.middleware.auth import JWTMiddleware
+from app.middleware.health import HealthCheckMiddleware, ROOT_PAYLOAD
 from app.middleware.logging_middleware import LoggingMiddleware
 
 # Suppress FastAPI/Uvicorn console logging
@@ -25,6 +36,15 @@ app = FastAPI(
 )
 
 
+def openapi() -> dict[str, Any]:
+    """FastAPI's cached OpenAPI schema, with json_body request schemas filled in first."""
+    fill_json_body_schemas()
+    return FastAPI.openapi(app)
+
+
+app.openapi = openapi
+
+
 # =============================================================================
 # GLOBAL EXCEPTION HANDLERS
 # =============================================================================
@@ -65,6 +85,48 @@ async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse
 # Initialize logging
 log_info("Application starting up", logger_name="backend")
 
+
+@app.on_event("startup")
+def warm_jwt_validator() -> None:
+    """
+    Build the per-worker JWT validator and prime the JWKS cache,
+    so the first authenticated request doesn't pay the cold start.
+    """
+    validator = get_jwt_validator()
+    try:
+        validator.ensure_jwks()
+    except HTTPException as e:
+        # Non-fatal: the JWKS fetch is retried on the first authenticated request
+        log_warning(f"JWKS prefetch failed: {e.detail}", logger_name="backend")
+
+
+@app.on_event("startup")
+def build_route_schemas() -> None:
+    """Build the route schemas' deferred validators before the first request."""
+    schemas.warmup()
+
+
+@app.on_event("startup")
+def build_openapi_schema() -> None:
+    """
+    Generate the OpenAPI schema once per worker at startup.
+    FastAPI caches it on app.openapi_schema, so /openapi.json and /docs
+    never pay the model JSON-schema generation on a live request.
+    """
+    app.openapi()
+
+
+@app.on_event("startup")
+def start_request_log_listener() -> None:
+    """Ensure the background request-log writer is running (restarts after a shutdown)."""
+    request_log_listener.start()
+
+
+@app.on_event("shutdown")
+def stop_request_log_listener() -> None:
+    """Flush queued request logs and stop the background writer."""
+    request_log_listener.stop()
+
 # Add logging middleware (should be early in the stack)
 app.add_middleware(LoggingMiddleware)
 
@@ -84,6 +146,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Static health/root responses (outermost, bypasses auth and request logging)
+app.add_middleware(HealthCheckMiddleware)
+
 # Include routers
 app.include_router(
     user_api.router, prefix=f"{settings.API_V1_STR}/users", tags=["users"]
@@ -98,10 +163,5 @@ app.include_router(
 
 @app.get("/")
 def read_root():
-    return {
-        "message": "Welcome to Optihire API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "redoc": "/redoc",
-        "health": "/api/v1/system/health",
-    }
+    # Normally answered by HealthCheckMiddleware; kept for the OpenAPI schema
+    return ROOT_PAYLOAD
@@ -1,112 +1,176 @@
-from fastapi import Request, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import orjson
+from fastapi import status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from uuid import uuid4
 
-from app.core.utils import create_error_response, map_role_to_scopes
+from app.core.utils import map_role_to_scopes
 from app.core.jwt import get_jwt_validator
 
-def get_request_id(request: Request) -> str:
+
+def _error_body(code: str, message: str, details: Mapping) -> bytes:
+    """Serialize a standard {code, message, details} error body."""
+    return orjson.dumps({"code": code, "message": message, "details": dict(details)})
+
+
+# Shared, read-only error details (never mutated per request)
+_DETAIL_AUTH_HEADER = MappingProxyType({"header": "Authorization"})
+_DETAIL_SUB_CLAIM = MappingProxyType({"claim": "sub"})
+_DETAIL_SCOPES_CLAIM = MappingProxyType({"claim": "scopes"})
+
+# Fixed 401 bodies, serialized once at import
+_MISSING_AUTH_HEADER_BODY = _error_body(
+    "MISSING_AUTH_HEADER",
+    "Missing or invalid authorization header",
+    _DETAIL_AUTH_HEADER,
+)
+_MISSING_SUB_CLAIM_BODY = _error_body(
+    "MISSING_SUB_CLAIM",
+    "Token is missing 'sub' claim",
+    _DETAIL_SUB_CLAIM,
+)
+_INVALID_SCOPES_CLAIM_BODY = _error_body(
+    "INVALID_SCOPES_CLAIM",
+    "Token has invalid 'scopes' claim",
+    _DETAIL_SCOPES_CLAIM,
+)
+
+# Header pairs shared by every 401 (content-length is added per body)
+_UNAUTHORIZED_HEADERS = (
+    (b"content-type", b"application/json"),
+    (b"www-authenticate", b"Bearer"),
+)
+
+
+async def _send_unauthorized(send: Send, body: bytes) -> None:
+    """Send a 401 JSON response directly over ASGI."""
+    await send({
+        "type": "http.response.start",
+        "status": status.HTTP_401_UNAUTHORIZED,
+        # Fresh list: send wrappers append to it in place
+        "headers": [
+            *_UNAUTHORIZED_HEADERS,
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+def get_request_id(client_request_id: str | None) -> str:
     """
-    Retrieve request ID from header or generate a new one.
+    Return the client-supplied request ID or generate a new one.
     This ensures every request has a traceable ID.
     """
-    # Check if client already sent an x-request-id header
-    request_id = request.headers.get("x-request-id")
-    
-    # If not present, generate a new UUID
-    if not request_id:
-        request_id = str(uuid4())
-    
-    return request_id
-
-
-class JWTMiddleware(BaseHTTPMiddleware):
-    
+    # If the client didn't send an x-request-id header, generate a new UUID
+    # (32-char hex form skips the hyphenated string formatting)
+    if not client_request_id:
+        return uuid4().hex
+
+    return client_request_id
+
+
+def _with_request_id(send: Send, request_id: str) -> Send:
+    """Wrap send so the response start message carries the x-request-id header."""
+    request_id_header = (b"x-request-id", request_id.encode("latin-1"))
+
+    async def send_with_request_id(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Append the raw header pair in place instead of going through MutableHeaders
+            message.setdefault("headers", []).append(request_id_header)
+        await send(message)
+
+    return send_with_request_id
+
+
+class JWTMiddleware:
+
     """
     Global JWT validation middleware.
     Validates all requests except public paths.
+    Implemented as pure ASGI to avoid BaseHTTPMiddleware's per-request
+    Request construction and task-group overhead.
     """
-    
-    # Paths that don't require authentication
-    PUBLIC_PATHS = {
+
+    # Paths that don't require authentication (frozen: shared, never mutated per request)
+    PUBLIC_PATHS = frozenset({
         "/",
         "/health",
         "/docs",
         "/redoc",
         "/openapi.json",
-    }
-
-    async def dispatch(self, request: Request, call_next):
-        # 1. EXTRACT REQUEST ID (for traceability)
-        request_id = get_request_id(request)
-        request.state.request_id = request_id
-        
-        # 2. CHECK PUBLIC PATHS (skip auth for routes that don't need it)
-        if request.url.path in self.PUBLIC_PATHS:
-            response = await call_next(request)
-            response.headers["x-request-id"] = request_id
-            return response
-        
+    })
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        # Bound once per middleware instance instead of looked up per request
+        self.validator = get_jwt_validator()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+
+        # 1. CHECK PUBLIC PATHS (skip auth, and only echo a client-sent request ID)
+        if scope["path"] in self.PUBLIC_PATHS:
+            for name, value in scope["headers"]:
+                if name == b"x-request-id":
+                    request_id = value.decode("latin-1")
+                    state["request_id"] = request_id
+                    await self.app(scope, receive, _with_request_id(send, request_id))
+                    return
+            await self.app(scope, receive, send)
+            return
+
+        # 2. EXTRACT REQUEST ID AND AUTH HEADER (single pass over raw headers)
+        auth_header = None
+        client_request_id = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value.decode("latin-1")
+            elif name == b"x-request-id":
+                client_request_id = value.decode("latin-1")
+
+        request_id = get_request_id(client_request_id)
+        state["request_id"] = request_id
+        send_with_request_id = _with_request_id(send, request_id)
+
         # 3. EXTRACT & VALIDATE JWT TOKEN (protected routes only)
-        auth_header = request.headers.get("Authorization")
-        
-        if not auth_header or not auth_header.startswith("Bearer "):
-            error_response = create_error_response(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                code="MISSING_AUTH_HEADER",
-                message="Missing or invalid authorization header",
-                details={"header": "Authorization"}
-            )
-            error_response.headers["x-request-id"] = request_id
-            return error_response
-        
-        token = auth_header.split(" ")[1]
-        
-        validator = get_jwt_validator()
-        
+        # Auth scheme is case-insensitive (RFC 6750)
+        if not auth_header or auth_header[:7].lower() != "bearer ":
+            await _send_unauthorized(send_with_request_id, _MISSING_AUTH_HEADER_BODY)
+            return
+
+        token = auth_header[7:]
+
         try:
             # Validate token
-            payload = validator.validate_token(token)
+            payload = self.validator.validate_token(token)
 
             if "sub" not in payload:
-                error_response = create_error_response(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    code="MISSING_SUB_CLAIM",
-                    message="Token is missing 'sub' claim",
-                    details={"claim": "sub"}
-                )
-                error_response.headers["x-request-id"] = request_id
-                return error_response
-            
+                await _send_unauthorized(send_with_request_id, _MISSING_SUB_CLAIM_BODY)
+                return
+
             # Map Supabase role to scopes (for compatibility with existing endpoints)
-            if "scopes" not in payload:
-                role = payload.get("role", "")
-                payload["scopes"] = map_role_to_scopes(role)
-            
-            # Validate scopes is a list (not str, which is also a Sequence)
-            if not isinstance(payload.get("scopes"), list):
-                error_response = create_error_response(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    code="INVALID_SCOPES_CLAIM",
-                    message="Token has invalid 'scopes' claim",
-                    details={"claim": "scopes"}
-                )
-                error_response.headers["x-request-id"] = request_id
-                return error_response
-            
-            # Attach user info to request state
-            request.state.user = payload
+            scopes = payload.get("scopes")
+            if scopes is None:
+                scopes = map_role_to_scopes(payload.get("role", ""))
+                payload["scopes"] = scopes
+
+            # Validate scopes is a list (not str, which is also a Sequence);
+            # JSON-decoded claims are never list subclasses, so an exact type check suffices
+            if type(scopes) is not list:
+                await _send_unauthorized(send_with_request_id, _INVALID_SCOPES_CLAIM_BODY)
+                return
+
+            # Attach user info to request state (read back as request.state.user)
+            state["user"] = payload
         except Exception as e:
-            error_response = create_error_response(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                code="INVALID_TOKEN",
-                message="Token validation failed",
-                details={"error": str(e)}
-            )
-            error_response.headers["x-request-id"] = request_id
-            return error_response
-        
+            body = _error_body("INVALID_TOKEN", "Token validation failed", {"error": str(e)})
+            await _send_unauthorized(send_with_request_id, body)
+            return
+
         # 4. PROCESS REQUEST & ENRICH RESPONSE
-        response = await call_next(request)
-        response.headers["x-request-id"] = request_id
-        return response
+        await self.app(scope, receive, send_with_request_id)
@@ -0,0 +1,53 @@
+"""
+Health Check Middleware for FastAPI.
+Answers liveness probes and the root endpoint before the rest of the middleware stack runs.
+"""
+
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+HEALTH_PAYLOAD = {"status": "healthy", "service": "Optihire Backend"}
+
+ROOT_PAYLOAD = {
+    "message": "Welcome to Optihire API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "redoc": "/redoc",
+    "health": "/api/v1/system/health",
+}
+
+# Pre-serialized once at import; these bodies never change at runtime
+_STATIC_BODIES = {
+    "/health": orjson.dumps(HEALTH_PAYLOAD),
+    "/": orjson.dumps(ROOT_PAYLOAD),
+}
+
+
+class HealthCheckMiddleware:
+    """
+    Pure ASGI middleware that short-circuits static GET endpoints.
+    Must be registered outermost so probes skip JWT inspection and request logging.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            body = _STATIC_BODIES.get(scope["path"])
+            if body is not None:
+                await send({
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),
+                    ],
+                })
+                await send({
+                    "type": "http.response.body",
+                    "body": body if scope["method"] == "GET" else b"",
+                })
+                return
+
+        await self.app(scope, receive, send)
@@ -3,89 +3,113 @@ Request/Response Logging Middleware for FastAPI.
 Automatically logs all incoming requests with method, path, status code, and processing time.
 """
 
+import logging
 import time
-from typing import Callable
-import json
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging_config import request_logger
 
+# Paths that are never logged
+_SKIP_LOG_PATHS = frozenset({"/api/v1/system/health", "/docs", "/redoc", "/openapi.json"})
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+# Marker for status-polling endpoints whose fast successful responses aren't logged
+_POLLING_MARKER = "/parse-status/"
+
+
+class LoggingMiddleware:
     """
     Middleware to log all HTTP requests and responses.
-    Tracks method, path, query params, status code, and processing time.
+    Tracks method, path, raw query string, status code, and processing time.
+    Implemented as pure ASGI; status and timing are captured from the
+    outgoing http.response.start message.
     """
 
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and log details before and after.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/route handler
-
-        Returns:
-            HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Record start time
-        start_time = time.time()
-        method = request.method
-        path = request.url.path
-        query_params = dict(request.query_params) if request.query_params else {}
-
-        if path in ["/api/v1/system/health", "/docs", "/redoc", "/openapi.json"]:
-            response = await call_next(request)
-            return response
-
-        is_polling_endpoint = "/parse-status/" in path
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        try:
-            response = await call_next(request)
-            process_time = time.time() - start_time
-
-            # Skip fast successful polls to reduce noise
-            if is_polling_endpoint and response.status_code == 200 and process_time < 1.0:
-                response.headers["X-Process-Time"] = str(process_time)
-                return response
-
-            response_log = {
-                "method": method,
-                "path": path,
-                "status": response.status_code,
-                "duration_ms": round(process_time * 1000, 2),
-                "client_ip": request.client.host if request.client else "unknown",
-            }
-            
-            if query_params:
-                response_log["query_params"] = query_params
+        path = scope["path"]
 
-            if response.status_code >= 400:
-                request_logger.warning(json.dumps(response_log))
-            else:
-                request_logger.info(json.dumps(response_log))
+        if path in _SKIP_LOG_PATHS:
+            await self.app(scope, receive, send)
+            return
 
-            response.headers["X-Process-Time"] = str(process_time)
-            return response
+        # Record start time
+        start_time = time.perf_counter()
+        method = scope["method"]
+        is_polling_endpoint = _POLLING_MARKER in path
+        response_start: dict = {}
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                process_time = time.perf_counter() - start_time
+                response_start["status"] = message["status"]
+                response_start["process_time"] = process_time
+                message.setdefault("headers", []).append(
+                    (b"x-process-time", str(process_time).encode("latin-1"))
+                )
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_with_timing)
         except Exception as error:
-            process_time = time.time() - start_time
+            process_time = time.perf_counter() - start_time
             error_log = {
                 "method": method,
                 "path": path,
                 "error_type": type(error).__name__,
                 "error_msg": str(error),
                 "duration_ms": round(process_time * 1000, 2),
-                "client_ip": request.client.host if request.client else "unknown",
+                "client_ip": _client_ip(scope),
             }
-            if query_params:
-                error_log["query_params"] = query_params
-            
-            request_logger.error(json.dumps(error_log))
+            if scope["query_string"]:
+                error_log["query"] = scope["query_string"].decode("latin-1")
+
+            request_logger.error("request_error", extra={"extra_fields": error_log})
             raise
+
+        status_code = response_start.get("status", 500)
+        process_time = response_start.get("process_time", time.perf_counter() - start_time)
+
+        # Skip fast successful (or not-modified) polls to reduce noise
+        if is_polling_endpoint and status_code in (200, 304) and process_time < 1.0:
+            return
+
+        # Only build the record if the request logger will actually emit it;
+        # serialization is deferred to the orjson formatter on the handler
+        level = logging.WARNING if status_code >= 400 else logging.INFO
+        if not request_logger.isEnabledFor(level):
+            return
+
+        response_log = {
+            "method": method,
+            "path": path,
+            "status": status_code,
+            "duration_ms": round(process_time * 1000, 2),
+            "client_ip": _client_ip(scope),
+        }
+
+        # Raw query string: no QueryParams parsing or dict allocation per request
+        if scope["query_string"]:
+            response_log["query"] = scope["query_string"].decode("latin-1")
+
+        request_logger.log(level, "request", extra={"extra_fields": response_log})
+
+
+def _client_ip(scope: Scope) -> str:
+    """Return the client host from the ASGI scope, or 'unknown'."""
+    client = scope.get("client")
+    return client[0] if client else "unknown"
@@ -2,7 +2,6 @@
 Database models for the Optihire application.
 """
 
-# User models
 # Analysis models
 from app.models.analysis_model import (
     AnalysisResult,
@@ -25,8 +24,11 @@ from app.models.resume_model import (
     ResumeExperience,
     ResumeProject,
     ResumeSkill,
+    ResumeStatus,
     ResumeTemplate,
 )
+
+# User models
 from app.models.user_model import User, UserOnboardingProgress
 
 __all__ = [
@@ -37,6 +39,7 @@ __all__ = [
     "UploadedFile",
     "ParseTask",
     # Resume
+    "ResumeStatus",
     "ResumeTemplate",
     "Resume",
     "ResumeExperience",
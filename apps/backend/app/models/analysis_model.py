@@ -2,32 +2,48 @@
 Analysis, suggestions, and job description models for database operations.
 """
 
+import hashlib
 from datetime import datetime
-from decimal import Decimal
-from uuid import UUID, uuid4
+from typing import ClassVar
+from uuid import UUID
 
 from sqlalchemy import (
     ARRAY,
     CheckConstraint,
+    DateTime,
+    Double,
     Index,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
+    event,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlmodel import Column, Field, SQLModel
 
+from app.core.ids import uuid7
+
 
 class JobDescription(SQLModel, table=True):
     """Job descriptions for analysis."""
 
     __tablename__ = "job_descriptions"
+    __table_args__ = (
+        # GIN index: keyword containment/overlap (@>, &&) without scanning arrays
+        Index("idx_jd_keywords_gin", "extracted_keywords", postgresql_using="gin"),
+    )
 
     id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+        default_factory=uuid7,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     user_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), nullable=False, index=True)
@@ -41,8 +57,11 @@ class JobDescription(SQLModel, table=True):
         default_factory=list, sa_column=Column(ARRAY(String), server_default="{}")
     )
     jd_hash: str | None = Field(default=None, max_length=64)
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
     )
 
 
@@ -67,21 +86,38 @@ class AnalysisResult(SQLModel, table=True):
         Index("idx_analysis_resume", "resume_id"),
         Index("idx_analysis_jobdesc", "job_description_id"),
         Index("idx_analysis_time", "analyzed_at"),
-        UniqueConstraint(
-            "resume_id",
-            "job_description_id",
-            "resume_content_hash",
-            "job_description_hash",
-            "skills_version",
-            "keywords_rules_version",
-            "analysis_version",
-            name="uniq_analysis_deterministic",
+        Index(
+            "idx_analysis_matched_keywords_gin",
+            "matched_keywords",
+            postgresql_using="gin",
         ),
+        Index(
+            "idx_analysis_missing_keywords_gin",
+            "missing_keywords",
+            postgresql_using="gin",
+        ),
+        # Single 32-byte key instead of a 7-column b-tree (see compute_dedup_hash)
+        UniqueConstraint("dedup_hash", name="uq_analysis_dedup_hash"),
+    )
+
+    # Columns that make an analysis deterministic, in hash order
+    DEDUP_FIELDS: ClassVar[tuple[str, ...]] = (
+        "resume_id",
+        "job_description_id",
+        "resume_content_hash",
+        "job_description_hash",
+        "skills_version",
+        "keywords_rules_version",
+        "analysis_version",
     )
 
     id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+        default_factory=uuid7,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     resume_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), nullable=False, index=True)
@@ -101,9 +137,8 @@ class AnalysisResult(SQLModel, table=True):
     missing_keywords: list[str] = Field(
         default_factory=list, sa_column=Column(ARRAY(String), server_default="{}")
     )
-    keyword_density: Decimal | None = Field(
-        default=None, max_digits=6, decimal_places=3
-    )
+    # float8 reads back as a Python float (NUMERIC would build a Decimal per row)
+    keyword_density: float | None = Field(default=None, sa_column=Column(Double))
     has_contact_info: bool = Field(default=False)
     has_summary: bool = Field(default=False)
     has_experience: bool = Field(default=False)
@@ -117,9 +152,36 @@ class AnalysisResult(SQLModel, table=True):
     skills_version: str | None = Field(default=None, max_length=20)
     keywords_rules_version: str | None = Field(default=None, max_length=20)
     analysis_version: str = Field(default="1.0", max_length=20, nullable=False)
-    analyzed_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
+    dedup_hash: bytes | None = Field(
+        default=None, sa_column=Column(LargeBinary(32), nullable=True)
     )
+    analyzed_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+    )
+
+    def compute_dedup_hash(self) -> bytes | None:
+        """
+        SHA-256 over the deterministic columns, each length-prefixed ("<len>:<text>").
+
+        Returns None if any column is NULL: the old multi-column constraint
+        treated NULLs as distinct, and a NULL dedup_hash keeps those rows
+        unconstrained. Matches the backfill expression in migration d7a1e4b9c3f2.
+        """
+        parts = [getattr(self, name) for name in self.DEDUP_FIELDS]
+        if any(value is None for value in parts):
+            return None
+        joined = "".join(f"{len(text)}:{text}" for text in map(str, parts))
+        return hashlib.sha256(joined.encode("utf-8")).digest()
+
+
+@event.listens_for(AnalysisResult, "before_insert")
+@event.listens_for(AnalysisResult, "before_update")
+def _set_analysis_dedup_hash(mapper, connection, target: AnalysisResult) -> None:
+    """Keep dedup_hash in sync with the deterministic columns on every write."""
+    target.dedup_hash = target.compute_dedup_hash()
 
 
 class Suggestion(SQLModel, table=True):
@@ -139,8 +201,12 @@ class Suggestion(SQLModel, table=True):
     )
 
     id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+        default_factory=uuid7,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     analysis_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), nullable=False, index=True)
@@ -151,8 +217,11 @@ class Suggestion(SQLModel, table=True):
     state: str = Field(max_length=20, nullable=False, default="suggested")
     rules_version: str = Field(max_length=20, nullable=False)
     context: dict | None = Field(default=None, sa_column=Column(JSONB))
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
     )
     resolved_at: datetime | None = Field(default=None)
 
@@ -163,8 +232,12 @@ class SuggestionInteraction(SQLModel, table=True):
     __tablename__ = "suggestion_interactions"
 
     id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+        default_factory=uuid7,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     suggestion_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), nullable=False, index=True)
@@ -174,8 +247,11 @@ class SuggestionInteraction(SQLModel, table=True):
     )
     action: str = Field(max_length=20, nullable=False)
     details: dict | None = Field(default=None, sa_column=Column(JSONB))
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
     )
 
 
@@ -186,8 +262,12 @@ class SkillCorrection(SQLModel, table=True):
     __table_args__ = (Index("idx_skill_corrections_resume", "resume_id"),)
 
     id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+        default_factory=uuid7,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     user_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), nullable=False, index=True)
@@ -198,8 +278,11 @@ class SkillCorrection(SQLModel, table=True):
     skill: str = Field(max_length=100, nullable=False)
     action: str = Field(max_length=20, nullable=False)
     source: str = Field(max_length=20, nullable=False, default="user")
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
     )
 
 
@@ -222,8 +305,12 @@ class IndustryKeyword(SQLModel, table=True):
     )
 
     id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+        default_factory=uuid7,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     industry: str = Field(max_length=100, nullable=False)
     job_category: str | None = Field(default=None, max_length=100)
@@ -232,10 +319,15 @@ class IndustryKeyword(SQLModel, table=True):
     importance_score: int = Field(default=50, nullable=False)
     is_trending: bool = Field(default=False)
     rules_version: str = Field(max_length=20, nullable=False, default="v1")
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
     )
-    updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+    updated_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
         sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
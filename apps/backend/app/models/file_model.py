@@ -3,12 +3,14 @@ File upload and parsing models for database operations.
 """
 
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import Text, func
+from sqlalchemy import DateTime, Index, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlmodel import Column, Field, SQLModel
 
+from app.core.ids import uuid7
+
 
 class UploadedFile(SQLModel, table=True):
     """Uploaded files table for S3/Azure storage tracking."""
@@ -16,8 +18,12 @@ class UploadedFile(SQLModel, table=True):
     __tablename__ = "uploaded_files"
 
     id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+        default_factory=uuid7,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     user_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), nullable=False, index=True)
@@ -32,11 +38,16 @@ class UploadedFile(SQLModel, table=True):
     finalized_at: datetime | None = Field(default=None)
     ttl_expires_at: datetime | None = Field(default=None)
     extracted_text: str | None = Field(default=None, sa_column=Column(Text))
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
     )
-    updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+    updated_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
         sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
 
@@ -45,10 +56,22 @@ class ParseTask(SQLModel, table=True):
     """Parse tasks for processing uploaded files."""
 
     __tablename__ = "parse_tasks"
+    __table_args__ = (
+        # Only queued/processing tasks are polled; finished rows stay out of the index
+        Index(
+            "idx_parse_tasks_active",
+            "status",
+            postgresql_where=text("status IN ('queued', 'processing')"),
+        ),
+    )
 
     id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+        default_factory=uuid7,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     user_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), nullable=False, index=True)
@@ -56,15 +79,20 @@ class ParseTask(SQLModel, table=True):
     file_id: UUID | None = Field(
         default=None, sa_column=Column(PGUUID(as_uuid=True), nullable=True, index=True)
     )
-    status: str = Field(max_length=20, nullable=False, default="queued", index=True)
+    status: str = Field(max_length=20, nullable=False, default="queued")
     error_class: str | None = Field(default=None, max_length=100)
     error_message: str | None = Field(default=None, sa_column=Column(Text))
     started_at: datetime | None = Field(default=None)
     completed_at: datetime | None = Field(default=None)
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
     )
-    updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+    updated_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
         sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
@@ -0,0 +1,51 @@
+"""
+Base model for tables that store API fields packed into other columns.
+"""
+
+from collections.abc import Mapping
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, model_validator
+from sqlmodel import SQLModel
+
+__all__ = ["PackedFieldsModel"]
+
+
+class PackedFieldsModel(SQLModel):
+    """
+    SQLModel base that accepts the API view of packed columns as input.
+
+    Boolean views of bits in the `flags` column are listed in FLAG_FIELDS, and
+    float views of scaled integer columns in SCALED_FIELDS. Keyword
+    construction and model_validate both store them in the backing column
+    (table models skip validators in __init__, so it packs them itself).
+    """
+
+    # View name -> bit in `flags`
+    FLAG_FIELDS: ClassVar[Mapping[str, int]] = {}
+    # View name -> (scaled integer column, scale)
+    SCALED_FIELDS: ClassVar[Mapping[str, tuple[str, int]]] = {}
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**self._pack_views(data))
+
+    @model_validator(mode="before")
+    @classmethod
+    def _pack_views(cls, data: Any) -> Any:
+        """Move view values in the input into their backing columns."""
+        views = cls.FLAG_FIELDS.keys() | cls.SCALED_FIELDS.keys()
+        if isinstance(data, BaseModel) and any(hasattr(data, name) for name in views):
+            data = data.model_dump()
+        if not isinstance(data, dict) or views.isdisjoint(data):
+            return data
+
+        data = dict(data)
+        for name, bit in cls.FLAG_FIELDS.items():
+            if name in data:
+                flags = data.get("flags", cls.model_fields["flags"].default)
+                data["flags"] = flags | bit if data.pop(name) else flags & ~bit
+        for name, (column, scale) in cls.SCALED_FIELDS.items():
+            if name in data:
+                value = data.pop(name)
+                data[column] = None if value is None else round(value * scale)
+        return data
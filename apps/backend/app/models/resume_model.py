@@ -3,53 +3,182 @@ Resume and related section models for database operations.
 """
 
 from datetime import date, datetime
-from decimal import Decimal
-from uuid import UUID, uuid4
-
-from sqlalchemy import ARRAY, Index, String, Text, UniqueConstraint, func
+from enum import Enum
+from typing import ClassVar
+from uuid import UUID
+
+from pydantic import computed_field
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    Index,
+    LargeBinary,
+    SmallInteger,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlmodel import Column, Field, SQLModel
+from sqlalchemy.orm import deferred, raiseload, selectinload
+from sqlmodel import Column, Field, Relationship, SQLModel
+
+from app.core.ids import uuid7
+from app.models.packed import PackedFieldsModel
+
+__all__ = [
+    "ResumeStatus",
+    "ResumeTemplate",
+    "Resume",
+    "ResumeExperience",
+    "ResumeEducation",
+    "ResumeSkill",
+    "ResumeCertification",
+    "ResumeProject",
+    "ResumeCustomSection",
+    "RESUME_FULL_LOAD",
+]
+
+
+class ResumeStatus(str, Enum):
+    """Processing lifecycle of a resume (stored as the resume_status enum)."""
+
+    PENDING = "Pending"
+    PROCESSING = "Processing"
+    COMPLETED = "Completed"
+    FAILED = "Failed"
+
+
+# Ceiling for free-text columns; keeps long values compressible and bounded
+TEXT_MAX_LENGTH = 16384
+
+# Bits of the `flags` SMALLINT on resumes and resume_templates
+FLAG_IS_PRIMARY = 1
+FLAG_IS_DEFAULT = 2
+FLAG_IS_ACTIVE = 4
+
+
+def _text_length_check(column: str, table: str) -> CheckConstraint:
+    """CHECK constraint capping a Text column at TEXT_MAX_LENGTH characters."""
+    return CheckConstraint(
+        f"char_length({column}) <= {TEXT_MAX_LENGTH}",
+        name=f"chk_{table}_{column}_length",
+    )
 
 
-class ResumeTemplate(SQLModel, table=True):
+def _resume_join(child: str) -> dict:
+    """Relationship kwargs joining a child table to resumes (resume_id has no FK constraint)."""
+    return {"primaryjoin": f"Resume.id == foreign({child}.resume_id)"}
+
+
+def _resume_sections(child: str) -> dict:
+    """
+    Kwargs for a Resume section collection: rows in display order, and never
+    loaded just to delete the resume (callers bulk-delete child rows first).
+    """
+    return {
+        **_resume_join(child),
+        "order_by": f"{child}.display_order",
+        "passive_deletes": True,
+    }
+
+
+class ResumeTemplate(PackedFieldsModel, table=True):
     """Resume templates for different styles."""
 
     __tablename__ = "resume_templates"
 
+    FLAG_FIELDS: ClassVar[dict[str, int]] = {
+        "is_default": FLAG_IS_DEFAULT,
+        "is_active": FLAG_IS_ACTIVE,
+    }
+
     id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+        default_factory=uuid7,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     name: str = Field(max_length=100, nullable=False)
     version: str = Field(max_length=20, nullable=False, default="1.0")
     path: str = Field(max_length=255, nullable=False)
     thumbnail_url: str | None = Field(default=None, max_length=500)
-    is_default: bool = Field(default=False)
-    is_active: bool = Field(default=True)
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
+    # is_default / is_active packed as bits; the properties below are the API view
+    flags: int = Field(
+        default=FLAG_IS_ACTIVE,
+        sa_column=Column(
+            SmallInteger, nullable=False, server_default=text(str(FLAG_IS_ACTIVE))
+        ),
+    )
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
     )
 
+    @computed_field
+    @property
+    def is_default(self) -> bool:
+        """Whether this is the default template."""
+        return bool(self.flags & FLAG_IS_DEFAULT)
+
+    @is_default.setter
+    def is_default(self, value: bool) -> None:
+        self.flags = self.flags | FLAG_IS_DEFAULT if value else self.flags & ~FLAG_IS_DEFAULT
+
+    @computed_field
+    @property
+    def is_active(self) -> bool:
+        """Whether the template can be selected."""
+        return bool(self.flags & FLAG_IS_ACTIVE)
+
+    @is_active.setter
+    def is_active(self, value: bool) -> None:
+        self.flags = self.flags | FLAG_IS_ACTIVE if value else self.flags & ~FLAG_IS_ACTIVE
 
-class Resume(SQLModel, table=True):
+
+# The sections snapshot can be large; list pages, status polls and writes
+# never need it, so it is left out of SELECT ... FROM resumes by default
+_SECTIONS_COLUMN = Column("sections", JSONB)
+
+
+class Resume(PackedFieldsModel, table=True):
     """Main resume table."""
 
     __tablename__ = "resumes"
     __table_args__ = (
+        _text_length_check("professional_summary", "resumes"),
+        _text_length_check("error_message", "resumes"),
         Index("idx_resumes_user", "user_id"),
-        Index("idx_resumes_content_hash", "content_hash"),
+        Index("idx_resumes_content_hash", "content_hash", postgresql_using="hash"),
+        Index(
+            "idx_resumes_sections_skills",
+            text("(sections -> 'skills') jsonb_path_ops"),
+            postgresql_using="gin",
+        ),
         Index(
             "idx_resumes_primary",
             "user_id",
             unique=True,
-            postgresql_where="is_primary = TRUE",
+            postgresql_where=text(f"(flags & {FLAG_IS_PRIMARY}) <> 0"),
         ),
     )
+    __mapper_args__ = {"properties": {"sections": deferred(_SECTIONS_COLUMN)}}
+
+    FLAG_FIELDS: ClassVar[dict[str, int]] = {"is_primary": FLAG_IS_PRIMARY}
 
     id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+        default_factory=uuid7,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     user_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), nullable=False, index=True)
@@ -58,9 +187,19 @@ class Resume(SQLModel, table=True):
     template_id: UUID | None = Field(
         default=None, sa_column=Column(PGUUID(as_uuid=True), nullable=True)
     )
-    is_primary: bool = Field(default=False)
+    # Bit flags (FLAG_IS_PRIMARY); `is_primary` is the API view
+    flags: int = Field(
+        default=0,
+        sa_column=Column(SmallInteger, nullable=False, server_default=text("0")),
+    )
     section_order: dict | None = Field(default=None, sa_column=Column(JSONB))
-    content_hash: str | None = Field(default=None, max_length=64)
+    # Denormalized snapshot of every section, rebuilt after child-table writes;
+    # deferred (see __mapper_args__), so only an explicit undefer loads it
+    sections: dict | None = Field(default=None, sa_column=_SECTIONS_COLUMN)
+    # Raw SHA-256 digest (32 bytes), half the size of the hex form
+    content_hash: bytes | None = Field(
+        default=None, sa_column=Column(LargeBinary(32), nullable=True)
+    )
     file_path: str | None = Field(default=None, max_length=500)
     file_url: str | None = Field(default=None, max_length=500)
     full_name: str | None = Field(default=None, max_length=200)
@@ -72,32 +211,114 @@ class Resume(SQLModel, table=True):
     portfolio_url: str | None = Field(default=None, max_length=255)
     professional_summary: str | None = Field(default=None, sa_column=Column(Text))
     raw_text: str | None = Field(default=None, sa_column=Column(Text))
-    processing_status: str = Field(default="Pending", max_length=20)
+    processing_status: ResumeStatus = Field(
+        default=ResumeStatus.PENDING,
+        sa_column=Column(
+            SAEnum(
+                ResumeStatus,
+                name="resume_status",
+                values_callable=lambda statuses: [status.value for status in statuses],
+            ),
+            nullable=False,
+            server_default=ResumeStatus.PENDING.value,
+        ),
+    )
     error_message: str | None = Field(default=None, sa_column=Column(Text))
     last_analyzed_at: datetime | None = Field(default=None)
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
-    )
-    updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    updated_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
         sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
     deleted_at: datetime | None = Field(default=None)
 
+    @computed_field
+    @property
+    def is_primary(self) -> bool:
+        """Whether this is the user's primary resume."""
+        return bool(self.flags & FLAG_IS_PRIMARY)
+
+    @is_primary.setter
+    def is_primary(self, value: bool) -> None:
+        self.flags = self.flags | FLAG_IS_PRIMARY if value else self.flags & ~FLAG_IS_PRIMARY
+
+    # Section collections; load them with RESUME_FULL_LOAD to avoid N+1 lazy loads
+    experiences: list["ResumeExperience"] = Relationship(
+        back_populates="resume",
+        sa_relationship_kwargs=_resume_sections("ResumeExperience"),
+    )
+    education: list["ResumeEducation"] = Relationship(
+        back_populates="resume",
+        sa_relationship_kwargs=_resume_sections("ResumeEducation"),
+    )
+    skills: list["ResumeSkill"] = Relationship(
+        back_populates="resume",
+        sa_relationship_kwargs=_resume_sections("ResumeSkill"),
+    )
+    certifications: list["ResumeCertification"] = Relationship(
+        back_populates="resume",
+        sa_relationship_kwargs=_resume_sections("ResumeCertification"),
+    )
+    projects: list["ResumeProject"] = Relationship(
+        back_populates="resume",
+        sa_relationship_kwargs=_resume_sections("ResumeProject"),
+    )
+    custom_sections: list["ResumeCustomSection"] = Relationship(
+        back_populates="resume",
+        sa_relationship_kwargs=_resume_sections("ResumeCustomSection"),
+    )
+
 
 class ResumeExperience(SQLModel, table=True):
     """Work experience entries for resumes."""
 
     __tablename__ = "resume_experiences"
-    __table_args__ = (Index("idx_exp_resume", "resume_id"),)
+    __table_args__ = (
+        _text_length_check("description", "resume_experiences"),
+        Index("idx_exp_resume_order", "resume_id", "display_order"),
+        Index(
+            "idx_exp_skills_gin",
+            text("skills_used jsonb_path_ops"),
+            postgresql_using="gin",
+        ),
+    )
 
-    id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+    # Columns written by bulk COPY, in table order (id and timestamps use server defaults)
+    COPY_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "resume_id",
+        "user_id",
+        "company_name",
+        "job_title",
+        "location",
+        "start_date",
+        "end_date",
+        "is_current",
+        "description",
+        "achievements",
+        "skills_used",
+        "display_order",
+    )
+
+    id: UUID | None = Field(
+        default=None,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     resume_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), nullable=False, index=True)
     )
+    # Owner of the parent resume, denormalized so child rows can be partitioned by user
+    user_id: UUID = Field(sa_column=Column(PGUUID(as_uuid=True), nullable=False))
     company_name: str = Field(max_length=200, nullable=False)
     job_title: str = Field(max_length=200, nullable=False)
     location: str | None = Field(default=None, max_length=255)
@@ -106,34 +327,69 @@ class ResumeExperience(SQLModel, table=True):
     is_current: bool = Field(default=False)
     description: str | None = Field(default=None, sa_column=Column(Text))
     achievements: list[str] = Field(
-        default_factory=list, sa_column=Column(ARRAY(String), server_default="{}")
+        default_factory=list,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'[]'::jsonb")),
     )
     skills_used: list[str] = Field(
-        default_factory=list, sa_column=Column(ARRAY(String), server_default="{}")
+        default_factory=list,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'[]'::jsonb")),
     )
     display_order: int = Field(default=0, nullable=False)
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
-    )
-    updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    updated_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
         sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
 
+    resume: Resume | None = Relationship(
+        back_populates="experiences", sa_relationship_kwargs=_resume_join("ResumeExperience")
+    )
+
 
-class ResumeEducation(SQLModel, table=True):
+class ResumeEducation(PackedFieldsModel, table=True):
     """Education entries for resumes."""
 
     __tablename__ = "resume_education"
-    __table_args__ = (Index("idx_edu_resume", "resume_id"),)
-
-    id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+    __table_args__ = (Index("idx_edu_resume_order", "resume_id", "display_order"),)
+
+    # Columns written by bulk COPY, in table order (id and timestamps use server defaults)
+    COPY_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "resume_id",
+        "user_id",
+        "institution_name",
+        "degree_type",
+        "field_of_study",
+        "location",
+        "start_date",
+        "end_date",
+        "is_current",
+        "gpa_x100",
+        "achievements",
+        "relevant_coursework",
+        "display_order",
+    )
+
+    SCALED_FIELDS: ClassVar[dict[str, tuple[str, int]]] = {"gpa": ("gpa_x100", 100)}
+
+    id: UUID | None = Field(
+        default=None,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     resume_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), nullable=False, index=True)
     )
+    user_id: UUID = Field(sa_column=Column(PGUUID(as_uuid=True), nullable=False))
     institution_name: str = Field(max_length=200, nullable=False)
     degree_type: str | None = Field(default=None, max_length=100)
     field_of_study: str | None = Field(default=None, max_length=200)
@@ -141,49 +397,114 @@ class ResumeEducation(SQLModel, table=True):
     start_date: date | None = Field(default=None)
     end_date: date | None = Field(default=None)
     is_current: bool = Field(default=False)
-    gpa: Decimal | None = Field(default=None, max_digits=3, decimal_places=2)
+    # GPA stored as hundredths in a SMALLINT (3.75 -> 375); `gpa` is the API view
+    gpa_x100: int | None = Field(default=None, sa_column=Column(SmallInteger))
     achievements: list[str] = Field(
-        default_factory=list, sa_column=Column(ARRAY(String), server_default="{}")
+        default_factory=list,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'[]'::jsonb")),
     )
     relevant_coursework: list[str] = Field(
-        default_factory=list, sa_column=Column(ARRAY(String), server_default="{}")
+        default_factory=list,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'[]'::jsonb")),
     )
     display_order: int = Field(default=0, nullable=False)
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
-    )
-    updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    updated_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
         sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
 
+    @computed_field
+    @property
+    def gpa(self) -> float | None:
+        """GPA as a two-place value."""
+        if self.gpa_x100 is None:
+            return None
+        return self.gpa_x100 / 100
 
-class ResumeSkill(SQLModel, table=True):
+    @gpa.setter
+    def gpa(self, value: float | None) -> None:
+        self.gpa_x100 = None if value is None else round(value * 100)
+
+    resume: Resume | None = Relationship(
+        back_populates="education", sa_relationship_kwargs=_resume_join("ResumeEducation")
+    )
+
+
+class ResumeSkill(PackedFieldsModel, table=True):
     """Skills for resumes."""
 
     __tablename__ = "resume_skills"
     __table_args__ = (
         UniqueConstraint("resume_id", "skill_name", name="uq_resume_skill"),
-        Index("idx_skill_resume", "resume_id"),
-    )
-
-    id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+        Index("idx_skill_resume_order", "resume_id", "display_order"),
+    )
+
+    SCALED_FIELDS: ClassVar[dict[str, tuple[str, int]]] = {
+        "years_of_experience": ("years_of_experience_x10", 10)
+    }
+
+    # Columns written by bulk COPY, in table order (id and timestamps use server defaults)
+    COPY_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "resume_id",
+        "user_id",
+        "skill_name",
+        "skill_category",
+        "proficiency_level",
+        "years_of_experience_x10",
+        "is_primary",
+        "display_order",
+    )
+
+    id: UUID | None = Field(
+        default=None,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     resume_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), nullable=False, index=True)
     )
+    user_id: UUID = Field(sa_column=Column(PGUUID(as_uuid=True), nullable=False))
     skill_name: str = Field(max_length=100, nullable=False)
     skill_category: str | None = Field(default=None, max_length=50)
     proficiency_level: str | None = Field(default=None, max_length=20)
-    years_of_experience: Decimal | None = Field(
-        default=None, max_digits=4, decimal_places=1
+    # Tenths of a year in a SMALLINT (2.5 -> 25); `years_of_experience` is the API view
+    years_of_experience_x10: int | None = Field(
+        default=None, sa_column=Column(SmallInteger)
     )
     is_primary: bool = Field(default=False)
     display_order: int = Field(default=0, nullable=False)
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+    )
+
+    @computed_field
+    @property
+    def years_of_experience(self) -> float | None:
+        """Years of experience to one decimal place."""
+        if self.years_of_experience_x10 is None:
+            return None
+        return self.years_of_experience_x10 / 10
+
+    @years_of_experience.setter
+    def years_of_experience(self, value: float | None) -> None:
+        self.years_of_experience_x10 = None if value is None else round(value * 10)
+
+    resume: Resume | None = Relationship(
+        back_populates="skills", sa_relationship_kwargs=_resume_join("ResumeSkill")
     )
 
 
@@ -191,15 +512,33 @@ class ResumeCertification(SQLModel, table=True):
     """Certifications for resumes."""
 
     __tablename__ = "resume_certifications"
-    __table_args__ = (Index("idx_cert_resume", "resume_id"),)
-
-    id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+    __table_args__ = (Index("idx_cert_resume_order", "resume_id", "display_order"),)
+
+    # Columns written by bulk COPY, in table order (id and timestamps use server defaults)
+    COPY_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "resume_id",
+        "user_id",
+        "certification_name",
+        "issuing_organization",
+        "issue_date",
+        "expiry_date",
+        "credential_id",
+        "credential_url",
+        "display_order",
+    )
+
+    id: UUID | None = Field(
+        default=None,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     resume_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), nullable=False, index=True)
     )
+    user_id: UUID = Field(sa_column=Column(PGUUID(as_uuid=True), nullable=False))
     certification_name: str = Field(max_length=200, nullable=False)
     issuing_organization: str | None = Field(default=None, max_length=200)
     issue_date: date | None = Field(default=None)
@@ -207,8 +546,15 @@ class ResumeCertification(SQLModel, table=True):
     credential_id: str | None = Field(default=None, max_length=100)
     credential_url: str | None = Field(default=None, max_length=500)
     display_order: int = Field(default=0, nullable=False)
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+    )
+
+    resume: Resume | None = Relationship(
+        back_populates="certifications", sa_relationship_kwargs=_resume_join("ResumeCertification")
     )
 
 
@@ -216,59 +562,137 @@ class ResumeProject(SQLModel, table=True):
     """Projects for resumes."""
 
     __tablename__ = "resume_projects"
-    __table_args__ = (Index("idx_proj_resume", "resume_id"),)
+    __table_args__ = (
+        _text_length_check("description", "resume_projects"),
+        Index("idx_proj_resume_order", "resume_id", "display_order"),
+        Index(
+            "idx_proj_technologies_gin",
+            text("technologies_used jsonb_path_ops"),
+            postgresql_using="gin",
+        ),
+    )
 
-    id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+    # Columns written by bulk COPY, in table order (id and timestamps use server defaults)
+    COPY_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "resume_id",
+        "user_id",
+        "project_name",
+        "role",
+        "description",
+        "technologies_used",
+        "project_url",
+        "start_date",
+        "end_date",
+        "is_current",
+        "achievements",
+        "display_order",
+    )
+
+    id: UUID | None = Field(
+        default=None,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     resume_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), nullable=False, index=True)
     )
+    user_id: UUID = Field(sa_column=Column(PGUUID(as_uuid=True), nullable=False))
     project_name: str = Field(max_length=200, nullable=False)
     role: str | None = Field(default=None, max_length=100)
     description: str | None = Field(default=None, sa_column=Column(Text))
     technologies_used: list[str] = Field(
-        default_factory=list, sa_column=Column(ARRAY(String), server_default="{}")
+        default_factory=list,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'[]'::jsonb")),
     )
     project_url: str | None = Field(default=None, max_length=500)
     start_date: date | None = Field(default=None)
     end_date: date | None = Field(default=None)
     is_current: bool = Field(default=False)
     achievements: list[str] = Field(
-        default_factory=list, sa_column=Column(ARRAY(String), server_default="{}")
+        default_factory=list,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'[]'::jsonb")),
     )
     display_order: int = Field(default=0, nullable=False)
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
-    )
-    updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    updated_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
         sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
 
+    resume: Resume | None = Relationship(
+        back_populates="projects", sa_relationship_kwargs=_resume_join("ResumeProject")
+    )
+
 
 class ResumeCustomSection(SQLModel, table=True):
     """Custom sections for resumes."""
 
     __tablename__ = "resume_custom_sections"
-    __table_args__ = (Index("idx_custom_resume", "resume_id"),)
-
-    id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+    __table_args__ = (Index("idx_custom_resume_order", "resume_id", "display_order"),)
+
+    # Columns written by bulk COPY, in table order (id and timestamps use server defaults)
+    COPY_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "resume_id",
+        "user_id",
+        "section_title",
+        "section_type",
+        "content",
+        "display_order",
+    )
+
+    id: UUID | None = Field(
+        default=None,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
     resume_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), nullable=False, index=True)
     )
+    user_id: UUID = Field(sa_column=Column(PGUUID(as_uuid=True), nullable=False))
     section_title: str = Field(max_length=100, nullable=False)
     section_type: str | None = Field(default=None, max_length=50)
     content: dict = Field(sa_column=Column(JSONB, nullable=False))
     display_order: int = Field(default=0, nullable=False)
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
-    )
-    updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    updated_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
         sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
+
+    resume: Resume | None = Relationship(
+        back_populates="custom_sections",
+        sa_relationship_kwargs=_resume_join("ResumeCustomSection"),
+    )
+
+
+# Eager-load plan for a resume with every section: one SELECT ... IN per
+# child table, and anything else accessed lazily raises instead of querying
+RESUME_FULL_LOAD = (
+    selectinload(Resume.experiences),
+    selectinload(Resume.education),
+    selectinload(Resume.skills),
+    selectinload(Resume.certifications),
+    selectinload(Resume.projects),
+    selectinload(Resume.custom_sections),
+    raiseload("*"),
+)
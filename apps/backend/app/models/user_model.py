@@ -3,23 +3,40 @@ User model for database operations.
 """
 
 from datetime import datetime, timezone
-from decimal import Decimal
-from uuid import UUID, uuid4
+from typing import ClassVar
+from uuid import UUID
 
-from pydantic import EmailStr
-from sqlalchemy import ARRAY, String, UniqueConstraint, func
+from pydantic import computed_field
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    Index,
+    SmallInteger,
+    UniqueConstraint,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlmodel import Column, Field, SQLModel
 
+from app.core.ids import uuid7
+from app.models.packed import PackedFieldsModel
 
-class UserBase(SQLModel):
+__all__ = ["UserBase", "User", "UserOnboardingProgress"]
+
+
+class UserBase(PackedFieldsModel):
     """Base user model with shared fields."""
 
+    SCALED_FIELDS: ClassVar[dict[str, tuple[str, int]]] = {
+        "years_of_experience": ("years_of_experience_x10", 10)
+    }
+
     supabase_user_id: UUID = Field(
         sa_column=Column(PGUUID(as_uuid=True), unique=True, nullable=False, index=True)
     )
-    email: EmailStr = Field(max_length=255, index=True, nullable=False)
+    email: str = Field(max_length=255, index=True, nullable=False)
     full_name: str | None = Field(default=None, max_length=200)
     phone: str | None = Field(default=None, max_length=30)
     location: str | None = Field(default=None, max_length=255)
@@ -28,20 +45,33 @@ class UserBase(SQLModel):
     portfolio_url: str | None = Field(default=None, max_length=255)
     preferred_roles: list[str] = Field(
         default_factory=list,
-        sa_column=Column(ARRAY(String), nullable=True, server_default="{}"),
+        sa_column=Column(JSONB, nullable=True, server_default=text("'[]'::jsonb")),
     )
     preferred_locations: list[str] = Field(
         default_factory=list,
-        sa_column=Column(ARRAY(String), nullable=True, server_default="{}"),
+        sa_column=Column(JSONB, nullable=True, server_default=text("'[]'::jsonb")),
     )
     preferred_salary_min: int | None = Field(default=None, ge=0)
     preferred_salary_max: int | None = Field(default=None, ge=0)
-    years_of_experience: Decimal | None = Field(
-        default=None, max_digits=4, decimal_places=1
+    # Tenths of a year in a SMALLINT (2.5 -> 25); `years_of_experience` is the API view
+    years_of_experience_x10: int | None = Field(
+        default=None, sa_column=Column(SmallInteger)
     )
     has_completed_onboarding: bool = Field(default=False)
     is_active: bool = Field(default=True)
 
+    @computed_field
+    @property
+    def years_of_experience(self) -> float | None:
+        """Years of experience to one decimal place."""
+        if self.years_of_experience_x10 is None:
+            return None
+        return self.years_of_experience_x10 / 10
+
+    @years_of_experience.setter
+    def years_of_experience(self, value: float | None) -> None:
+        self.years_of_experience_x10 = None if value is None else round(value * 10)
+
 
 class User(UserBase, table=True):
     """User table model."""
@@ -50,17 +80,39 @@ class User(UserBase, table=True):
     __table_args__ = (
         UniqueConstraint("supabase_user_id", name="uq_users_supabase_user_id"),
         UniqueConstraint("email", name="uq_users_email"),
+        CheckConstraint(
+            "email ~* '^[^@\\s]+@[^@\\s]+\\.[^@\\s]+$'", name="ck_users_email_format"
+        ),
+        Index(
+            "idx_users_preferred_roles_gin",
+            text("preferred_roles jsonb_path_ops"),
+            postgresql_using="gin",
+        ),
+        Index(
+            "idx_users_preferred_locations_gin",
+            text("preferred_locations jsonb_path_ops"),
+            postgresql_using="gin",
+        ),
     )
 
     id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4),
+        default_factory=uuid7,
+        sa_column=Column(
+            PGUUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
     )
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()}
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
     )
-    updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+    updated_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
         sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
     last_login_at: datetime | None = Field(default=None)
@@ -76,7 +128,9 @@ class UserOnboardingProgress(SQLModel, table=True):
     data: dict = Field(
         sa_column=Column("data", JSONB, nullable=False)
     )  # JSONB in PostgreSQL
-    updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+    updated_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
         sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
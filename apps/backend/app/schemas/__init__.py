@@ -1,143 +1,127 @@
 """
 Schema exports for the Optihire application.
-"""
-
-# Common enums
-# Analysis schemas
-from app.schemas.analysis_schema import (
-    AnalysisResultCreate,
-    AnalysisResultRead,
-    IndustryKeywordCreate,
-    IndustryKeywordRead,
-    IndustryKeywordUpdate,
-    JobDescriptionCreate,
-    JobDescriptionRead,
-    SkillCorrectionCreate,
-    SkillCorrectionRead,
-    SuggestionCreate,
-    SuggestionInteractionCreate,
-    SuggestionInteractionRead,
-    SuggestionRead,
-    SuggestionUpdate,
-)
 
-# Application schemas
-from app.schemas.application_schema import (
-    ApplicationActivityCreate,
-    ApplicationActivityRead,
-    ApplicationContactCreate,
-    ApplicationContactRead,
-    ApplicationContactUpdate,
-    JobApplicationCreate,
-    JobApplicationRead,
-    JobApplicationUpdate,
-)
-from app.schemas.common_schema import (
-    ActivityType,
-    ApplicationStatus,
-    ExperienceLevel,
-    FeedbackType,
-    IdempotencyStatus,
-    ImpactLevel,
-    JobType,
-    ParseStatus,
-    ProjectStatus,
-    RemoteType,
-    StorageBackend,
-    SuggestionState,
-)
-
-# Content schemas
-from app.schemas.content_schema import (
-    CoverLetterCreate,
-    CoverLetterRead,
-    CoverLetterUpdate,
-    InterviewQuestionCreate,
-    InterviewQuestionRead,
-    SuggestedProjectCreate,
-    SuggestedProjectRead,
-    SuggestedProjectUpdate,
-    UserSuggestedProjectCreate,
-    UserSuggestedProjectRead,
-    UserSuggestedProjectUpdate,
-)
-
-# File schemas
-from app.schemas.file_schema import (
-    ParseTaskCreate,
-    ParseTaskRead,
-    ParseTaskUpdate,
-    UploadedFileCreate,
-    UploadedFileRead,
-    UploadedFileUpdate,
-)
-
-# Job schemas
-from app.schemas.job_schema import (
-    JobListingCreate,
-    JobListingRead,
-    JobListingUpdate,
-    JobMatchCreate,
-    JobMatchRead,
-    JobMatchUpdate,
-    UserJobFeedbackCreate,
-    UserJobFeedbackRead,
-)
-
-# Resume schemas
-from app.schemas.resume_schema import (
-    CertificationCreate,
-    CertificationRead,
-    CertificationUpdate,
-    CustomSectionCreate,
-    CustomSectionRead,
-    CustomSectionUpdate,
-    EducationCreate,
-    EducationRead,
-    EducationUpdate,
-    ExperienceCreate,
-    ExperienceRead,
-    ExperienceUpdate,
-    ProjectCreate,
-    ProjectRead,
-    ProjectUpdate,
-    ResumeComplete,
-    ResumeCreate,
-    ResumeRead,
-    ResumeTemplateRead,
-    ResumeUpdate,
-    SkillCreate,
-    SkillRead,
-    SkillUpdate,
-)
+Submodules are imported lazily (PEP 562): a name is resolved on first
+access, so importing one schema does not build every Pydantic model.
+"""
 
-# System schemas
-from app.schemas.system_schema import (
-    AuditLogCreate,
-    AuditLogRead,
-    FeatureFlagCreate,
-    FeatureFlagRead,
-    FeatureFlagUpdate,
-    IdempotencyKeyCreate,
-    IdempotencyKeyRead,
-    IdempotencyKeyUpdate,
-    SystemConfigCreate,
-    SystemConfigRead,
-    SystemConfigUpdate,
-    SystemHealthCheckCreate,
-    SystemHealthCheckRead,
-    TelemetryEventCreate,
-    TelemetryEventRead,
-)
+import importlib
 
-# User schemas
-from app.schemas.user_schema import (
-    OnboardingProgressCreate,
-    OnboardingProgressRead,
-    UserCreate,
-    UserRead,
-    UserUpdate,
-)
+# Exported name -> defining submodule
+_LAZY: dict[str, str] = {
+    # analysis_schema
+    "AnalysisResultCreate": "app.schemas.analysis_schema",
+    "AnalysisResultRead": "app.schemas.analysis_schema",
+    "IndustryKeywordCreate": "app.schemas.analysis_schema",
+    "IndustryKeywordRead": "app.schemas.analysis_schema",
+    "IndustryKeywordUpdate": "app.schemas.analysis_schema",
+    "JobDescriptionCreate": "app.schemas.analysis_schema",
+    "JobDescriptionRead": "app.schemas.analysis_schema",
+    "SkillCorrectionCreate": "app.schemas.analysis_schema",
+    "SkillCorrectionRead": "app.schemas.analysis_schema",
+    "SuggestionCreate": "app.schemas.analysis_schema",
+    "SuggestionInteractionCreate": "app.schemas.analysis_schema",
+    "SuggestionInteractionRead": "app.schemas.analysis_schema",
+    "SuggestionRead": "app.schemas.analysis_schema",
+    "SuggestionUpdate": "app.schemas.analysis_schema",
+    # application_schema
+    "ApplicationActivityCreate": "app.schemas.application_schema",
+    "ApplicationActivityRead": "app.schemas.application_schema",
+    "ApplicationContactCreate": "app.schemas.application_schema",
+    "ApplicationContactRead": "app.schemas.application_schema",
+    "ApplicationContactUpdate": "app.schemas.application_schema",
+    "JobApplicationCreate": "app.schemas.application_schema",
+    "JobApplicationRead": "app.schemas.application_schema",
+    "JobApplicationUpdate": "app.schemas.application_schema",
+    # common_schema
+    "ActivityType": "app.schemas.common_schema",
+    "ApplicationStatus": "app.schemas.common_schema",
+    "ExperienceLevel": "app.schemas.common_schema",
+    "FeedbackType": "app.schemas.common_schema",
+    "IdempotencyStatus": "app.schemas.common_schema",
+    "ImpactLevel": "app.schemas.common_schema",
+    "JobType": "app.schemas.common_schema",
+    "ParseStatus": "app.schemas.common_schema",
+    "ProjectStatus": "app.schemas.common_schema",
+    "RemoteType": "app.schemas.common_schema",
+    "StorageBackend": "app.schemas.common_schema",
+    "SuggestionState": "app.schemas.common_schema",
+    # content_schema
+    "CoverLetterCreate": "app.schemas.content_schema",
+    "CoverLetterRead": "app.schemas.content_schema",
+    "CoverLetterUpdate": "app.schemas.content_schema",
+    "InterviewQuestionCreate": "app.schemas.content_schema",
+    "InterviewQuestionRead": "app.schemas.content_schema",
+    "SuggestedProjectCreate": "app.schemas.content_schema",
+    "SuggestedProjectRead": "app.schemas.content_schema",
+    "SuggestedProjectUpdate": "app.schemas.content_schema",
+    "UserSuggestedProjectCreate": "app.schemas.content_schema",
+    "UserSuggestedProjectRead": "app.schemas.content_schema",
+    "UserSuggestedProjectUpdate": "app.schemas.content_schema",
+    # file_schema
+    "ParseTaskCreate": "app.schemas.file_schema",
+    "ParseTaskRead": "app.schemas.file_schema",
+    "ParseTaskUpdate": "app.schemas.file_schema",
+    "UploadedFileCreate": "app.schemas.file_schema",
+    "UploadedFileRead": "app.schemas.file_schema",
+    "UploadedFileUpdate": "app.schemas.file_schema",
+    # job_schema
+    "JobListingCreate": "app.schemas.job_schema",
+    "JobListingRead": "app.schemas.job_schema",
+    "JobListingUpdate": "app.schemas.job_schema",
+    "JobMatchCreate": "app.schemas.job_schema",
+    "JobMatchRead": "app.schemas.job_schema",
+    "JobMatchUpdate": "app.schemas.job_schema",
+    "UserJobFeedbackCreate": "app.schemas.job_schema",
+    "UserJobFeedbackRead": "app.schemas.job_schema",
+    # resume_schema
+    "CertificationCreate": "app.schemas.resume_schema",
+    "CertificationRead": "app.schemas.resume_schema",
+    "CertificationUpdate": "app.schemas.resume_schema",
+    "CustomSectionCreate": "app.schemas.resume_schema",
+    "CustomSectionRead": "app.schemas.resume_schema",
+    "CustomSectionUpdate": "app.schemas.resume_schema",
+    "EducationCreate": "app.schemas.resume_schema",
+    "EducationRead": "app.schemas.resume_schema",
+    "EducationUpdate": "app.schemas.resume_schema",
+    "ExperienceCreate": "app.schemas.resume_schema",
+    "ExperienceRead": "app.schemas.resume_schema",
+    "ExperienceUpdate": "app.schemas.resume_schema",
+    "ProjectCreate": "app.schemas.resume_schema",
+    "ProjectRead": "app.schemas.resume_schema",
+    "ProjectUpdate": "app.schemas.resume_schema",
+    "ResumeComplete": "app.schemas.resume_schema",
+    "ResumeCreate": "app.schemas.resume_schema",
+    "ResumeParseStatusResponse": "app.schemas.resume_schema",
+    "ResumeRead": "app.schemas.resume_schema",
+    "ResumeTemplateRead": "app.schemas.resume_schema",
+    "ResumeUpdate": "app.schemas.resume_schema",
+    "SkillCreate": "app.schemas.resume_schema",
+    "SkillRead": "app.schemas.resume_schema",
+    "SkillUpdate": "app.schemas.resume_schema",
+    # system_schema
+    "AuditLogCreate": "app.schemas.system_schema",
+    "AuditLogRead": "app.schemas.system_schema",
+    "FeatureFlagCreate": "app.schemas.system_schema",
+    "FeatureFlagRead": "app.schemas.system_schema",
+    "FeatureFlagUpdate": "app.schemas.system_schema",
+    "IdempotencyKeyCreate": "app.schemas.system_schema",
+    "IdempotencyKeyRead": "app.schemas.system_schema",
+    "IdempotencyKeyUpdate": "app.schemas.system_schema",
+    "SystemConfigCreate": "app.schemas.system_schema",
+    "SystemConfigRead": "app.schemas.system_schema",
+    "SystemConfigUpdate": "app.schemas.system_schema",
+    "SystemHealthCheckCreate": "app.schemas.system_schema",
+    "SystemHealthCheckRead": "app.schemas.system_schema",
+    "TelemetryEventCreate": "app.schemas.system_schema",
+    "TelemetryEventRead": "app.schemas.system_schema",
+    # user_schema
+    "OnboardingProgressCreate": "app.schemas.user_schema",
+    "OnboardingProgressRead": "app.schemas.user_schema",
+    "UserCreate": "app.schemas.user_schema",
+    "UserRead": "app.schemas.user_schema",
+    "UserUpdate": "app.schemas.user_schema",
+}
 
 __all__ = [
     # Common enums
@@ -172,6 +156,7 @@ __all__ = [
     "ResumeUpdate",
     "ResumeRead",
     "ResumeComplete",
+    "ResumeParseStatusResponse",
     "ExperienceCreate",
     "ExperienceUpdate",
     "ExperienceRead",
@@ -252,3 +237,43 @@ __all__ = [
     "TelemetryEventCreate",
     "TelemetryEventRead",
 ]
+
+
+# Deferred models that routes validate or construct directly; built by warmup()
+_ROUTE_MODELS = (
+    "ResumeRead",
+    "ResumeComplete",
+    "ResumeParseStatusResponse",
+    "ExperienceRead",
+    "EducationRead",
+    "SkillRead",
+    "CertificationRead",
+    "ProjectRead",
+    "CustomSectionRead",
+    "UserRead",
+)
+
+
+def warmup() -> None:
+    """
+    Build the deferred validators of the schemas routes use, so the first
+    request of each type doesn't pay the build. Schemas no route uses stay
+    unbuilt.
+    """
+    for name in _ROUTE_MODELS:
+        __getattr__(name).model_rebuild()
+
+
+def __getattr__(name: str):
+    """Import the submodule defining `name` on first access."""
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
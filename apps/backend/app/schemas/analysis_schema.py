@@ -3,28 +3,43 @@ Schemas for ATS analysis, suggestions, and job descriptions.
 """
 
 from datetime import datetime
-from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
-
-from app.schemas.common_schema import ImpactLevel, SuggestionState
+from pydantic import Field
+
+from app.schemas.common_schema import (
+    READ_CONFIG,
+    DeferredModel,
+    FastRead,
+    ImpactLevel,
+    ImpactLevelLiteral,
+    JsonObject,
+    StoredJsonObject,
+    Str20,
+    Str50,
+    Str64,
+    Str100,
+    Str200,
+    Str300,
+    SuggestionState,
+    SuggestionStateLiteral,
+)
 
 # ===== JOB DESCRIPTIONS =====
 
 
-class JobDescriptionCreate(BaseModel):
+class JobDescriptionCreate(DeferredModel):
     """Create a new job description."""
 
     user_id: UUID
-    job_title: str = Field(..., max_length=200)
-    company_name: str | None = Field(None, max_length=200)
+    job_title: Str200
+    company_name: Str200 | None = None
     description: str
-    snippet: str | None = Field(None, max_length=300)
+    snippet: Str300 | None = None
     requirements: str | None = None
 
 
-class JobDescriptionRead(BaseModel):
+class JobDescriptionRead(FastRead):
     """Read job description data."""
 
     id: UUID
@@ -34,30 +49,30 @@ class JobDescriptionRead(BaseModel):
     description: str
     snippet: str | None
     requirements: str | None
-    extracted_keywords: list[str]
+    extracted_keywords: tuple[str, ...]
     jd_hash: str | None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== ANALYSIS RESULTS =====
 
 
-class AnalysisResultCreate(BaseModel):
+class AnalysisResultCreate(DeferredModel):
     """Create a new analysis result."""
 
     resume_id: UUID
     job_description_id: UUID | None = None
-    resume_content_hash: str | None = Field(None, max_length=64)
-    job_description_hash: str | None = Field(None, max_length=64)
+    resume_content_hash: Str64 | None = None
+    job_description_hash: Str64 | None = None
     overall_score: int = Field(..., ge=0, le=100)
     keyword_score: int = Field(..., ge=0, le=100)
     formatting_score: int = Field(..., ge=0, le=100)
     section_score: int = Field(..., ge=0, le=100)
-    matched_keywords: list[str] = Field(default_factory=list)
-    missing_keywords: list[str] = Field(default_factory=list)
-    keyword_density: Decimal | None = None
+    matched_keywords: list[str] = Field(default_factory=list, max_length=256)
+    missing_keywords: list[str] = Field(default_factory=list, max_length=256)
+    keyword_density: float | None = Field(None, ge=0)
     has_contact_info: bool = False
     has_summary: bool = False
     has_experience: bool = False
@@ -67,13 +82,13 @@ class AnalysisResultCreate(BaseModel):
     has_bullet_points: bool = False
     has_action_verbs: bool = False
     is_scannable: bool = False
-    suggestions_payload: dict | None = None
-    skills_version: str | None = Field(None, max_length=20)
-    keywords_rules_version: str | None = Field(None, max_length=20)
-    analysis_version: str = Field(default="1.0", max_length=20)
+    suggestions_payload: JsonObject | None = None
+    skills_version: Str20 | None = None
+    keywords_rules_version: Str20 | None = None
+    analysis_version: Str20 = "1.0"
 
 
-class AnalysisResultRead(BaseModel):
+class AnalysisResultRead(FastRead):
     """Read analysis result data."""
 
     id: UUID
@@ -85,9 +100,10 @@ class AnalysisResultRead(BaseModel):
     keyword_score: int
     formatting_score: int
     section_score: int
-    matched_keywords: list[str]
-    missing_keywords: list[str]
-    keyword_density: Decimal | None
+    # Read-only: tuples skip building mutable lists on every read
+    matched_keywords: tuple[str, ...]
+    missing_keywords: tuple[str, ...]
+    keyword_density: float | None
     has_contact_info: bool
     has_summary: bool
     has_experience: bool
@@ -97,37 +113,37 @@ class AnalysisResultRead(BaseModel):
     has_bullet_points: bool
     has_action_verbs: bool
     is_scannable: bool
-    suggestions_payload: dict | None
+    suggestions_payload: StoredJsonObject | None
     skills_version: str | None
     keywords_rules_version: str | None
     analysis_version: str
     analyzed_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== SUGGESTIONS =====
 
 
-class SuggestionCreate(BaseModel):
+class SuggestionCreate(DeferredModel):
     """Create a new suggestion."""
 
     analysis_id: UUID
-    rule_id: str = Field(..., max_length=100)
+    rule_id: Str100
     suggestion_text: str
-    impact_level: ImpactLevel
-    rules_version: str = Field(..., max_length=20)
-    context: dict | None = None
+    impact_level: ImpactLevelLiteral
+    rules_version: Str20
+    context: JsonObject | None = None
 
 
-class SuggestionUpdate(BaseModel):
+class SuggestionUpdate(DeferredModel):
     """Update a suggestion."""
 
-    state: SuggestionState | None = None
+    state: SuggestionStateLiteral | None = None
     resolved_at: datetime | None = None
 
 
-class SuggestionRead(BaseModel):
+class SuggestionRead(FastRead):
     """Read suggestion data."""
 
     id: UUID
@@ -137,52 +153,52 @@ class SuggestionRead(BaseModel):
     impact_level: ImpactLevel
     state: SuggestionState
     rules_version: str
-    context: dict | None
+    context: StoredJsonObject | None
     created_at: datetime
     resolved_at: datetime | None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== SUGGESTION INTERACTIONS =====
 
 
-class SuggestionInteractionCreate(BaseModel):
+class SuggestionInteractionCreate(DeferredModel):
     """Create a new suggestion interaction."""
 
     suggestion_id: UUID
     user_id: UUID
-    action: str = Field(..., max_length=20)
-    details: dict | None = None
+    action: Str20
+    details: JsonObject | None = None
 
 
-class SuggestionInteractionRead(BaseModel):
+class SuggestionInteractionRead(FastRead):
     """Read suggestion interaction data."""
 
     id: UUID
     suggestion_id: UUID
     user_id: UUID
     action: str
-    details: dict | None
+    details: StoredJsonObject | None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== SKILL CORRECTIONS =====
 
 
-class SkillCorrectionCreate(BaseModel):
+class SkillCorrectionCreate(DeferredModel):
     """Create a new skill correction."""
 
     user_id: UUID
     resume_id: UUID
-    skill: str = Field(..., max_length=100)
-    action: str = Field(..., max_length=20)
-    source: str = Field(default="user", max_length=20)
+    skill: Str100
+    action: Str20
+    source: Str20 = "user"
 
 
-class SkillCorrectionRead(BaseModel):
+class SkillCorrectionRead(FastRead):
     """Read skill correction data."""
 
     id: UUID
@@ -193,32 +209,32 @@ class SkillCorrectionRead(BaseModel):
     source: str
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== INDUSTRY KEYWORDS =====
 
 
-class IndustryKeywordCreate(BaseModel):
+class IndustryKeywordCreate(DeferredModel):
     """Create a new industry keyword."""
 
-    industry: str = Field(..., max_length=100)
-    job_category: str | None = Field(None, max_length=100)
-    keyword: str = Field(..., max_length=100)
-    keyword_type: str | None = Field(None, max_length=50)
+    industry: Str100
+    job_category: Str100 | None = None
+    keyword: Str100
+    keyword_type: Str50 | None = None
     importance_score: int = Field(default=50, ge=0, le=100)
     is_trending: bool = False
-    rules_version: str = Field(default="v1", max_length=20)
+    rules_version: Str20 = "v1"
 
 
-class IndustryKeywordUpdate(BaseModel):
+class IndustryKeywordUpdate(DeferredModel):
     """Update an industry keyword."""
 
     importance_score: int | None = Field(None, ge=0, le=100)
     is_trending: bool | None = None
 
 
-class IndustryKeywordRead(BaseModel):
+class IndustryKeywordRead(FastRead):
     """Read industry keyword data."""
 
     id: UUID
@@ -232,4 +248,4 @@ class IndustryKeywordRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
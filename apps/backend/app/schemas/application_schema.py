@@ -3,44 +3,68 @@ Schemas for job application tracking.
 """
 
 from datetime import date, datetime
+from typing import Annotated, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
-
-from app.schemas.common_schema import ActivityType, ApplicationStatus
+from pydantic import ConfigDict, Field, TypeAdapter
+
+from app.schemas.common_schema import (
+    READ_CONFIG,
+    ActivityTypeLiteral,
+    ApplicationStatus,
+    ApplicationStatusLiteral,
+    DeferredModel,
+    Email,
+    FastRead,
+    SoftDeletedRead,
+    Str30,
+    Str50,
+    Str100,
+    Str200,
+    Str255,
+    Str500,
+)
 
 # ===== JOB APPLICATIONS =====
 
 
-class JobApplicationCreate(BaseModel):
+class InterviewSlot(DeferredModel):
+    """One scheduled interview on a job application."""
+
+    when: datetime
+    kind: Str50
+    notes: str | None = None
+
+
+class JobApplicationCreate(DeferredModel):
     """Create a new job application."""
 
     user_id: UUID
     resume_id: UUID | None = None
     job_listing_id: UUID | None = None
-    company_name: str = Field(..., max_length=200)
-    job_title: str = Field(..., max_length=200)
-    job_location: str | None = Field(None, max_length=255)
-    job_url: str | None = Field(None, max_length=500)
-    salary_range: str | None = Field(None, max_length=100)
-    status: ApplicationStatus = ApplicationStatus.APPLIED
+    company_name: Str200
+    job_title: Str200
+    job_location: Str255 | None = None
+    job_url: Str500 | None = None
+    salary_range: Str100 | None = None
     application_date: date
-    application_method: str | None = Field(None, max_length=50)
+    application_method: Str50 | None = None
     notes: str | None = None
     cover_letter_file_id: UUID | None = None
+    status: ApplicationStatusLiteral = ApplicationStatus.APPLIED.value
 
 
-class JobApplicationUpdate(BaseModel):
+class JobApplicationUpdate(DeferredModel):
     """Update a job application."""
 
     resume_id: UUID | None = None
-    status: ApplicationStatus | None = None
-    job_location: str | None = Field(None, max_length=255)
-    job_url: str | None = Field(None, max_length=500)
-    salary_range: str | None = Field(None, max_length=100)
+    status: ApplicationStatusLiteral | None = None
+    job_location: Str255 | None = None
+    job_url: Str500 | None = None
+    salary_range: Str100 | None = None
     last_follow_up_date: date | None = None
     next_follow_up_date: date | None = None
-    interview_dates: dict | None = None
+    interview_dates: list[InterviewSlot] | None = Field(None, max_length=50)
     notes: str | None = None
     rejection_date: date | None = None
     rejection_reason: str | None = None
@@ -49,7 +73,7 @@ class JobApplicationUpdate(BaseModel):
     offer_accepted: bool | None = None
 
 
-class JobApplicationRead(BaseModel):
+class JobApplicationRead(SoftDeletedRead):
     """Read job application data."""
 
     id: UUID
@@ -66,7 +90,7 @@ class JobApplicationRead(BaseModel):
     application_method: str | None
     last_follow_up_date: date | None
     next_follow_up_date: date | None
-    interview_dates: dict | None
+    interview_dates: list[InterviewSlot] | None
     notes: str | None
     cover_letter_file_id: UUID | None
     rejection_date: date | None
@@ -74,74 +98,94 @@ class JobApplicationRead(BaseModel):
     offer_date: date | None
     offer_amount: int | None
     offer_accepted: bool | None
-    created_at: datetime
-    updated_at: datetime
-    deleted_at: datetime | None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
+
+
+class JobApplicationBulkCreate(JobApplicationCreate):
+    """New job application within a bulk write."""
+
+    op: Literal["create"] = "create"
+
+
+class JobApplicationBulkUpdate(JobApplicationUpdate):
+    """Update of an existing job application within a bulk write."""
+
+    op: Literal["update"] = "update"
+    id: UUID
+
+
+# One item of a bulk write, dispatched on "op" by pydantic-core's tagged union
+JobApplicationWrite = Annotated[
+    JobApplicationBulkCreate | JobApplicationBulkUpdate, Field(discriminator="op")
+]
+
+# Validates a whole bulk payload in one call; deferred like the models
+JobApplicationWriteListAdapter = TypeAdapter(
+    list[JobApplicationWrite], config=ConfigDict(defer_build=True)
+)
 
 
 # ===== APPLICATION CONTACTS =====
 
 
-class ApplicationContactCreate(BaseModel):
+class ApplicationContactCreate(DeferredModel):
     """Create a new application contact."""
 
     application_id: UUID
-    contact_name: str = Field(..., max_length=200)
-    contact_title: str | None = Field(None, max_length=200)
-    contact_email: EmailStr | None = None
-    contact_phone: str | None = Field(None, max_length=30)
-    contact_linkedin: str | None = Field(None, max_length=255)
+    contact_name: Str200
+    contact_title: Str200 | None = None
+    contact_email: Email | None = None
+    contact_phone: Str30 | None = None
+    contact_linkedin: Str255 | None = None
     is_primary: bool = False
     notes: str | None = None
 
 
-class ApplicationContactUpdate(BaseModel):
+class ApplicationContactUpdate(DeferredModel):
     """Update an application contact."""
 
-    contact_name: str | None = Field(None, max_length=200)
-    contact_title: str | None = Field(None, max_length=200)
-    contact_email: EmailStr | None = None
-    contact_phone: str | None = Field(None, max_length=30)
-    contact_linkedin: str | None = Field(None, max_length=255)
+    contact_name: Str200 | None = None
+    contact_title: Str200 | None = None
+    contact_email: Email | None = None
+    contact_phone: Str30 | None = None
+    contact_linkedin: Str255 | None = None
     is_primary: bool | None = None
     notes: str | None = None
 
 
-class ApplicationContactRead(BaseModel):
+class ApplicationContactRead(SoftDeletedRead):
     """Read application contact data."""
 
     id: UUID
     application_id: UUID
     contact_name: str
     contact_title: str | None
+    # Stored values are returned as-is, without re-validating the address
     contact_email: str | None
     contact_phone: str | None
     contact_linkedin: str | None
     is_primary: bool
     notes: str | None
-    created_at: datetime
-    updated_at: datetime
-    deleted_at: datetime | None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== APPLICATION ACTIVITIES =====
 
 
-class ApplicationActivityCreate(BaseModel):
+class ApplicationActivityCreate(DeferredModel):
     """Create a new application activity."""
 
     application_id: UUID
-    activity_type: ActivityType
+    activity_type: ActivityTypeLiteral
     activity_description: str | None = None
-    activity_date: datetime = Field(default_factory=datetime.now)
+    # Omitted dates are left to the database default (now()) on insert
+    activity_date: datetime | None = None
     created_by: UUID | None = None
 
 
-class ApplicationActivityRead(BaseModel):
+class ApplicationActivityRead(FastRead):
     """Read application activity data."""
 
     id: UUID
@@ -152,4 +196,4 @@ class ApplicationActivityRead(BaseModel):
     created_by: UUID | None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
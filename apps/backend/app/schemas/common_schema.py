@@ -2,7 +2,162 @@
 Common schemas and enums shared across the application.
 """
 
+from collections.abc import Callable
+from datetime import datetime
 from enum import Enum
+from typing import Annotated, Any, ClassVar, Final, Literal, get_args, get_origin
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    WithJsonSchema,
+)
+
+# Shared config for *Read response models: validators are built on first use
+# rather than at import, and read models are immutable once built. One
+# instance is shared by every Read class, so flip settings here only
+READ_CONFIG: Final = ConfigDict(
+    from_attributes=True, defer_build=True, extra="ignore", frozen=True
+)
+
+
+class DeferredModel(BaseModel):
+    """Schema base whose validator/serializer is built on first use, not at import."""
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class FastRead(BaseModel):
+    """
+    Read schema base that can be built from a trusted ORM row without validation.
+
+    The database already typed the column values, so from_orm_fast copies
+    fields by name into a new instance the way model_construct does. Fields
+    whose type differs from the ORM value (tuples, nested models) are
+    converted with a field-level adapter. Validate untrusted input as usual.
+    """
+
+    # Field names, cached per class so each call skips the model_fields dict
+    _field_names: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._field_names = tuple(cls.model_fields)
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any, **values: Any):
+        """
+        Build from a loaded ORM row, skipping validation.
+
+        Args:
+            obj: ORM instance with an attribute for every field not in values
+            **values: Field values to use instead of reading them from obj;
+                used as-is, so they must already have the field's type
+
+        Returns:
+            Model instance, equivalent to model_construct with every field set
+        """
+        construct = _FROM_ORM_CACHE.get(cls)
+        if construct is None:
+            construct = _FROM_ORM_CACHE[cls] = _build_from_orm(cls)
+        return construct(obj, values)
+
+
+# Per-class generated constructors, built on first use
+_FROM_ORM_CACHE: dict[type, Callable[[Any, dict[str, Any]], Any]] = {}
+
+# Container types an ORM column never returns (JSONB lists come back as list)
+_CONVERTED_ORIGINS = (tuple, frozenset)
+
+
+def _needs_conversion(annotation: Any) -> bool:
+    """Whether an ORM value can differ in type from a field with this annotation."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    if get_origin(annotation) in _CONVERTED_ORIGINS:
+        return True
+    return any(_needs_conversion(arg) for arg in get_args(annotation))
+
+
+def _build_from_orm(cls: type[FastRead]) -> Callable[[Any, dict[str, Any]], Any]:
+    """
+    Generate a straight-line constructor for one FastRead class.
+
+    Each field becomes a literal dict entry read by plain attribute access, so
+    building an instance does no per-field getattr/kwargs work. Fields that
+    need conversion validate only that attribute. The instance state set
+    here mirrors model_construct (no aliases, extras or post-init on Read
+    schemas).
+    """
+    namespace = {
+        "cls": cls,
+        "FIELDS": cls._field_names,
+        "_new": object.__new__,
+        "_set": object.__setattr__,
+    }
+    entries = []
+    for name, field in cls.model_fields.items():
+        read = f"obj.{name}"
+        if _needs_conversion(field.annotation):
+            namespace[f"_convert_{name}"] = TypeAdapter(field.annotation).validate_python
+            read = f"_convert_{name}({read}, from_attributes=True)"
+        entries.append(f"        {name!r}: values[{name!r}] if {name!r} in values else {read},\n")
+    source = (
+        "def _from_orm(obj, values):\n"
+        "    instance = _new(cls)\n"
+        "    _set(instance, '__dict__', {\n"
+        f"{''.join(entries)}"
+        "    })\n"
+        "    _set(instance, '__pydantic_fields_set__', set(FIELDS))\n"
+        "    _set(instance, '__pydantic_extra__', None)\n"
+        "    _set(instance, '__pydantic_private__', None)\n"
+        "    return instance\n"
+    )
+    exec(compile(source, f"<from_orm {cls.__name__}>", "exec"), namespace)
+    return namespace["_from_orm"]
+
+
+class TimestampedRead(DeferredModel, FastRead):
+    """created_at/updated_at shared by Read schemas of mutable rows."""
+
+    created_at: datetime
+    updated_at: datetime
+
+
+class SoftDeletedRead(TimestampedRead):
+    """Timestamps for Read schemas of soft-deleted rows."""
+
+    deleted_at: datetime | None
+
+
+# Length-capped strings, defined once and shared by every schema field using them
+Str20 = Annotated[str, StringConstraints(max_length=20)]
+Str30 = Annotated[str, StringConstraints(max_length=30)]
+Str50 = Annotated[str, StringConstraints(max_length=50)]
+Str64 = Annotated[str, StringConstraints(max_length=64)]
+Str100 = Annotated[str, StringConstraints(max_length=100)]
+Str128 = Annotated[str, StringConstraints(max_length=128)]
+Str200 = Annotated[str, StringConstraints(max_length=200)]
+Str255 = Annotated[str, StringConstraints(max_length=255)]
+Str300 = Annotated[str, StringConstraints(max_length=300)]
+Str500 = Annotated[str, StringConstraints(max_length=500)]
+Str16384 = Annotated[str, StringConstraints(max_length=16384)]
+
+# Plain-shape email check (same pattern as ck_users_email_format); avoids
+# EmailStr, which imports email-validator and dnspython when a schema is built
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+Email = Annotated[str, StringConstraints(pattern=EMAIL_PATTERN, max_length=320)]
+
+# Free-form JSON object from clients; the key cap bounds worst-case validation
+JsonObject = Annotated[dict[str, Any], Field(max_length=256)]
+
+# JSON object read back from a JSONB column: passed through as-is rather than
+# copied key by key, but still documented as an object
+StoredJsonObject = Annotated[Any, WithJsonSchema({"type": "object"})]
 
 
 class StorageBackend(str, Enum):
@@ -115,3 +270,24 @@ class IdempotencyStatus(str, Enum):
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
+
+
+def _values_literal(enum: type[Enum]) -> Any:
+    """Build a Literal over an enum's wire values."""
+    return Literal[tuple(member.value for member in enum)]
+
+
+# Literal twins of the enums for Create/Update fields: pydantic-core checks a
+# Literal with a set lookup instead of constructing the Enum member
+StorageBackendLiteral = _values_literal(StorageBackend)
+ParseStatusLiteral = _values_literal(ParseStatus)
+ImpactLevelLiteral = _values_literal(ImpactLevel)
+SuggestionStateLiteral = _values_literal(SuggestionState)
+ApplicationStatusLiteral = _values_literal(ApplicationStatus)
+ActivityTypeLiteral = _values_literal(ActivityType)
+RemoteTypeLiteral = _values_literal(RemoteType)
+ExperienceLevelLiteral = _values_literal(ExperienceLevel)
+JobTypeLiteral = _values_literal(JobType)
+FeedbackTypeLiteral = _values_literal(FeedbackType)
+ProjectStatusLiteral = _values_literal(ProjectStatus)
+IdempotencyStatusLiteral = _values_literal(IdempotencyStatus)
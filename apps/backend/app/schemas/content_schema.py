@@ -5,14 +5,35 @@ Schemas for content generation tools (cover letters, interview prep, project sug
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
-
-from app.schemas.common_schema import ProjectStatus
+from pydantic import Field
+
+from app.schemas.common_schema import (
+    READ_CONFIG,
+    DeferredModel,
+    FastRead,
+    ProjectStatus,
+    ProjectStatusLiteral,
+    TimestampedRead,
+)
+
+__all__ = [
+    "CoverLetterCreate",
+    "CoverLetterUpdate",
+    "CoverLetterRead",
+    "InterviewQuestionCreate",
+    "InterviewQuestionRead",
+    "SuggestedProjectCreate",
+    "SuggestedProjectUpdate",
+    "SuggestedProjectRead",
+    "UserSuggestedProjectCreate",
+    "UserSuggestedProjectUpdate",
+    "UserSuggestedProjectRead",
+]
 
 # ===== COVER LETTERS =====
 
 
-class CoverLetterCreate(BaseModel):
+class CoverLetterCreate(DeferredModel):
     """Create a new cover letter."""
 
     user_id: UUID
@@ -21,13 +42,13 @@ class CoverLetterCreate(BaseModel):
     generated_by: str = Field(default="ai", max_length=50)
 
 
-class CoverLetterUpdate(BaseModel):
+class CoverLetterUpdate(DeferredModel):
     """Update a cover letter."""
 
     content: str | None = None
 
 
-class CoverLetterRead(BaseModel):
+class CoverLetterRead(TimestampedRead):
     """Read cover letter data."""
 
     id: UUID
@@ -35,16 +56,14 @@ class CoverLetterRead(BaseModel):
     resume_id: UUID | None
     content: str
     generated_by: str
-    created_at: datetime
-    updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== INTERVIEW QUESTIONS =====
 
 
-class InterviewQuestionCreate(BaseModel):
+class InterviewQuestionCreate(DeferredModel):
     """Create new interview questions."""
 
     user_id: UUID
@@ -52,22 +71,22 @@ class InterviewQuestionCreate(BaseModel):
     questions: list[str]
 
 
-class InterviewQuestionRead(BaseModel):
+class InterviewQuestionRead(FastRead):
     """Read interview questions data."""
 
     id: UUID
     user_id: UUID
     job_title: str | None
-    questions: list[str]
+    questions: tuple[str, ...]
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== SUGGESTED PROJECTS =====
 
 
-class SuggestedProjectCreate(BaseModel):
+class SuggestedProjectCreate(DeferredModel):
     """Create a new suggested project."""
 
     title: str = Field(..., max_length=200)
@@ -79,7 +98,7 @@ class SuggestedProjectCreate(BaseModel):
     field: str | None = Field(None, max_length=50)
 
 
-class SuggestedProjectUpdate(BaseModel):
+class SuggestedProjectUpdate(DeferredModel):
     """Update a suggested project."""
 
     title: str | None = Field(None, max_length=200)
@@ -91,7 +110,7 @@ class SuggestedProjectUpdate(BaseModel):
     is_active: bool | None = None
 
 
-class SuggestedProjectRead(BaseModel):
+class SuggestedProjectRead(TimestampedRead):
     """Read suggested project data."""
 
     id: UUID
@@ -99,36 +118,34 @@ class SuggestedProjectRead(BaseModel):
     description: str | None
     difficulty_level: str | None
     estimated_hours: int | None
-    skills_gained: list[str]
+    skills_gained: tuple[str, ...]
     project_url: str | None
     field: str | None
     is_active: bool
-    created_at: datetime
-    updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== USER SUGGESTED PROJECTS =====
 
 
-class UserSuggestedProjectCreate(BaseModel):
+class UserSuggestedProjectCreate(DeferredModel):
     """Create a user-project association."""
 
     user_id: UUID
     project_id: UUID
-    status: ProjectStatus = ProjectStatus.SUGGESTED
+    status: ProjectStatusLiteral = ProjectStatus.SUGGESTED.value
 
 
-class UserSuggestedProjectUpdate(BaseModel):
+class UserSuggestedProjectUpdate(DeferredModel):
     """Update user project progress."""
 
-    status: ProjectStatus | None = None
+    status: ProjectStatusLiteral | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
 
 
-class UserSuggestedProjectRead(BaseModel):
+class UserSuggestedProjectRead(FastRead):
     """Read user project association data."""
 
     id: UUID
@@ -139,4 +156,4 @@ class UserSuggestedProjectRead(BaseModel):
     completed_at: datetime | None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
@@ -5,26 +5,47 @@ Schemas for file uploads and parsing tasks.
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
-
-from app.schemas.common_schema import ParseStatus, StorageBackend
+from pydantic import Field
+
+from app.schemas.common_schema import (
+    READ_CONFIG,
+    DeferredModel,
+    ParseStatus,
+    ParseStatusLiteral,
+    StorageBackend,
+    StorageBackendLiteral,
+    TimestampedRead,
+)
+
+__all__ = [
+    "UploadedFileCreate",
+    "UploadedFileUpdate",
+    "UploadedFileRead",
+    "ParseTaskCreate",
+    "ParseTaskUpdate",
+    "ParseTaskRead",
+]
+
+# Lowercase hex SHA-256 digest and type/subtype media type
+SHA256_HEX_PATTERN = r"^[0-9a-f]{64}$"
+MIME_TYPE_PATTERN = r"^[\w.+-]+/[\w.+-]+$"
 
 # ===== UPLOADED FILES =====
 
 
-class UploadedFileCreate(BaseModel):
+class UploadedFileCreate(DeferredModel):
     """Create a new uploaded file record."""
 
     user_id: UUID
     object_key: str = Field(..., max_length=500, description="S3/Azure object key")
-    storage_backend: StorageBackend = StorageBackend.AZURE
+    storage_backend: StorageBackendLiteral = StorageBackend.AZURE.value
     file_name: str = Field(..., max_length=255)
-    mime_type: str = Field(..., max_length=100)
+    mime_type: str = Field(..., max_length=100, pattern=MIME_TYPE_PATTERN)
     file_size_bytes: int = Field(..., gt=0)
-    checksum_sha256: str | None = Field(None, max_length=64)
+    checksum_sha256: str | None = Field(None, pattern=SHA256_HEX_PATTERN)
 
 
-class UploadedFileUpdate(BaseModel):
+class UploadedFileUpdate(DeferredModel):
     """Update an uploaded file record."""
 
     finalized_at: datetime | None = None
@@ -32,7 +53,7 @@ class UploadedFileUpdate(BaseModel):
     presigned_expires_at: datetime | None = None
 
 
-class UploadedFileRead(BaseModel):
+class UploadedFileRead(TimestampedRead):
     """Read uploaded file data."""
 
     id: UUID
@@ -47,34 +68,32 @@ class UploadedFileRead(BaseModel):
     finalized_at: datetime | None
     ttl_expires_at: datetime | None
     extracted_text: str | None
-    created_at: datetime
-    updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== PARSE TASKS =====
 
 
-class ParseTaskCreate(BaseModel):
+class ParseTaskCreate(DeferredModel):
     """Create a new parse task."""
 
     user_id: UUID
     file_id: UUID | None = None
-    status: ParseStatus = ParseStatus.QUEUED
+    status: ParseStatusLiteral = ParseStatus.QUEUED.value
 
 
-class ParseTaskUpdate(BaseModel):
+class ParseTaskUpdate(DeferredModel):
     """Update a parse task."""
 
-    status: ParseStatus | None = None
+    status: ParseStatusLiteral | None = None
     error_class: str | None = Field(None, max_length=100)
     error_message: str | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
 
 
-class ParseTaskRead(BaseModel):
+class ParseTaskRead(TimestampedRead):
     """Read parse task data."""
 
     id: UUID
@@ -85,7 +104,5 @@ class ParseTaskRead(BaseModel):
     error_message: str | None
     started_at: datetime | None
     completed_at: datetime | None
-    created_at: datetime
-    updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
@@ -5,14 +5,36 @@ Schemas for job listings, matching, and feedback.
 from datetime import date, datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
-
-from app.schemas.common_schema import ExperienceLevel, FeedbackType, JobType, RemoteType
+from pydantic import ConfigDict, Field, TypeAdapter
+
+from app.schemas.common_schema import (
+    READ_CONFIG,
+    DeferredModel,
+    ExperienceLevelLiteral,
+    FastRead,
+    FeedbackTypeLiteral,
+    JobTypeLiteral,
+    RemoteTypeLiteral,
+    TimestampedRead,
+)
+
+__all__ = [
+    "JobListingCreate",
+    "JobListingUpdate",
+    "JobListingRead",
+    "JobMatchCreate",
+    "JobMatchUpdate",
+    "JobMatchRead",
+    "UserJobFeedbackCreate",
+    "UserJobFeedbackRead",
+    "JobListingListAdapter",
+    "JobMatchListAdapter",
+]
 
 # ===== JOB LISTINGS =====
 
 
-class JobListingCreate(BaseModel):
+class JobListingCreate(DeferredModel):
     """Create a new job listing."""
 
     external_id: str | None = Field(None, max_length=255)
@@ -20,27 +42,27 @@ class JobListingCreate(BaseModel):
     job_title: str = Field(..., max_length=200)
     company_name: str = Field(..., max_length=200)
     location: str | None = Field(None, max_length=255)
-    remote_type: RemoteType | None = None
+    remote_type: RemoteTypeLiteral | None = None
     salary_min: int | None = Field(None, ge=0)
     salary_max: int | None = Field(None, ge=0)
     salary_currency: str = Field(default="USD", max_length=3)
     description: str | None = None
     requirements: str | None = None
     benefits: str | None = None
-    job_type: JobType | None = None
-    experience_level: ExperienceLevel | None = None
+    job_type: JobTypeLiteral | None = None
+    experience_level: ExperienceLevelLiteral | None = None
     posted_date: date | None = None
     application_deadline: date | None = None
     external_url: str | None = Field(None, max_length=500)
 
 
-class JobListingUpdate(BaseModel):
+class JobListingUpdate(DeferredModel):
     """Update a job listing."""
 
     job_title: str | None = Field(None, max_length=200)
     company_name: str | None = Field(None, max_length=200)
     location: str | None = Field(None, max_length=255)
-    remote_type: RemoteType | None = None
+    remote_type: RemoteTypeLiteral | None = None
     salary_min: int | None = Field(None, ge=0)
     salary_max: int | None = Field(None, ge=0)
     description: str | None = None
@@ -49,7 +71,7 @@ class JobListingUpdate(BaseModel):
     is_active: bool | None = None
 
 
-class JobListingRead(BaseModel):
+class JobListingRead(TimestampedRead):
     """Read job listing data."""
 
     id: UUID
@@ -72,16 +94,14 @@ class JobListingRead(BaseModel):
     external_url: str | None
     is_active: bool
     extracted_keywords: list[str]
-    created_at: datetime
-    updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== JOB MATCHES =====
 
 
-class JobMatchCreate(BaseModel):
+class JobMatchCreate(DeferredModel):
     """Create a new job match."""
 
     user_id: UUID
@@ -95,14 +115,14 @@ class JobMatchCreate(BaseModel):
     missing_skills: list[str] = Field(default_factory=list)
 
 
-class JobMatchUpdate(BaseModel):
+class JobMatchUpdate(DeferredModel):
     """Update a job match."""
 
     is_saved: bool | None = None
     is_hidden: bool | None = None
 
 
-class JobMatchRead(BaseModel):
+class JobMatchRead(FastRead):
     """Read job match data."""
 
     id: UUID
@@ -113,27 +133,27 @@ class JobMatchRead(BaseModel):
     skill_match_score: int | None
     experience_match_score: int | None
     location_match_score: int | None
-    matched_skills: list[str]
-    missing_skills: list[str]
+    matched_skills: tuple[str, ...]
+    missing_skills: tuple[str, ...]
     is_saved: bool
     is_hidden: bool
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== USER JOB FEEDBACK =====
 
 
-class UserJobFeedbackCreate(BaseModel):
+class UserJobFeedbackCreate(DeferredModel):
     """Create user feedback on a job."""
 
     user_id: UUID
     job_listing_id: UUID
-    feedback_type: FeedbackType
+    feedback_type: FeedbackTypeLiteral
 
 
-class UserJobFeedbackRead(BaseModel):
+class UserJobFeedbackRead(FastRead):
     """Read user job feedback data."""
 
     id: UUID
@@ -142,4 +162,15 @@ class UserJobFeedbackRead(BaseModel):
     feedback_type: str
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
+
+
+# ===== LIST ADAPTERS =====
+
+# Serialize a whole page of rows in one dump_json call; deferred like the models
+JobListingListAdapter = TypeAdapter(
+    list[JobListingRead], config=ConfigDict(defer_build=True)
+)
+JobMatchListAdapter = TypeAdapter(
+    list[JobMatchRead], config=ConfigDict(defer_build=True)
+)
@@ -3,14 +3,53 @@ Schemas for frontend log submission.
 Used for request/response validation when frontend sends logs to backend.
 """
 
-from pydantic import BaseModel, Field
-from typing import Any, Optional
-from datetime import datetime
+import time
+from dataclasses import dataclass
+from pydantic import ConfigDict, Field
+from typing import Any
+from datetime import datetime, timezone
 
+from app.schemas.common_schema import DeferredModel
 
-class FrontendLogPayload(BaseModel):
+# Longest message kept from a single frontend log entry
+MESSAGE_MAX_LENGTH = 16384
+
+_OPTIONAL_STR_FIELDS = ("user_id", "session_id", "url", "user_agent")
+_OPTIONAL_DICT_FIELDS = ("context", "extra_data")
+
+# Epoch values above this are milliseconds (JS Date.now()); same cut-off pydantic uses
+_EPOCH_MS_THRESHOLD = 2e10
+
+
+def _parse_timestamp(value: str | int | float) -> datetime:
+    """
+    Parse a client timestamp the way pydantic's datetime field did.
+
+    Accepts ISO 8601 strings (including a trailing "Z", which
+    datetime.fromisoformat rejects before Python 3.11) and epoch seconds or
+    milliseconds.
+
+    Raises:
+        ValueError: If the value is not a valid or representable timestamp
+    """
+    if isinstance(value, str):
+        if value[-1:] in ("Z", "z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
+    if abs(value) > _EPOCH_MS_THRESHOLD:
+        value = value / 1000
+    try:
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    except (OverflowError, OSError) as e:
+        raise ValueError(f"Log field 'timestamp' is out of range: {value}") from e
+
+
+class FrontendLogPayloadSchema(DeferredModel):
     """
     Schema for frontend log data received from browser.
+    Documents the request body in OpenAPI; the route parses bodies with
+    FrontendLogPayload.from_json instead of validating through this model.
 
     Attributes:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -27,17 +66,19 @@ class FrontendLogPayload(BaseModel):
 
     level: str = Field(..., description="Log level: DEBUG, INFO, WARNING, ERROR, CRITICAL")
     message: str = Field(..., description="Log message")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="When log was created")
+    timestamp: datetime | None = Field(
+        default=None, description="When log was created (defaults to receipt time)"
+    )
     source: str = Field(..., description="Source (component, page, action name)")
-    context: Optional[dict[str, Any]] = Field(default=None, description="Additional context")
-    user_id: Optional[str] = Field(default=None, description="User ID")
-    session_id: Optional[str] = Field(default=None, description="Session ID")
-    url: Optional[str] = Field(default=None, description="Current page URL")
-    user_agent: Optional[str] = Field(default=None, description="Browser user agent")
-    extra_data: Optional[dict[str, Any]] = Field(default=None, description="Extra data")
-
-    class Config:
-        json_schema_extra = {
+    context: dict[str, Any] | None = Field(default=None, description="Additional context")
+    user_id: str | None = Field(default=None, description="User ID")
+    session_id: str | None = Field(default=None, description="Session ID")
+    url: str | None = Field(default=None, description="Current page URL")
+    user_agent: str | None = Field(default=None, description="Browser user agent")
+    extra_data: dict[str, Any] | None = Field(default=None, description="Extra data")
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "level": "ERROR",
                 "message": "Login failed",
@@ -46,12 +87,95 @@ class FrontendLogPayload(BaseModel):
                 "user_id": "user_123",
                 "session_id": "sess_456",
             }
-        }
+        },
+    )
+
+
+@dataclass(slots=True)
+class FrontendLogPayload:
+    """
+    Parsed frontend log entry (see FrontendLogPayloadSchema for field docs).
+    Built by from_json, which performs only the type checks the log route
+    relies on, so high-volume log ingest skips model validation.
+    """
+
+    level: str
+    message: str
+    source: str
+    # Receipt time as epoch nanoseconds; a datetime is only built if needed
+    received_ns: int
+    timestamp: datetime | None = None
+    context: dict[str, Any] | None = None
+    user_id: str | None = None
+    session_id: str | None = None
+    url: str | None = None
+    user_agent: str | None = None
+    extra_data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_json(cls, raw: Any) -> "FrontendLogPayload":
+        """
+        Build a payload from a decoded JSON body.
+
+        Raises:
+            ValueError: If the body is not an object or a field has the wrong type
+        """
+        if not isinstance(raw, dict):
+            raise ValueError("Log payload must be a JSON object")
+
+        level = raw.get("level")
+        message = raw.get("message")
+        source = raw.get("source")
+        for name, value in (("level", level), ("message", message), ("source", source)):
+            if not isinstance(value, str):
+                raise ValueError(f"Log field '{name}' must be a string")
+
+        # A missing timestamp stays None; logged_at falls back to receipt time
+        timestamp = raw.get("timestamp")
+        if isinstance(timestamp, (str, int, float)) and not isinstance(timestamp, bool):
+            timestamp = _parse_timestamp(timestamp)
+        elif timestamp is not None:
+            raise ValueError(
+                "Log field 'timestamp' must be an ISO 8601 string or epoch seconds/milliseconds"
+            )
+
+        for name in _OPTIONAL_STR_FIELDS:
+            value = raw.get(name)
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"Log field '{name}' must be a string")
+        for name in _OPTIONAL_DICT_FIELDS:
+            value = raw.get(name)
+            if value is not None and not isinstance(value, dict):
+                raise ValueError(f"Log field '{name}' must be an object")
+
+        return cls(
+            level=level,
+            message=message[:MESSAGE_MAX_LENGTH],
+            source=source,
+            received_ns=time.time_ns(),
+            timestamp=timestamp,
+            context=raw.get("context"),
+            user_id=raw.get("user_id"),
+            session_id=raw.get("session_id"),
+            url=raw.get("url"),
+            user_agent=raw.get("user_agent"),
+            extra_data=raw.get("extra_data"),
+        )
+
+    @property
+    def logged_at(self) -> datetime:
+        """Client timestamp, or the (UTC) receipt time when the client sent none."""
+        if self.timestamp is not None:
+            return self.timestamp
+        return datetime.fromtimestamp(self.received_ns / 1e9, tz=timezone.utc)
 
 
-class LogResponse(BaseModel):
+# Slotted dataclass rather than a model: built on every log POST, so it carries
+# no per-instance __dict__ (pydantic models cannot declare __slots__)
+@dataclass(slots=True, frozen=True)
+class LogResponse:
     """Response from log submission endpoint."""
 
     success: bool
     message: str
-    log_id: Optional[str] = None
+    log_id: str | None = None
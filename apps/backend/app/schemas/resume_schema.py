@@ -3,15 +3,30 @@ Schemas for resumes and all related sections.
 """
 
 from datetime import date, datetime
-from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+from app.schemas.common_schema import (
+    READ_CONFIG,
+    DeferredModel,
+    Email,
+    FastRead,
+    StoredJsonObject,
+    Str20,
+    Str30,
+    Str50,
+    Str100,
+    Str200,
+    Str255,
+    Str500,
+    Str16384,
+)
 
 # ===== RESUME TEMPLATES =====
 
 
-class ResumeTemplateRead(BaseModel):
+class ResumeTemplateRead(FastRead):
     """Read resume template data."""
 
     id: UUID
@@ -23,47 +38,47 @@ class ResumeTemplateRead(BaseModel):
     is_active: bool
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== MAIN RESUME =====
 
 
-class ResumeCreate(BaseModel):
+class ResumeCreate(DeferredModel):
     """Create a new resume."""
 
     user_id: UUID
-    version_name: str = Field(..., max_length=100)
+    version_name: Str100
     template_id: UUID | None = None
     is_primary: bool = False
-    full_name: str | None = Field(None, max_length=200)
-    email: EmailStr | None = None
-    phone: str | None = Field(None, max_length=30)
-    location: str | None = Field(None, max_length=255)
-    linkedin_url: str | None = Field(None, max_length=255)
-    github_url: str | None = Field(None, max_length=255)
-    portfolio_url: str | None = Field(None, max_length=255)
-    professional_summary: str | None = None
+    full_name: Str200 | None = None
+    email: Email | None = None
+    phone: Str30 | None = None
+    location: Str255 | None = None
+    linkedin_url: Str255 | None = None
+    github_url: Str255 | None = None
+    portfolio_url: Str255 | None = None
+    professional_summary: Str16384 | None = None
 
 
-class ResumeUpdate(BaseModel):
+class ResumeUpdate(DeferredModel):
     """Update a resume."""
 
-    version_name: str | None = Field(None, max_length=100)
+    version_name: Str100 | None = None
     template_id: UUID | None = None
     is_primary: bool | None = None
     section_order: dict | None = None
-    full_name: str | None = Field(None, max_length=200)
-    email: EmailStr | None = None
-    phone: str | None = Field(None, max_length=30)
-    location: str | None = Field(None, max_length=255)
-    linkedin_url: str | None = Field(None, max_length=255)
-    github_url: str | None = Field(None, max_length=255)
-    portfolio_url: str | None = Field(None, max_length=255)
-    professional_summary: str | None = None
+    full_name: Str200 | None = None
+    email: Email | None = None
+    phone: Str30 | None = None
+    location: Str255 | None = None
+    linkedin_url: Str255 | None = None
+    github_url: Str255 | None = None
+    portfolio_url: Str255 | None = None
+    professional_summary: Str16384 | None = None
 
 
-class ResumeRead(BaseModel):
+class ResumeRead(FastRead):
     """Read resume data."""
 
     id: UUID
@@ -71,7 +86,7 @@ class ResumeRead(BaseModel):
     version_name: str
     template_id: UUID | None
     is_primary: bool
-    section_order: dict | None
+    section_order: StoredJsonObject | None
     content_hash: str | None
     file_path: str | None
     file_url: str | None
@@ -91,10 +106,25 @@ class ResumeRead(BaseModel):
     updated_at: datetime
     deleted_at: datetime | None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
+    @field_validator("content_hash", mode="before")
+    @classmethod
+    def hex_content_hash(cls, value):
+        """Expose the stored raw SHA-256 digest as a hex string."""
+        if isinstance(value, bytes):
+            return value.hex()
+        return value
 
-class ResumeListItem(BaseModel):
+    @classmethod
+    def from_orm_fast(cls, obj, **values):
+        """Build from a loaded Resume, applying the content_hash conversion construct skips."""
+        if "content_hash" not in values:
+            values["content_hash"] = cls.hex_content_hash(obj.content_hash)
+        return super().from_orm_fast(obj, **values)
+
+
+class ResumeListItem(FastRead):
     """Lightweight resume data for list views — excludes raw_text and error_message."""
 
     id: UUID
@@ -111,7 +141,11 @@ class ResumeListItem(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
+
+
+# Built once: serializes a whole page of list items in one call
+ResumeListAdapter = TypeAdapter(list[ResumeListItem])
 
 
 class ResumeParseStatusResponse(BaseModel):
@@ -124,44 +158,44 @@ class ResumeParseStatusResponse(BaseModel):
     updated_at: datetime
     error_details: str | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== EXPERIENCE =====
 
 
-class ExperienceCreate(BaseModel):
+class ExperienceCreate(DeferredModel):
     """Create a new experience entry."""
 
     resume_id: UUID
-    company_name: str = Field(..., max_length=200)
-    job_title: str = Field(..., max_length=200)
-    location: str | None = Field(None, max_length=255)
+    company_name: Str200
+    job_title: Str200
+    location: Str255 | None = None
     start_date: date
     end_date: date | None = None
     is_current: bool = False
-    description: str | None = None
+    description: Str16384 | None = None
     achievements: list[str] = Field(default_factory=list)
     skills_used: list[str] = Field(default_factory=list)
     display_order: int = 0
 
 
-class ExperienceUpdate(BaseModel):
+class ExperienceUpdate(DeferredModel):
     """Update an experience entry."""
 
-    company_name: str | None = Field(None, max_length=200)
-    job_title: str | None = Field(None, max_length=200)
-    location: str | None = Field(None, max_length=255)
+    company_name: Str200 | None = None
+    job_title: Str200 | None = None
+    location: Str255 | None = None
     start_date: date | None = None
     end_date: date | None = None
     is_current: bool | None = None
-    description: str | None = None
+    description: Str16384 | None = None
     achievements: list[str] | None = None
     skills_used: list[str] | None = None
     display_order: int | None = None
 
 
-class ExperienceRead(BaseModel):
+class ExperienceRead(FastRead):
     """Read experience data."""
 
     id: UUID
@@ -179,46 +213,46 @@ class ExperienceRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== EDUCATION =====
 
 
-class EducationCreate(BaseModel):
+class EducationCreate(DeferredModel):
     """Create a new education entry."""
 
     resume_id: UUID
-    institution_name: str = Field(..., max_length=200)
-    degree_type: str | None = Field(None, max_length=100)
-    field_of_study: str | None = Field(None, max_length=200)
-    location: str | None = Field(None, max_length=255)
+    institution_name: Str200
+    degree_type: Str100 | None = None
+    field_of_study: Str200 | None = None
+    location: Str255 | None = None
     start_date: date | None = None
     end_date: date | None = None
     is_current: bool = False
-    gpa: Decimal | None = Field(None, ge=0, le=4.0)
+    gpa: float | None = Field(None, ge=0, le=4.0)
     achievements: list[str] = Field(default_factory=list)
     relevant_coursework: list[str] = Field(default_factory=list)
     display_order: int = 0
 
 
-class EducationUpdate(BaseModel):
+class EducationUpdate(DeferredModel):
     """Update an education entry."""
 
-    institution_name: str | None = Field(None, max_length=200)
-    degree_type: str | None = Field(None, max_length=100)
-    field_of_study: str | None = Field(None, max_length=200)
-    location: str | None = Field(None, max_length=255)
+    institution_name: Str200 | None = None
+    degree_type: Str100 | None = None
+    field_of_study: Str200 | None = None
+    location: Str255 | None = None
     start_date: date | None = None
     end_date: date | None = None
     is_current: bool | None = None
-    gpa: Decimal | None = Field(None, ge=0, le=4.0)
+    gpa: float | None = Field(None, ge=0, le=4.0)
     achievements: list[str] | None = None
     relevant_coursework: list[str] | None = None
     display_order: int | None = None
 
 
-class EducationRead(BaseModel):
+class EducationRead(FastRead):
     """Read education data."""
 
     id: UUID
@@ -230,43 +264,43 @@ class EducationRead(BaseModel):
     start_date: date | None
     end_date: date | None
     is_current: bool
-    gpa: Decimal | None
+    gpa: float | None
     achievements: list[str]
     relevant_coursework: list[str]
     display_order: int
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== SKILLS =====
 
 
-class SkillCreate(BaseModel):
+class SkillCreate(DeferredModel):
     """Create a new skill entry."""
 
     resume_id: UUID
-    skill_name: str = Field(..., max_length=100)
-    skill_category: str | None = Field(None, max_length=50)
-    proficiency_level: str | None = Field(None, max_length=20)
-    years_of_experience: Decimal | None = Field(None, ge=0, le=99.9)
+    skill_name: Str100
+    skill_category: Str50 | None = None
+    proficiency_level: Str20 | None = None
+    years_of_experience: float | None = Field(None, ge=0, le=99.9)
     is_primary: bool = False
     display_order: int = 0
 
 
-class SkillUpdate(BaseModel):
+class SkillUpdate(DeferredModel):
     """Update a skill entry."""
 
-    skill_name: str | None = Field(None, max_length=100)
-    skill_category: str | None = Field(None, max_length=50)
-    proficiency_level: str | None = Field(None, max_length=20)
-    years_of_experience: Decimal | None = Field(None, ge=0, le=99.9)
+    skill_name: Str100 | None = None
+    skill_category: Str50 | None = None
+    proficiency_level: Str20 | None = None
+    years_of_experience: float | None = Field(None, ge=0, le=99.9)
     is_primary: bool | None = None
     display_order: int | None = None
 
 
-class SkillRead(BaseModel):
+class SkillRead(FastRead):
     """Read skill data."""
 
     id: UUID
@@ -274,43 +308,43 @@ class SkillRead(BaseModel):
     skill_name: str
     skill_category: str | None
     proficiency_level: str | None
-    years_of_experience: Decimal | None
+    years_of_experience: float | None
     is_primary: bool
     display_order: int
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== CERTIFICATIONS =====
 
 
-class CertificationCreate(BaseModel):
+class CertificationCreate(DeferredModel):
     """Create a new certification entry."""
 
     resume_id: UUID
-    certification_name: str = Field(..., max_length=200)
-    issuing_organization: str | None = Field(None, max_length=200)
+    certification_name: Str200
+    issuing_organization: Str200 | None = None
     issue_date: date | None = None
     expiry_date: date | None = None
-    credential_id: str | None = Field(None, max_length=100)
-    credential_url: str | None = Field(None, max_length=500)
+    credential_id: Str100 | None = None
+    credential_url: Str500 | None = None
     display_order: int = 0
 
 
-class CertificationUpdate(BaseModel):
+class CertificationUpdate(DeferredModel):
     """Update a certification entry."""
 
-    certification_name: str | None = Field(None, max_length=200)
-    issuing_organization: str | None = Field(None, max_length=200)
+    certification_name: Str200 | None = None
+    issuing_organization: Str200 | None = None
     issue_date: date | None = None
     expiry_date: date | None = None
-    credential_id: str | None = Field(None, max_length=100)
-    credential_url: str | None = Field(None, max_length=500)
+    credential_id: Str100 | None = None
+    credential_url: Str500 | None = None
     display_order: int | None = None
 
 
-class CertificationRead(BaseModel):
+class CertificationRead(FastRead):
     """Read certification data."""
 
     id: UUID
@@ -324,21 +358,21 @@ class CertificationRead(BaseModel):
     display_order: int
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== PROJECTS =====
 
 
-class ProjectCreate(BaseModel):
+class ProjectCreate(DeferredModel):
     """Create a new project entry."""
 
     resume_id: UUID
-    project_name: str = Field(..., max_length=200)
-    role: str | None = Field(None, max_length=100)
-    description: str | None = None
+    project_name: Str200
+    role: Str100 | None = None
+    description: Str16384 | None = None
     technologies_used: list[str] = Field(default_factory=list)
-    project_url: str | None = Field(None, max_length=500)
+    project_url: Str500 | None = None
     start_date: date | None = None
     end_date: date | None = None
     is_current: bool = False
@@ -346,14 +380,14 @@ class ProjectCreate(BaseModel):
     display_order: int = 0
 
 
-class ProjectUpdate(BaseModel):
+class ProjectUpdate(DeferredModel):
     """Update a project entry."""
 
-    project_name: str | None = Field(None, max_length=200)
-    role: str | None = Field(None, max_length=100)
-    description: str | None = None
+    project_name: Str200 | None = None
+    role: Str100 | None = None
+    description: Str16384 | None = None
     technologies_used: list[str] | None = None
-    project_url: str | None = Field(None, max_length=500)
+    project_url: Str500 | None = None
     start_date: date | None = None
     end_date: date | None = None
     is_current: bool | None = None
@@ -361,7 +395,7 @@ class ProjectUpdate(BaseModel):
     display_order: int | None = None
 
 
-class ProjectRead(BaseModel):
+class ProjectRead(FastRead):
     """Read project data."""
 
     id: UUID
@@ -379,44 +413,44 @@ class ProjectRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== CUSTOM SECTIONS =====
 
 
-class CustomSectionCreate(BaseModel):
+class CustomSectionCreate(DeferredModel):
     """Create a new custom section."""
 
     resume_id: UUID
-    section_title: str = Field(..., max_length=100)
-    section_type: str | None = Field(None, max_length=50)
+    section_title: Str100
+    section_type: Str50 | None = None
     content: dict
     display_order: int = 0
 
 
-class CustomSectionUpdate(BaseModel):
+class CustomSectionUpdate(DeferredModel):
     """Update a custom section."""
 
-    section_title: str | None = Field(None, max_length=100)
-    section_type: str | None = Field(None, max_length=50)
+    section_title: Str100 | None = None
+    section_type: Str50 | None = None
     content: dict | None = None
     display_order: int | None = None
 
 
-class CustomSectionRead(BaseModel):
+class CustomSectionRead(FastRead):
     """Read custom section data."""
 
     id: UUID
     resume_id: UUID
     section_title: str
     section_type: str | None
-    content: dict
+    content: StoredJsonObject
     display_order: int
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== COMBINED RESUME =====
@@ -431,3 +465,34 @@ class ResumeComplete(ResumeRead):
     certifications: list[CertificationRead] = Field(default_factory=list)
     projects: list[ProjectRead] = Field(default_factory=list)
     custom_sections: list[CustomSectionRead] = Field(default_factory=list)
+
+    @classmethod
+    def build(cls, resume, sections) -> "ResumeComplete":
+        """
+        Build from a loaded Resume and its section lists.
+
+        Args:
+            resume: Resume ORM row
+            sections: Mapping of section name to rows (ORM instances or snapshot dicts)
+
+        Returns:
+            ResumeComplete with each section validated in one adapter call
+        """
+        return cls.from_orm_fast(
+            resume,
+            **{
+                name: adapter.validate_python(sections[name], from_attributes=True)
+                for name, adapter in _SECTION_ADAPTERS.items()
+            },
+        )
+
+
+# Built once: validates a whole section list per call instead of row by row
+_SECTION_ADAPTERS = {
+    "experiences": TypeAdapter(list[ExperienceRead]),
+    "education": TypeAdapter(list[EducationRead]),
+    "skills": TypeAdapter(list[SkillRead]),
+    "certifications": TypeAdapter(list[CertificationRead]),
+    "projects": TypeAdapter(list[ProjectRead]),
+    "custom_sections": TypeAdapter(list[CustomSectionRead]),
+}
@@ -5,60 +5,69 @@ Schemas for system configuration, feature flags, idempotency, audit logs, and te
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
-
-from app.schemas.common_schema import IdempotencyStatus
+from app.schemas.common_schema import (
+    READ_CONFIG,
+    DeferredModel,
+    FastRead,
+    IdempotencyStatus,
+    IdempotencyStatusLiteral,
+    StoredJsonObject,
+    Str50,
+    Str100,
+    Str128,
+    Str200,
+)
 
 # ===== SYSTEM CONFIG =====
 
 
-class SystemConfigCreate(BaseModel):
+class SystemConfigCreate(DeferredModel):
     """Create a new system configuration."""
 
-    config_key: str = Field(..., max_length=100)
+    config_key: Str100
     config_value: dict
     description: str | None = None
 
 
-class SystemConfigUpdate(BaseModel):
+class SystemConfigUpdate(DeferredModel):
     """Update a system configuration."""
 
     config_value: dict | None = None
     description: str | None = None
 
 
-class SystemConfigRead(BaseModel):
+class SystemConfigRead(FastRead):
     """Read system configuration data."""
 
     id: UUID
     config_key: str
-    config_value: dict
+    config_value: StoredJsonObject
     description: str | None
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== FEATURE FLAGS =====
 
 
-class FeatureFlagCreate(BaseModel):
+class FeatureFlagCreate(DeferredModel):
     """Create a new feature flag."""
 
-    flag_key: str = Field(..., max_length=100)
+    flag_key: Str100
     enabled: bool = False
     description: str | None = None
 
 
-class FeatureFlagUpdate(BaseModel):
+class FeatureFlagUpdate(DeferredModel):
     """Update a feature flag."""
 
     enabled: bool | None = None
     description: str | None = None
 
 
-class FeatureFlagRead(BaseModel):
+class FeatureFlagRead(FastRead):
     """Read feature flag data."""
 
     id: UUID
@@ -68,32 +77,32 @@ class FeatureFlagRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== IDEMPOTENCY KEYS =====
 
 
-class IdempotencyKeyCreate(BaseModel):
+class IdempotencyKeyCreate(DeferredModel):
     """Create a new idempotency key."""
 
     user_id: UUID
-    scope: str = Field(..., max_length=50)
-    idempotency_key: str = Field(..., max_length=128)
-    request_fingerprint: str | None = Field(None, max_length=200)
-    target_table: str | None = Field(None, max_length=100)
+    scope: Str50
+    idempotency_key: Str128
+    request_fingerprint: Str200 | None = None
+    target_table: Str100 | None = None
     target_id: UUID | None = None
-    status: IdempotencyStatus = IdempotencyStatus.PROCESSING
+    status: IdempotencyStatusLiteral = IdempotencyStatus.PROCESSING.value
 
 
-class IdempotencyKeyUpdate(BaseModel):
+class IdempotencyKeyUpdate(DeferredModel):
     """Update an idempotency key."""
 
-    status: IdempotencyStatus | None = None
+    status: IdempotencyStatusLiteral | None = None
     target_id: UUID | None = None
 
 
-class IdempotencyKeyRead(BaseModel):
+class IdempotencyKeyRead(FastRead):
     """Read idempotency key data."""
 
     id: UUID
@@ -106,24 +115,24 @@ class IdempotencyKeyRead(BaseModel):
     status: str
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== AUDIT LOGS =====
 
 
-class AuditLogCreate(BaseModel):
+class AuditLogCreate(DeferredModel):
     """Create a new audit log entry."""
 
     user_id: UUID | None = None
-    action: str = Field(..., max_length=100)
-    resource_type: str | None = Field(None, max_length=100)
+    action: Str100
+    resource_type: Str100 | None = None
     resource_id: UUID | None = None
     correlation_id: UUID | None = None
     redacted_details: dict | None = None
 
 
-class AuditLogRead(BaseModel):
+class AuditLogRead(FastRead):
     """Read audit log data."""
 
     id: UUID
@@ -132,51 +141,51 @@ class AuditLogRead(BaseModel):
     resource_type: str | None
     resource_id: UUID | None
     correlation_id: UUID | None
-    redacted_details: dict | None
+    redacted_details: StoredJsonObject | None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== SYSTEM HEALTH CHECKS =====
 
 
-class SystemHealthCheckCreate(BaseModel):
+class SystemHealthCheckCreate(DeferredModel):
     """Create a new health check record."""
 
-    status: str = Field(..., max_length=50)
+    status: Str50
     details: dict | None = None
 
 
-class SystemHealthCheckRead(BaseModel):
+class SystemHealthCheckRead(FastRead):
     """Read health check data."""
 
     id: UUID
     status: str
     checked_at: datetime
-    details: dict | None
+    details: StoredJsonObject | None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== TELEMETRY EVENTS =====
 
 
-class TelemetryEventCreate(BaseModel):
+class TelemetryEventCreate(DeferredModel):
     """Create a new telemetry event."""
 
-    event_name: str = Field(..., max_length=100)
-    user_hash: str | None = Field(None, max_length=128)
+    event_name: Str100
+    user_hash: Str128 | None = None
     payload: dict | None = None
 
 
-class TelemetryEventRead(BaseModel):
+class TelemetryEventRead(FastRead):
     """Read telemetry event data."""
 
     id: UUID
     event_name: str
     user_hash: str | None
-    payload: dict | None
+    payload: StoredJsonObject | None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
@@ -3,17 +3,24 @@ User schemas for authentication and user management.
 """
 
 from datetime import datetime
-from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import Field
 
+from app.schemas.common_schema import (
+    READ_CONFIG,
+    DeferredModel,
+    FastRead,
+    StoredJsonObject,
+)
 
-class UserCreate(BaseModel):
+
+class UserCreate(DeferredModel):
     """Create a new user."""
 
     supabase_user_id: UUID
-    email: EmailStr
+    # Format is checked by user_service before writing (and by ck_users_email_format)
+    email: str = Field(max_length=255)
     full_name: str | None = Field(None, max_length=200)
     phone: str | None = Field(None, max_length=30)
     location: str | None = Field(None, max_length=255)
@@ -24,13 +31,13 @@ class UserCreate(BaseModel):
     preferred_locations: list[str] = Field(default_factory=list)
     preferred_salary_min: int | None = Field(None, ge=0)
     preferred_salary_max: int | None = Field(None, ge=0)
-    years_of_experience: Decimal | None = Field(None, ge=0, le=99.9)
+    years_of_experience: float | None = Field(None, ge=0, le=99.9)
 
 
-class UserUpdate(BaseModel):
+class UserUpdate(DeferredModel):
     """Update user information."""
 
-    email: EmailStr | None = None
+    email: str | None = Field(None, max_length=255)
     full_name: str | None = Field(None, max_length=200)
     phone: str | None = Field(None, max_length=30)
     location: str | None = Field(None, max_length=255)
@@ -41,17 +48,17 @@ class UserUpdate(BaseModel):
     preferred_locations: list[str] | None = None
     preferred_salary_min: int | None = Field(None, ge=0)
     preferred_salary_max: int | None = Field(None, ge=0)
-    years_of_experience: Decimal | None = Field(None, ge=0, le=99.9)
+    years_of_experience: float | None = Field(None, ge=0, le=99.9)
     has_completed_onboarding: bool | None = None
     is_active: bool | None = None
 
 
-class UserRead(BaseModel):
+class UserRead(FastRead):
     """Read user data."""
 
     id: UUID
     supabase_user_id: UUID
-    email: EmailStr
+    email: str
     full_name: str | None
     phone: str | None
     location: str | None
@@ -62,7 +69,7 @@ class UserRead(BaseModel):
     preferred_locations: list[str]
     preferred_salary_min: int | None
     preferred_salary_max: int | None
-    years_of_experience: Decimal | None
+    years_of_experience: float | None
     has_completed_onboarding: bool
     is_active: bool
     created_at: datetime
@@ -70,24 +77,24 @@ class UserRead(BaseModel):
     last_login_at: datetime | None
     deleted_at: datetime | None
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
 
 
 # ===== ONBOARDING PROGRESS =====
 
 
-class OnboardingProgressCreate(BaseModel):
+class OnboardingProgressCreate(DeferredModel):
     """Create or update onboarding progress."""
 
     user_id: UUID
     data: dict
 
 
-class OnboardingProgressRead(BaseModel):
+class OnboardingProgressRead(FastRead):
     """Read onboarding progress data."""
 
     user_id: UUID
-    data: dict
+    data: StoredJsonObject
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = READ_CONFIG
@@ -10,7 +10,7 @@ This module handles:
 import io
 import re
 from uuid import UUID
-from datetime import datetime, date
+from datetime import date, datetime, timezone
 from typing import Any, Optional
 
 from docx import Document
@@ -20,10 +20,13 @@ from pdfminer.pdfparser import PDFSyntaxError
 from pdfminer.pdfdocument import PDFEncryptionError
 from pdfminer.pdfpage import PDFTextExtractionNotAllowed
 from sqlmodel import Session, select
+from sqlalchemy import lambda_stmt, text
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import undefer
 
 from app.core.config import settings
 from app.core.logging_config import log_info, log_error, log_warning
+from app.db.bulk import bulk_insert_with_copy
 from app.db.session import SessionLocal
 from app.models.resume_model import (
     Resume,
@@ -32,6 +35,10 @@ from app.models.resume_model import (
     ResumeEducation,
     ResumeCertification,
     ResumeProject,
+    ResumeCustomSection,
+    FLAG_IS_PRIMARY,
+    RESUME_FULL_LOAD,
+    TEXT_MAX_LENGTH,
 )
 from app.schemas.resume_schema import ResumeParseStatusResponse, ResumeCreate
 from app.services.storage_service import get_supabase_client
@@ -75,7 +82,7 @@ def create_resume(db: Session, resume_data: ResumeCreate) -> Resume:
         user_id=resume_data.user_id,
         version_name=resume_data.version_name,
         template_id=resume_data.template_id,
-        is_primary=resume_data.is_primary,
+        flags=FLAG_IS_PRIMARY if resume_data.is_primary else 0,
         full_name=resume_data.full_name,
         email=resume_data.email,
         phone=resume_data.phone,
@@ -85,7 +92,7 @@ def create_resume(db: Session, resume_data: ResumeCreate) -> Resume:
         portfolio_url=resume_data.portfolio_url,
         professional_summary=resume_data.professional_summary,
         processing_status="Completed",  # Manual creation is immediately complete
-        last_analyzed_at=datetime.utcnow()
+        last_analyzed_at=datetime.now(timezone.utc)
     )
     
     db.add(resume)
@@ -254,10 +261,10 @@ def update_resume_status(
         
         if resume:
             resume.processing_status = status
-            resume.error_message = error_message
+            resume.error_message = error_message[:TEXT_MAX_LENGTH] if error_message else error_message
             
             if status == "Completed":
-                resume.last_analyzed_at = datetime.utcnow()
+                resume.last_analyzed_at = datetime.now(timezone.utc)
             
             db.add(resume)
             db.commit()
@@ -306,7 +313,7 @@ def update_resume_with_parsed_data(
     if parsed_data.get("portfolio_url"):
         resume.portfolio_url = parsed_data["portfolio_url"]
     if parsed_data.get("professional_summary"):
-        resume.professional_summary = parsed_data["professional_summary"]
+        resume.professional_summary = parsed_data["professional_summary"][:TEXT_MAX_LENGTH]
     
     # Store raw text for future reprocessing
     if parsed_data.get("raw_text"):
@@ -319,84 +326,124 @@ def update_resume_with_parsed_data(
     # PERSIST STRUCTURED DATA TO NORMALIZED TABLES
     # ==========================================================================
     
+    # Rows are gathered as tuples in each model's COPY_COLUMNS order and
+    # streamed with one COPY per table instead of one INSERT per row
+    
     # Skills - persist to resume_skills table
     skills_list = parsed_data.get("skills", [])
     if skills_list:
         log_info(f"Persisting {len(skills_list)} skills for resume {resume.id}")
-        for i, skill_name in enumerate(skills_list):
-            if isinstance(skill_name, str) and skill_name.strip():
-                skill = ResumeSkill(
-                    resume_id=resume.id,
-                    skill_name=skill_name.strip()[:100],  # Enforce max length
-                    display_order=i
-                )
-                db.add(skill)
+        skill_rows = [
+            (
+                resume.id,
+                resume.user_id,
+                skill_name.strip()[:100],  # Enforce max length
+                None,
+                None,
+                None,
+                False,
+                i,
+            )
+            for i, skill_name in enumerate(skills_list)
+            if isinstance(skill_name, str) and skill_name.strip()
+        ]
+        bulk_insert_with_copy(db, ResumeSkill, skill_rows)
     
     # Experiences - persist to resume_experiences table
     experiences_list = parsed_data.get("experiences", [])
     if experiences_list:
         log_info(f"Persisting {len(experiences_list)} experiences for resume {resume.id}")
-        for i, exp in enumerate(experiences_list):
-            if isinstance(exp, dict):
-                experience = ResumeExperience(
-                    resume_id=resume.id,
-                    company_name=exp.get("company_name") or "Unknown Company",
-                    job_title=exp.get("job_title") or "Position",
-                    description=exp.get("raw_text") or exp.get("description"),
-                    start_date=exp.get("start_date") or date.today(),
-                    end_date=exp.get("end_date"),
-                    is_current=exp.get("is_current", False),
-                    display_order=i
-                )
-                db.add(experience)
+        experience_rows = [
+            (
+                resume.id,
+                resume.user_id,
+                exp.get("company_name") or "Unknown Company",
+                exp.get("job_title") or "Position",
+                None,
+                exp.get("start_date") or date.today(),
+                exp.get("end_date"),
+                exp.get("is_current", False),
+                (exp.get("raw_text") or exp.get("description") or "")[:TEXT_MAX_LENGTH] or None,
+                [],
+                [],
+                i,
+            )
+            for i, exp in enumerate(experiences_list)
+            if isinstance(exp, dict)
+        ]
+        bulk_insert_with_copy(db, ResumeExperience, experience_rows)
     
     # Education - persist to resume_education table
     education_list = parsed_data.get("education", [])
     if education_list:
         log_info(f"Persisting {len(education_list)} education entries for resume {resume.id}")
-        for i, edu in enumerate(education_list):
-            if isinstance(edu, dict):
-                education = ResumeEducation(
-                    resume_id=resume.id,
-                    institution_name=edu.get("institution_name") or "Unknown Institution",
-                    degree_type=edu.get("degree_type"),
-                    field_of_study=edu.get("field_of_study"),
-                    start_date=edu.get("start_date"),
-                    end_date=edu.get("end_date"),
-                    is_current=edu.get("is_current", False),
-                    display_order=i
-                )
-                db.add(education)
+        education_rows = [
+            (
+                resume.id,
+                resume.user_id,
+                edu.get("institution_name") or "Unknown Institution",
+                edu.get("degree_type"),
+                edu.get("field_of_study"),
+                None,
+                edu.get("start_date"),
+                edu.get("end_date"),
+                edu.get("is_current", False),
+                None,
+                [],
+                [],
+                i,
+            )
+            for i, edu in enumerate(education_list)
+            if isinstance(edu, dict)
+        ]
+        bulk_insert_with_copy(db, ResumeEducation, education_rows)
     
     # Certifications - persist to resume_certifications table
     certifications_list = parsed_data.get("certifications", [])
     if certifications_list:
         log_info(f"Persisting {len(certifications_list)} certifications for resume {resume.id}")
-        for i, cert in enumerate(certifications_list):
-            if isinstance(cert, dict):
-                certification = ResumeCertification(
-                    resume_id=resume.id,
-                    certification_name=cert.get("certification_name") or cert.get("raw_text", "Certification")[:200],
-                    issuing_organization=cert.get("issuing_organization"),
-                    issue_date=cert.get("issue_date"),
-                    expiry_date=cert.get("expiry_date"),
-                    display_order=i
-                )
-                db.add(certification)
+        certification_rows = [
+            (
+                resume.id,
+                resume.user_id,
+                cert.get("certification_name") or cert.get("raw_text", "Certification")[:200],
+                cert.get("issuing_organization"),
+                cert.get("issue_date"),
+                cert.get("expiry_date"),
+                None,
+                None,
+                i,
+            )
+            for i, cert in enumerate(certifications_list)
+            if isinstance(cert, dict)
+        ]
+        bulk_insert_with_copy(db, ResumeCertification, certification_rows)
     
     # Projects - persist to resume_projects table
     projects_list = parsed_data.get("projects", [])
     if projects_list:
         log_info(f"Persisting {len(projects_list)} projects for resume {resume.id}")
-        for i, proj in enumerate(projects_list):
-            if isinstance(proj, dict):
-                project = ResumeProject(
-                    resume_id=resume.id,
-                    project_name=proj.get("project_name") or "Project",
-                    description=proj.get("raw_text") or proj.get("description"),
-                    display_order=i
-                )
-                db.add(project)
+        project_rows = [
+            (
+                resume.id,
+                resume.user_id,
+                proj.get("project_name") or "Project",
+                None,
+                (proj.get("raw_text") or proj.get("description") or "")[:TEXT_MAX_LENGTH] or None,
+                [],
+                None,
+                None,
+                None,
+                False,
+                [],
+                i,
+            )
+            for i, proj in enumerate(projects_list)
+            if isinstance(proj, dict)
+        ]
+        bulk_insert_with_copy(db, ResumeProject, project_rows)
+    
+    refresh_resume_sections(db, resume.id)
     
     # Single atomic commit for all changes
     db.commit()
@@ -1399,6 +1446,73 @@ def get_active_resume(
     return resume
 
 
+def _fetch_resume_section(db: Session, model: type, resume_id: UUID) -> list:
+    """
+    Fetch the ordered rows of one resume section table.
+    
+    Built as a lambda statement so the cache key comes from the lambda's
+    code object (plus the tracked model) instead of walking the expression
+    tree on every call; resume_id is extracted as a bound parameter.
+    """
+    statement = lambda_stmt(lambda: select(model), track_on=[model])
+    statement += lambda s: s.where(model.resume_id == resume_id).order_by(
+        model.display_order
+    )
+    return db.scalars(statement).all()
+
+
+def _fetch_resume_sections(db: Session, resume_id: UUID) -> dict[str, list]:
+    """Fetch every section of a resume from the child tables."""
+    return {
+        "experiences": _fetch_resume_section(db, ResumeExperience, resume_id),
+        "education": _fetch_resume_section(db, ResumeEducation, resume_id),
+        "skills": _fetch_resume_section(db, ResumeSkill, resume_id),
+        "certifications": _fetch_resume_section(db, ResumeCertification, resume_id),
+        "projects": _fetch_resume_section(db, ResumeProject, resume_id),
+        "custom_sections": _fetch_resume_section(db, ResumeCustomSection, resume_id),
+    }
+
+
+# Section key -> child table backing it in the `sections` snapshot
+# (keys are also the Resume relationship names)
+_SECTION_TABLES = (
+    ("experiences", "resume_experiences"),
+    ("education", "resume_education"),
+    ("skills", "resume_skills"),
+    ("certifications", "resume_certifications"),
+    ("projects", "resume_projects"),
+    ("custom_sections", "resume_custom_sections"),
+)
+_SECTION_NAMES = tuple(key for key, _ in _SECTION_TABLES)
+
+# Per-row JSON; scaled SMALLINT columns also get their decimal API field
+_SECTION_ROW_JSON = {
+    "resume_education": (
+        "to_jsonb(c) || jsonb_build_object('gpa', (c.gpa_x100 / 100.0)::numeric(3,2))"
+    ),
+    "resume_skills": (
+        "to_jsonb(c) || jsonb_build_object("
+        "'years_of_experience', (c.years_of_experience_x10 / 10.0)::numeric(4,1))"
+    ),
+}
+
+# Invariant: every write to a section table must be followed by
+# refresh_resume_sections in the same transaction, or /complete serves a stale
+# snapshot. Today the only writers are update_resume_with_parsed_data and
+# duplicate_resume (both COPY, which ORM flush hooks can't see). Deletes only
+# happen together with the parent resume, whose snapshot goes with it
+_REFRESH_SECTIONS_SQL = text(
+    "UPDATE resumes SET sections = jsonb_build_object("
+    + ", ".join(
+        f"'{key}', COALESCE((SELECT jsonb_agg("
+        f"{_SECTION_ROW_JSON.get(table, 'to_jsonb(c)')} ORDER BY c.display_order) "
+        f"FROM {table} c WHERE c.resume_id = resumes.id), '[]'::jsonb)"
+        for key, table in _SECTION_TABLES
+    )
+    + ") WHERE id = :resume_id"
+)
+
+
 def get_resume_complete(
     resume_id: UUID,
     user_id: UUID,
@@ -1418,8 +1532,9 @@ def get_resume_complete(
     Returns:
         dict containing resume data with all sections, or None if not found/unauthorized
     """
-    # Fetch base resume with authorization check
-    statement = select(Resume).where(
+    # Fetch base resume with authorization check; RESUME_FULL_LOAD loads every
+    # section with one SELECT ... IN per child table
+    statement = select(Resume).options(*RESUME_FULL_LOAD).where(
         Resume.id == resume_id,
         Resume.user_id == user_id
     )
@@ -1428,52 +1543,67 @@ def get_resume_complete(
     if not resume:
         return None
     
-    # Fetch all related sections
-    experiences = db.exec(
-        select(ResumeExperience)
-        .where(ResumeExperience.resume_id == resume_id)
-        .order_by(ResumeExperience.display_order)
-    ).all()
-    
-    education = db.exec(
-        select(ResumeEducation)
-        .where(ResumeEducation.resume_id == resume_id)
-        .order_by(ResumeEducation.display_order)
-    ).all()
-    
-    skills = db.exec(
-        select(ResumeSkill)
-        .where(ResumeSkill.resume_id == resume_id)
-        .order_by(ResumeSkill.display_order)
-    ).all()
-    
-    certifications = db.exec(
-        select(ResumeCertification)
-        .where(ResumeCertification.resume_id == resume_id)
-        .order_by(ResumeCertification.display_order)
-    ).all()
-    
-    projects = db.exec(
-        select(ResumeProject)
-        .where(ResumeProject.resume_id == resume_id)
-        .order_by(ResumeProject.display_order)
-    ).all()
+    sections = {name: getattr(resume, name) for name in _SECTION_NAMES}
     
     log_info(
         f"Fetched complete resume {resume_id}: "
-        f"experiences={len(experiences)}, education={len(education)}, "
-        f"skills={len(skills)}, certifications={len(certifications)}, "
-        f"projects={len(projects)}"
+        f"experiences={len(sections['experiences'])}, education={len(sections['education'])}, "
+        f"skills={len(sections['skills'])}, certifications={len(sections['certifications'])}, "
+        f"projects={len(sections['projects'])}"
     )
     
-    return {
-        "resume": resume,
-        "experiences": experiences,
-        "education": education,
-        "skills": skills,
-        "certifications": certifications,
-        "projects": projects,
-    }
+    return {"resume": resume, **sections}
+
+
+def get_resume_sections_snapshot(
+    resume_id: UUID,
+    user_id: UUID,
+    db: Session
+) -> dict | None:
+    """
+    Retrieve a resume with all sections from its denormalized `sections` column.
+    
+    A single row read: sections come back as plain dicts (one per child row)
+    instead of ORM instances. Resumes whose snapshot hasn't been built yet
+    fall back to reading the child tables.
+    
+    Args:
+        resume_id: UUID of the resume to retrieve
+        user_id: UUID of the user (for authorization check)
+        db: Database session
+        
+    Returns:
+        dict with the resume and each section list, or None if not found/unauthorized
+    """
+    # `sections` is deferred on the model; load it with the row here only
+    statement = select(Resume).options(undefer(Resume.sections)).where(
+        Resume.id == resume_id,
+        Resume.user_id == user_id
+    )
+    resume = db.exec(statement).first()
+    
+    if not resume:
+        return None
+    
+    if resume.sections is None:
+        return {"resume": resume, **_fetch_resume_sections(db, resume_id)}
+    
+    return {"resume": resume, **resume.sections}
+
+
+def refresh_resume_sections(db: Session, resume_id: UUID) -> None:
+    """
+    Rebuild a resume's `sections` snapshot from its child tables.
+    
+    Aggregation runs entirely in PostgreSQL, so rows written by COPY (with
+    server-generated IDs and timestamps) are captured without reading them
+    back. Runs in the caller's transaction; the caller commits.
+    
+    Args:
+        db: Database session
+        resume_id: UUID of the resume whose sections changed
+    """
+    db.connection().execute(_REFRESH_SECTIONS_SQL, {"resume_id": resume_id})
 
 
 def duplicate_resume(
@@ -1525,7 +1655,7 @@ def duplicate_resume(
             user_id=user_id,
             version_name=new_version_name,
             template_id=original_resume.template_id,
-            is_primary=False,  # Duplicates are never primary
+            flags=0,  # Duplicates are never primary
             section_order=original_resume.section_order,
             file_path=None,  # Don't copy file references
             file_url=None,
@@ -1542,88 +1672,97 @@ def duplicate_resume(
             error_message=None
         )
         
+        # Flush only: the ID is generated client-side, so the new resume and all
+        # its sections go out in one transaction (no mid-way COMMIT + refresh SELECT)
         db.add(new_resume)
-        db.commit()
-        db.refresh(new_resume)
-        
-        # Copy all experiences
-        for exp in complete_data["experiences"]:
-            new_exp = ResumeExperience(
-                resume_id=new_resume.id,
-                company_name=exp.company_name,
-                job_title=exp.job_title,
-                location=exp.location,
-                start_date=exp.start_date,
-                end_date=exp.end_date,
-                is_current=exp.is_current,
-                description=exp.description,
-                achievements=exp.achievements,
-                skills_used=exp.skills_used,
-                display_order=exp.display_order
+        db.flush()
+        
+        # Copy all sections, one COPY per child table
+        bulk_insert_with_copy(db, ResumeExperience, [
+            (
+                new_resume.id,
+                new_resume.user_id,
+                exp.company_name,
+                exp.job_title,
+                exp.location,
+                exp.start_date,
+                exp.end_date,
+                exp.is_current,
+                exp.description,
+                exp.achievements,
+                exp.skills_used,
+                exp.display_order,
             )
-            db.add(new_exp)
-        
-        # Copy all education
-        for edu in complete_data["education"]:
-            new_edu = ResumeEducation(
-                resume_id=new_resume.id,
-                institution_name=edu.institution_name,
-                degree_type=edu.degree_type,
-                field_of_study=edu.field_of_study,
-                location=edu.location,
-                start_date=edu.start_date,
-                end_date=edu.end_date,
-                is_current=edu.is_current,
-                gpa=edu.gpa,
-                achievements=edu.achievements,
-                relevant_coursework=edu.relevant_coursework,
-                display_order=edu.display_order
+            for exp in complete_data["experiences"]
+        ])
+        
+        bulk_insert_with_copy(db, ResumeEducation, [
+            (
+                new_resume.id,
+                new_resume.user_id,
+                edu.institution_name,
+                edu.degree_type,
+                edu.field_of_study,
+                edu.location,
+                edu.start_date,
+                edu.end_date,
+                edu.is_current,
+                edu.gpa_x100,
+                edu.achievements,
+                edu.relevant_coursework,
+                edu.display_order,
             )
-            db.add(new_edu)
-        
-        # Copy all skills
-        for skill in complete_data["skills"]:
-            new_skill = ResumeSkill(
-                resume_id=new_resume.id,
-                skill_name=skill.skill_name,
-                skill_category=skill.skill_category,
-                proficiency_level=skill.proficiency_level,
-                years_of_experience=skill.years_of_experience,
-                is_primary=skill.is_primary,
-                display_order=skill.display_order
+            for edu in complete_data["education"]
+        ])
+        
+        bulk_insert_with_copy(db, ResumeSkill, [
+            (
+                new_resume.id,
+                new_resume.user_id,
+                skill.skill_name,
+                skill.skill_category,
+                skill.proficiency_level,
+                skill.years_of_experience_x10,
+                skill.is_primary,
+                skill.display_order,
             )
-            db.add(new_skill)
-        
-        # Copy all projects
-        for project in complete_data["projects"]:
-            new_project = ResumeProject(
-                resume_id=new_resume.id,
-                project_name=project.project_name,
-                role=project.role,
-                description=project.description,
-                technologies_used=project.technologies_used,
-                project_url=project.project_url,
-                start_date=project.start_date,
-                end_date=project.end_date,
-                is_current=project.is_current,
-                achievements=project.achievements,
-                display_order=project.display_order
+            for skill in complete_data["skills"]
+        ])
+        
+        bulk_insert_with_copy(db, ResumeProject, [
+            (
+                new_resume.id,
+                new_resume.user_id,
+                project.project_name,
+                project.role,
+                project.description,
+                project.technologies_used,
+                project.project_url,
+                project.start_date,
+                project.end_date,
+                project.is_current,
+                project.achievements,
+                project.display_order,
             )
-            db.add(new_project)
-        
-        # Copy all certifications
-        for cert in complete_data["certifications"]:
-            new_cert = ResumeCertification(
-                resume_id=new_resume.id,
-                certification_name=cert.certification_name,
-                issuing_organization=cert.issuing_organization,
-                issue_date=cert.issue_date,
-                expiry_date=cert.expiry_date,
-                credential_id=cert.credential_id,
-                credential_url=cert.credential_url,
-                display_order=cert.display_order
+            for project in complete_data["projects"]
+        ])
+        
+        bulk_insert_with_copy(db, ResumeCertification, [
+            (
+                new_resume.id,
+                new_resume.user_id,
+                cert.certification_name,
+                cert.issuing_organization,
+                cert.issue_date,
+                cert.expiry_date,
+                cert.credential_id,
+                cert.credential_url,
+                cert.display_order,
             )
-            db.add(new_cert)
+            for cert in complete_data["certifications"]
+        ])
+        
+        refresh_resume_sections(db, new_resume.id)
         
         db.commit()
         
@@ -1,3 +1,4 @@
+import re
 from datetime import datetime, timezone
 from uuid import UUID
 
@@ -5,8 +6,18 @@ from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
 from app.models.user_model import User
+from app.schemas.common_schema import EMAIL_PATTERN
 from app.schemas.user_schema import UserCreate, UserUpdate
 
+# Same shape as the Email schema type and the ck_users_email_format CHECK
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+
+
+def _validate_email(email: str) -> None:
+    """Raise ValueError (400 via the global handler) for a malformed email."""
+    if not _EMAIL_RE.match(email):
+        raise ValueError("Invalid email address")
+
 
 def create_user(db: Session, user_data: UserCreate) -> User:
     """
@@ -15,6 +26,7 @@ def create_user(db: Session, user_data: UserCreate) -> User:
     Raises IntegrityError if user with email/supabase_id already exists.
     This is handled by the global exception handler in main.py.
     """
+    _validate_email(user_data.email)
     user = User.model_validate(user_data)
     db.add(user)
     db.commit()
@@ -50,9 +62,11 @@ def update_user(db: Session, user_id: UUID, user_data: UserUpdate) -> User | Non
         return None
 
     # Update only provided fields
-    update_data = user_data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(user, key, value)
+    fields_set = user_data.model_fields_set
+    if "email" in fields_set and user_data.email is not None:
+        _validate_email(user_data.email)
+    for key in fields_set:
+        setattr(user, key, getattr(user_data, key))
 
     user.updated_at = datetime.now(timezone.utc)
 
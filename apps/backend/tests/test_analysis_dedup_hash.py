@@ -0,0 +1,51 @@
+"""
+Tests for the hashed analysis dedup key.
+"""
+from uuid import uuid4
+
+from app.models.analysis_model import AnalysisResult
+
+
+def _analysis(**overrides) -> AnalysisResult:
+    values = {
+        "resume_id": uuid4(),
+        "job_description_id": uuid4(),
+        "resume_content_hash": "a" * 64,
+        "job_description_hash": "b" * 64,
+        "skills_version": "1",
+        "keywords_rules_version": "1",
+        "analysis_version": "1.0",
+        "overall_score": 80,
+    }
+    values.update(overrides)
+    return AnalysisResult(**values)
+
+
+class TestComputeDedupHash:
+    """Test suite for AnalysisResult.compute_dedup_hash."""
+
+    def test_same_columns_give_same_hash(self):
+        first = _analysis()
+        second = _analysis(
+            resume_id=first.resume_id, job_description_id=first.job_description_id
+        )
+
+        assert first.compute_dedup_hash() == second.compute_dedup_hash()
+        assert len(first.compute_dedup_hash()) == 32
+
+    def test_null_column_leaves_row_unconstrained(self):
+        # The old multi-column constraint treated NULLs as distinct
+        assert _analysis(job_description_id=None).compute_dedup_hash() is None
+
+    def test_separator_in_a_value_cannot_shift_columns(self):
+        resume_id, job_id = uuid4(), uuid4()
+        first = _analysis(
+            resume_id=resume_id, job_description_id=job_id,
+            skills_version="1|1", keywords_rules_version="1",
+        )
+        second = _analysis(
+            resume_id=resume_id, job_description_id=job_id,
+            skills_version="1", keywords_rules_version="1|1",
+        )
+
+        assert first.compute_dedup_hash() != second.compute_dedup_hash()
@@ -0,0 +1,43 @@
+"""
+Tests for the tagged union used by bulk job application writes.
+"""
+from uuid import uuid4
+
+from app.schemas.application_schema import (
+    JobApplicationBulkCreate,
+    JobApplicationBulkUpdate,
+    JobApplicationCreate,
+    JobApplicationWriteListAdapter,
+)
+
+
+class TestJobApplicationWrite:
+    """Test suite for JobApplicationWriteListAdapter."""
+
+    def test_items_dispatch_on_op(self):
+        items = JobApplicationWriteListAdapter.validate_python([
+            {
+                "op": "create",
+                "user_id": str(uuid4()),
+                "company_name": "Acme",
+                "job_title": "Engineer",
+                "application_date": "2026-01-01",
+            },
+            {"op": "update", "id": str(uuid4()), "notes": "Followed up"},
+        ])
+
+        assert [type(item) for item in items] == [
+            JobApplicationBulkCreate,
+            JobApplicationBulkUpdate,
+        ]
+
+    def test_single_write_schemas_have_no_op(self):
+        create = JobApplicationCreate(
+            user_id=uuid4(),
+            company_name="Acme",
+            job_title="Engineer",
+            application_date="2026-01-01",
+        )
+
+        assert "op" not in create.model_dump()
+        assert "op" not in JobApplicationCreate.model_json_schema()["properties"]
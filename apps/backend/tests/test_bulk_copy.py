@@ -0,0 +1,85 @@
+"""
+Tests for the COPY TEXT encoding used by bulk resume child inserts.
+"""
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+
+from app.db.bulk import (
+    _build_copy_line,
+    _encode_copy_rows,
+    _format_value_for_copy,
+    bulk_insert_with_copy,
+)
+from app.models.resume_model import ResumeEducation, ResumeExperience
+
+
+class TestCopyFormatting:
+    """Test suite for COPY TEXT value formatting."""
+
+    def test_null_and_booleans(self):
+        assert _format_value_for_copy(None) == "\\N"
+        assert _format_value_for_copy(True) == "t"
+        assert _format_value_for_copy(False) == "f"
+
+    def test_scalars(self):
+        uid = UUID("12345678-1234-5678-1234-567812345678")
+        assert _format_value_for_copy(uid) == str(uid)
+        assert _format_value_for_copy(date(2024, 1, 31)) == "2024-01-31"
+        assert _format_value_for_copy(Decimal("3.50")) == "3.50"
+        assert _format_value_for_copy(7) == "7"
+
+    def test_text_escaping(self):
+        assert _format_value_for_copy("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+
+    def test_jsonb_values(self):
+        assert _format_value_for_copy([]) == "[]"
+        assert _format_value_for_copy(["a", 'say "hi"']) == '["a","say \\\\"hi\\\\""]'
+        assert _format_value_for_copy({"k": 1}) == '{"k":1}'
+
+    def test_encode_rows(self):
+        stream = _encode_copy_rows([(1, "x", None), (2, "y", True)])
+        assert stream.read() == b"1\tx\t\\N\n2\ty\tt\n"
+
+
+class TestGeneratedCopyLine:
+    """Test suite for per-model generated COPY line serializers."""
+
+    def test_matches_generic_formatter(self):
+        uid = UUID("12345678-1234-5678-1234-567812345678")
+        row = (
+            uid, uid, "Acme\tCo", "Engineer", None, date(2020, 1, 1), None,
+            True, "line\nbreak", ["a\\b"], [], 3,
+        )
+        expected = "\t".join(_format_value_for_copy(value) for value in row) + "\n"
+
+        assert _build_copy_line(ResumeExperience)(row) == expected
+
+    def test_encode_rows_with_model(self):
+        uid = UUID("12345678-1234-5678-1234-567812345678")
+        row = (
+            uid, uid, "Uni", None, None, None, None, None,
+            False, 350, [], ["Algorithms"], 0,
+        )
+        stream = _encode_copy_rows([row], ResumeEducation)
+
+        assert stream.read() == (
+            f"{uid}\t{uid}\tUni\t\\N\t\\N\t\\N\t\\N\t\\N\tf\t350\t[]\t[\"Algorithms\"]\t0\n"
+        ).encode()
+
+
+class TestBulkInsertFallback:
+    """Test suite for the non-PostgreSQL executemany fallback."""
+
+    def test_row_shorter_than_copy_columns_is_rejected(self):
+        db = MagicMock()
+        db.connection.return_value.dialect.name = "sqlite"
+        uid = UUID("12345678-1234-5678-1234-567812345678")
+
+        with pytest.raises(ValueError):
+            bulk_insert_with_copy(db, ResumeEducation, [(uid, uid, "Uni")])
+
+        db.connection.return_value.execute.assert_not_called()
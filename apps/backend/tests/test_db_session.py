@@ -0,0 +1,20 @@
+"""
+Tests for the database engine configuration.
+"""
+import orjson
+
+from app.db.session import engine
+
+
+class TestEngineJsonCodec:
+    """JSON/JSONB columns (section_order, custom section content, etc.) use orjson."""
+
+    def test_serializer_emits_compact_orjson_text(self):
+        serialize = engine.dialect._json_serializer
+        value = {"experiences": 0, "education": 1, "skills": 2}
+
+        assert serialize(value) == orjson.dumps(value).decode()
+        assert isinstance(serialize(value), str)
+
+    def test_deserializer_is_orjson(self):
+        assert engine.dialect._json_deserializer is orjson.loads
@@ -0,0 +1,137 @@
+"""
+Tests for building Read schemas from ORM rows without validation.
+"""
+import warnings
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.models.analysis_model import AnalysisResult
+from app.models.resume_model import FLAG_IS_PRIMARY, Resume
+from app.models.user_model import User
+from app.schemas.analysis_schema import AnalysisResultRead
+from app.schemas.application_schema import InterviewSlot, JobApplicationRead
+from app.schemas.common_schema import _needs_conversion
+from app.schemas.resume_schema import ResumeComplete, ResumeListItem, ResumeRead
+from app.schemas.user_schema import UserRead
+
+
+def _resume() -> Resume:
+    now = datetime.now(timezone.utc)
+    return Resume(
+        id=uuid4(),
+        user_id=uuid4(),
+        version_name="v1",
+        flags=FLAG_IS_PRIMARY,
+        content_hash=b"\x01\xff",
+        processing_status="Completed",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class TestFromOrmFast:
+    """Test suite for FastRead.from_orm_fast."""
+
+    @pytest.mark.parametrize("schema, row", [
+        (ResumeRead, _resume()),
+        (ResumeListItem, _resume()),
+        (UserRead, User(supabase_user_id=uuid4(), email="user@example.com")),
+    ])
+    def test_every_read_field_is_a_row_attribute(self, schema, row):
+        # Fields are copied by name, so a renamed column must fail here, not at runtime
+        missing = [name for name in schema.model_fields if not hasattr(row, name)]
+
+        assert missing == []
+
+    def test_matches_validated_model(self):
+        resume = _resume()
+
+        constructed = ResumeRead.from_orm_fast(resume)
+
+        assert constructed == ResumeRead.model_validate(resume)
+        assert constructed.content_hash == "01ff"
+        assert constructed.is_primary is True
+
+    def test_complete_takes_sections_as_keywords(self):
+        complete = ResumeComplete.from_orm_fast(_resume(), skills=[], projects=[])
+
+        assert complete.skills == []
+        assert complete.experiences == []
+
+    def test_build_validates_snapshot_sections(self):
+        resume = _resume()
+        sections = {
+            "experiences": [],
+            "education": [],
+            "skills": [{
+                "id": str(uuid4()),
+                "resume_id": str(resume.id),
+                "skill_name": "Python",
+                "skill_category": None,
+                "proficiency_level": None,
+                "years_of_experience": 1.5,
+                "is_primary": False,
+                "display_order": 0,
+                "created_at": "2026-01-01T00:00:00+00:00",
+            }],
+            "certifications": [],
+            "projects": [],
+            "custom_sections": [],
+        }
+
+        complete = ResumeComplete.build(resume, sections)
+
+        assert complete.skills[0].skill_name == "Python"
+        assert complete.skills[0].years_of_experience == 1.5
+
+    def test_instance_state_matches_model_construct(self):
+        resume = _resume()
+        values = {name: getattr(resume, name) for name in ResumeListItem.model_fields}
+
+        constructed = ResumeListItem.from_orm_fast(resume)
+        expected = ResumeListItem.model_construct(**values)
+
+        assert constructed == expected
+        assert constructed.model_fields_set == expected.model_fields_set
+        assert constructed.__pydantic_extra__ is None
+        assert constructed.__pydantic_private__ is None
+
+    def test_tuple_fields_are_converted_and_dump_cleanly(self):
+        now = datetime.now(timezone.utc)
+        row = AnalysisResult(
+            id=uuid4(),
+            resume_id=uuid4(),
+            overall_score=80,
+            matched_keywords=["python"],
+            missing_keywords=[],
+            analysis_version="1.0",
+            analyzed_at=now,
+        )
+
+        constructed = AnalysisResultRead.from_orm_fast(row)
+
+        assert constructed.matched_keywords == ("python",)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            constructed.model_dump_json()
+
+    def test_nested_model_fields_are_converted(self):
+        now = datetime.now(timezone.utc)
+        # No ORM model backs job applications yet; any attribute row works
+        row = SimpleNamespace(**{
+            **dict.fromkeys(JobApplicationRead.model_fields),
+            "interview_dates": [{"when": now.isoformat(), "kind": "phone"}],
+        })
+
+        constructed = JobApplicationRead.from_orm_fast(row)
+
+        assert isinstance(constructed.interview_dates[0], InterviewSlot)
+
+    def test_plain_fields_are_copied_without_conversion(self):
+        assert not any(
+            _needs_conversion(field.annotation)
+            for field in ResumeRead.model_fields.values()
+        )
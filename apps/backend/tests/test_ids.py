@@ -0,0 +1,27 @@
+"""
+Tests for time-ordered UUID generation.
+"""
+import time
+
+from app.core.ids import uuid7
+
+
+class TestUuid7:
+    """Test suite for uuid7()."""
+
+    def test_version_and_variant(self):
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_embeds_millisecond_timestamp(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after
+
+    def test_ordered_across_milliseconds(self):
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        assert first < second
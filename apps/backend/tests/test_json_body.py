@@ -0,0 +1,69 @@
+"""
+Tests for the json_body dependency that validates raw request bytes.
+"""
+import pytest
+from fastapi import Depends, FastAPI, status
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.core.dependencies import fill_json_body_schemas, json_body, json_body_openapi
+
+
+class Item(BaseModel):
+    name: str = Field(..., max_length=10)
+    quantity: int
+
+
+@pytest.fixture
+def body_client():
+    """Create a test client for an app with one json_body route."""
+    app = FastAPI()
+
+    @app.post("/items", openapi_extra=json_body_openapi(Item))
+    def create_item(item: Item = Depends(json_body(Item))):
+        return {"name": item.name, "quantity": item.quantity}
+
+    with TestClient(app) as c:
+        yield c
+
+
+class TestJsonBody:
+    """Test suite for json_body."""
+
+    def test_valid_body_is_parsed(self, body_client):
+        response = body_client.post("/items", content=b'{"name": "pen", "quantity": 2}')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"name": "pen", "quantity": 2}
+
+    def test_invalid_body_returns_body_located_422(self, body_client):
+        response = body_client.post("/items", content=b'{"name": "pen"}')
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        assert response.json()["detail"][0]["loc"] == ["body", "quantity"]
+
+    def test_malformed_json_returns_422(self, body_client):
+        response = body_client.post("/items", content=b"{not json")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    def test_body_is_documented(self, body_client):
+        fill_json_body_schemas()
+        operation = body_client.get("/openapi.json").json()["paths"]["/items"]["post"]
+
+        schema = operation["requestBody"]["content"]["application/json"]["schema"]
+        assert schema["required"] == ["name", "quantity"]
+
+    def test_openapi_extra_does_not_build_deferred_model(self):
+        class Deferred(BaseModel):
+            model_config = ConfigDict(defer_build=True)
+
+            name: str
+
+        extra = json_body_openapi(Deferred)
+        assert Deferred.__pydantic_complete__ is False
+
+        fill_json_body_schemas()
+
+        schema = extra["requestBody"]["content"]["application/json"]["schema"]
+        assert schema["required"] == ["name"]
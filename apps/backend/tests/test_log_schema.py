@@ -0,0 +1,70 @@
+"""
+Tests for the hand-parsed frontend log payload.
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.schemas.log_schema import MESSAGE_MAX_LENGTH, FrontendLogPayload
+
+
+class TestFrontendLogPayload:
+    """Test suite for FrontendLogPayload.from_json."""
+
+    def test_parses_fields_and_iso_timestamp(self):
+        payload = FrontendLogPayload.from_json({
+            "level": "ERROR",
+            "message": "Login failed",
+            "source": "login_page",
+            "timestamp": "2026-01-02T03:04:05+00:00",
+            "context": {"attempt": 1},
+        })
+
+        assert payload.level == "ERROR"
+        assert payload.timestamp == datetime.fromisoformat("2026-01-02T03:04:05+00:00")
+        assert payload.context == {"attempt": 1}
+        assert payload.user_id is None
+
+    def test_truncates_long_messages(self):
+        payload = FrontendLogPayload.from_json(
+            {"level": "INFO", "message": "x" * (MESSAGE_MAX_LENGTH + 10), "source": "s"}
+        )
+
+        assert len(payload.message) == MESSAGE_MAX_LENGTH
+
+    @pytest.mark.parametrize("raw", [
+        [],
+        {"level": "INFO", "source": "s"},
+        {"level": "INFO", "message": "m", "source": "s", "user_id": 1},
+        {"level": "INFO", "message": "m", "source": "s", "context": "oops"},
+    ])
+    def test_rejects_malformed_payloads(self, raw):
+        with pytest.raises(ValueError):
+            FrontendLogPayload.from_json(raw)
+
+    def test_missing_timestamp_falls_back_to_receipt_time(self):
+        payload = FrontendLogPayload.from_json({"level": "INFO", "message": "m", "source": "s"})
+
+        assert payload.timestamp is None
+        assert payload.logged_at.tzinfo is not None
+        assert abs(payload.logged_at.timestamp() - payload.received_ns / 1e9) < 1e-3
+
+    @pytest.mark.parametrize("timestamp, expected", [
+        ("2026-01-02T03:04:05.678Z", datetime(2026, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)),
+        (1760000000, datetime.fromtimestamp(1760000000, tz=timezone.utc)),
+        # JS Date.now() milliseconds
+        (1760000000000, datetime.fromtimestamp(1760000000, tz=timezone.utc)),
+    ])
+    def test_parses_client_timestamp_formats(self, timestamp, expected):
+        payload = FrontendLogPayload.from_json(
+            {"level": "INFO", "message": "m", "source": "s", "timestamp": timestamp}
+        )
+
+        assert payload.timestamp == expected
+
+    @pytest.mark.parametrize("timestamp", [10**30, float("inf"), "not a date", True])
+    def test_unrepresentable_timestamp_raises_value_error(self, timestamp):
+        with pytest.raises(ValueError):
+            FrontendLogPayload.from_json(
+                {"level": "INFO", "message": "m", "source": "s", "timestamp": timestamp}
+            )
@@ -0,0 +1,41 @@
+"""
+Tests for queued structured logging.
+"""
+import io
+import logging
+
+import orjson
+
+from app.core.logging_config import LoggerSetup, OrjsonFormatter
+
+
+class TestQueuedOrjsonLogging:
+    """Test suite for loggers moved behind a queue listener."""
+
+    def test_exception_reaches_formatter_as_exc_info(self):
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(OrjsonFormatter())
+        logger = logging.getLogger("optihire.tests.queued")
+        propagate = logger.propagate
+        logger.propagate = False
+        logger.addHandler(handler)
+        listener = LoggerSetup.attach_queue_listener(logger)
+
+        try:
+            try:
+                raise ZeroDivisionError("boom")
+            except ZeroDivisionError:
+                logger.exception(
+                    "failed %s", "request", extra={"extra_fields": {"path": "/x"}}
+                )
+        finally:
+            listener.stop()
+            for added in list(logger.handlers):
+                logger.removeHandler(added)
+            logger.propagate = propagate
+
+        entry = orjson.loads(stream.getvalue())
+        assert entry["msg"] == "failed request"
+        assert entry["path"] == "/x"
+        assert "ZeroDivisionError: boom" in entry["exc_info"]
@@ -2,9 +2,13 @@
 Integration tests for JWT middleware authentication and authorization.
 Tests cover token validation, claim enforcement, scope checking, and request ID propagation.
 """
+import hashlib
+
 import pytest
 from fastapi import status
 
+from app.core.jwt import token_cache
+
 
 class TestMiddlewareAuthentication:
     """Test authentication flow in middleware."""
@@ -13,7 +17,6 @@ class TestMiddlewareAuthentication:
         """Public paths should be accessible without authentication."""
         response = client.get("/health")
         assert response.status_code == status.HTTP_200_OK
-        assert "x-request-id" in response.headers
     
     def test_protected_path_no_token_returns_401(self, client):
         """Protected endpoints without token should return 401."""
@@ -113,12 +116,12 @@ class TestRequestIDPropagation:
     
     def test_request_id_generated_when_missing(self, client):
         """Middleware should generate request ID if not provided."""
-        response = client.get("/health")
+        response = client.get("/protected")
         assert "x-request-id" in response.headers
         request_id = response.headers["x-request-id"]
-        # UUID format check (basic)
-        assert len(request_id) == 36
-        assert request_id.count("-") == 4
+        # UUID hex format check (basic)
+        assert len(request_id) == 32
+        assert int(request_id, 16) >= 0
     
     def test_request_id_preserved_when_provided(self, client):
         """Middleware should preserve incoming request ID."""
@@ -135,11 +138,17 @@ class TestRequestIDPropagation:
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         assert "x-request-id" in response.headers
     
-    def test_request_id_added_to_public_paths(self, client):
-        """Request ID should be added to public path responses."""
+    def test_request_id_echoed_on_public_paths(self, client):
+        """Public paths should echo a client-sent request ID."""
+        response = client.get("/health", headers={"x-request-id": "probe-1"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["x-request-id"] == "probe-1"
+    
+    def test_request_id_not_generated_on_public_paths(self, client):
+        """Public paths should not generate a request ID (keeps probes cheap)."""
         response = client.get("/health")
         assert response.status_code == status.HTTP_200_OK
-        assert "x-request-id" in response.headers
+        assert "x-request-id" not in response.headers
 
 
 class TestErrorResponseFormat:
@@ -187,3 +196,38 @@ class TestRequestStateEnrichment:
         )
         assert response.status_code == status.HTTP_200_OK
         # If request.state.user wasn't set, scope checking would fail
+
+
+class TestTokenCache:
+    """Test validated-token caching in the JWT validator."""
+    
+    def test_valid_token_is_cached_by_digest(self, client, valid_token):
+        """A validated token should be cached under its SHA-256 digest, not the raw token."""
+        response = client.get(
+            "/protected",
+            headers={"Authorization": f"Bearer {valid_token}"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert valid_token not in token_cache
+        assert hashlib.sha256(valid_token.encode()).digest() in token_cache
+    
+    def test_failed_token_is_not_cached(self, client, expired_token):
+        """Tokens that fail validation should never be cached."""
+        client.get(
+            "/protected",
+            headers={"Authorization": f"Bearer {expired_token}"}
+        )
+        assert hashlib.sha256(expired_token.encode()).digest() not in token_cache
+
+
+class TestAppMiddlewareRegistration:
+    """Test that the production app registers each middleware exactly once."""
+    
+    def test_single_jwt_middleware_registered(self):
+        """Exactly one JWTMiddleware (the app.middleware.auth one) should be installed."""
+        from app.main import app as main_app
+        from app.middleware.auth import JWTMiddleware
+        
+        registered = [m.cls for m in main_app.user_middleware]
+        assert registered.count(JWTMiddleware) == 1
+        assert len(registered) == len(set(registered))
@@ -0,0 +1,59 @@
+"""
+Tests for the bit-packed flags on resumes and resume templates.
+"""
+from uuid import uuid4
+
+from app.models.resume_model import (
+    FLAG_IS_ACTIVE,
+    FLAG_IS_DEFAULT,
+    FLAG_IS_PRIMARY,
+    Resume,
+    ResumeTemplate,
+)
+
+
+class TestResumeFlags:
+    """Test suite for boolean views over the flags column."""
+
+    def test_is_primary_sets_and_clears_its_bit(self):
+        resume = Resume(user_id=uuid4(), version_name="v1")
+        assert resume.is_primary is False
+
+        resume.is_primary = True
+        assert resume.flags == FLAG_IS_PRIMARY
+
+        resume.is_primary = False
+        assert resume.flags == 0
+
+    def test_constructor_packs_is_primary(self):
+        resume = Resume(user_id=uuid4(), version_name="v1", is_primary=True)
+
+        assert resume.flags == FLAG_IS_PRIMARY
+        assert resume.is_primary is True
+
+    def test_constructor_and_validate_pack_template_flags(self):
+        values = {"name": "Classic", "path": "classic.html"}
+
+        built = ResumeTemplate(**values, is_active=False, is_default=True)
+        validated = ResumeTemplate.model_validate(
+            {**values, "is_active": False, "is_default": True}
+        )
+
+        assert built.flags == FLAG_IS_DEFAULT
+        assert validated.flags == FLAG_IS_DEFAULT
+
+    def test_template_flags_are_independent(self):
+        template = ResumeTemplate(name="Classic", path="classic.html")
+        assert template.is_active is True
+        assert template.is_default is False
+
+        template.is_default = True
+        template.is_active = False
+
+        assert template.flags == FLAG_IS_DEFAULT
+        assert template.flags & FLAG_IS_ACTIVE == 0
+
+    def test_primary_index_tests_the_bit(self):
+        index = next(i for i in Resume.__table__.indexes if i.name == "idx_resumes_primary")
+
+        assert str(index.dialect_options["postgresql"]["where"]) == "(flags & 1) <> 0"
@@ -0,0 +1,144 @@
+"""
+Tests for the Resume section relationships and the RESUME_FULL_LOAD plan.
+"""
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import JSON, CheckConstraint, MetaData, create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.sql.elements import TextClause
+from sqlmodel import Session, select
+
+from app.models.resume_model import RESUME_FULL_LOAD, Resume
+
+SECTIONS = (
+    "experiences",
+    "education",
+    "skills",
+    "certifications",
+    "projects",
+    "custom_sections",
+)
+SECTION_TABLES = (
+    "resume_experiences",
+    "resume_education",
+    "resume_skills",
+    "resume_certifications",
+    "resume_projects",
+    "resume_custom_sections",
+)
+
+
+@pytest.fixture
+def resume_db():
+    """
+    In-memory SQLite copy of resumes and its section tables, recording SQL.
+
+    PostgreSQL-only parts (JSONB, GIN indexes, CHECKs, SQL server defaults)
+    are dropped from the copy; the ORM mappings are used unchanged.
+    """
+    metadata = MetaData()
+    for name in ("resumes", *SECTION_TABLES):
+        table = Resume.metadata.tables[name].to_metadata(metadata)
+        table.indexes.clear()
+        for constraint in [c for c in table.constraints if isinstance(c, CheckConstraint)]:
+            table.constraints.discard(constraint)
+        for column in table.columns:
+            if isinstance(column.type, JSONB):
+                column.type = JSON()
+            if isinstance(getattr(column.server_default, "arg", None), TextClause):
+                column.server_default = None
+
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    statements: list[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    with Session(engine) as db:
+        db.add(Resume(user_id=uuid4(), version_name="v1"))
+        db.commit()
+        db.expunge_all()
+        statements.clear()
+        yield db, statements
+
+
+class TestResumeRelationships:
+    """Test suite for resume section relationships."""
+
+    def test_every_section_is_mapped(self):
+        configure_mappers()
+        relationships = Resume.__mapper__.relationships
+
+        for name in SECTIONS:
+            assert name in relationships
+            assert relationships[name].back_populates == "resume"
+            assert str(relationships[name].primaryjoin).startswith("resumes.id = ")
+
+    def test_full_load_emits_one_ordered_select_in_per_section(self, resume_db):
+        db, statements = resume_db
+
+        db.exec(select(Resume).options(*RESUME_FULL_LOAD)).one()
+
+        assert len(statements) == 1 + len(SECTION_TABLES)
+        for table in SECTION_TABLES:
+            [sql] = [s for s in statements if f"FROM {table} " in s]
+            assert f"WHERE {table}.resume_id IN (" in sql
+            assert sql.rstrip().endswith(f"ORDER BY {table}.display_order")
+
+    def test_delete_does_not_load_sections(self, resume_db):
+        db, statements = resume_db
+        resume = db.exec(select(Resume)).one()
+        statements.clear()
+
+        db.delete(resume)
+        db.flush()
+
+        assert statements == ["DELETE FROM resumes WHERE resumes.id = ?"]
+
+
+class TestResumeSectionsSnapshot:
+    """Test suite for reading sections from the denormalized snapshot."""
+
+    def test_sections_column_is_deferred(self):
+        sql = str(select(Resume).compile())
+
+        assert "resumes.sections" not in sql
+        assert "resumes.version_name" in sql
+
+    def test_snapshot_query_undefers_sections(self):
+        from unittest.mock import MagicMock
+        from uuid import uuid4
+
+        from app.services.resume_service import get_resume_sections_snapshot
+
+        db = MagicMock()
+        db.exec.return_value.first.return_value = None
+
+        get_resume_sections_snapshot(uuid4(), uuid4(), db)
+
+        statement = db.exec.call_args.args[0]
+        assert "resumes.sections" in str(statement.compile())
+
+    def test_snapshot_is_read_without_child_queries(self):
+        from unittest.mock import MagicMock
+        from uuid import uuid4
+
+        from app.services.resume_service import get_resume_sections_snapshot
+
+        resume = MagicMock()
+        resume.sections = {name: [] for name in SECTIONS}
+        resume.sections["skills"] = [{"skill_name": "Python"}]
+        db = MagicMock()
+        db.exec.return_value.first.return_value = resume
+
+        result = get_resume_sections_snapshot(uuid4(), uuid4(), db)
+
+        assert result["resume"] is resume
+        assert result["skills"] == [{"skill_name": "Python"}]
+        db.exec.assert_called_once()
+        db.scalars.assert_not_called()
@@ -0,0 +1,72 @@
+"""
+Tests for the SMALLINT-scaled gpa and years_of_experience columns.
+"""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.models.resume_model import ResumeEducation, ResumeSkill
+from app.models.user_model import User
+from app.schemas.resume_schema import EducationRead
+from app.schemas.user_schema import UserCreate
+
+
+class TestScaledDecimals:
+    """Test suite for the float views over scaled integer columns."""
+
+    def test_gpa_round_trips_through_hundredths(self):
+        education = ResumeEducation(
+            resume_id=uuid4(), user_id=uuid4(), institution_name="Uni"
+        )
+        education.gpa = 3.75
+
+        assert education.gpa_x100 == 375
+        assert education.gpa == 3.75
+
+    def test_years_of_experience_uses_tenths(self):
+        skill = ResumeSkill(resume_id=uuid4(), user_id=uuid4(), skill_name="Python")
+        skill.years_of_experience = 2.5
+        user = User(supabase_user_id=uuid4(), email="a@b.co", years_of_experience_x10=120)
+
+        assert skill.years_of_experience_x10 == 25
+        assert user.years_of_experience == 12.0
+
+    def test_none_clears_the_column(self):
+        education = ResumeEducation(
+            resume_id=uuid4(), user_id=uuid4(), institution_name="Uni", gpa_x100=300
+        )
+        education.gpa = None
+
+        assert education.gpa_x100 is None
+        assert education.gpa is None
+
+    def test_read_schema_sees_float_gpa(self):
+        now = datetime.now(timezone.utc)
+        education = ResumeEducation(
+            id=uuid4(), resume_id=uuid4(), user_id=uuid4(), institution_name="Uni",
+            gpa_x100=390, display_order=0, created_at=now, updated_at=now,
+        )
+
+        assert EducationRead.model_validate(education).gpa == 3.9
+
+    def test_constructor_and_validate_scale_api_values(self):
+        education = ResumeEducation(
+            resume_id=uuid4(), user_id=uuid4(), institution_name="Uni", gpa=3.5
+        )
+        skill = ResumeSkill.model_validate({
+            "resume_id": uuid4(),
+            "user_id": uuid4(),
+            "skill_name": "Python",
+            "years_of_experience": 2.5,
+        })
+        user = User(supabase_user_id=uuid4(), email="a@b.co", years_of_experience=4.0)
+
+        assert education.gpa_x100 == 350
+        assert skill.years_of_experience_x10 == 25
+        assert user.years_of_experience_x10 == 40
+
+    def test_user_validated_from_create_schema_keeps_experience(self):
+        user_data = UserCreate(
+            supabase_user_id=uuid4(), email="a@b.co", years_of_experience=1.5
+        )
+
+        assert User.model_validate(user_data).years_of_experience_x10 == 15
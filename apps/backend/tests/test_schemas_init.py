@@ -0,0 +1,36 @@
+"""
+Tests for the lazy re-exports in app.schemas.
+"""
+import pytest
+
+import app.schemas as schemas
+
+
+class TestLazySchemaExports:
+    """Test suite for PEP 562 lazy schema loading."""
+
+    def test_every_export_has_a_source_module(self):
+        assert set(schemas._LAZY) == set(schemas.__all__)
+
+    def test_export_resolves_and_is_cached(self):
+        from app.schemas.user_schema import UserRead
+
+        assert schemas.UserRead is UserRead
+        assert vars(schemas)["UserRead"] is UserRead
+
+    def test_unknown_name_raises_attribute_error(self):
+        name = "NotASchema"
+
+        with pytest.raises(AttributeError):
+            getattr(schemas, name)
+
+    def test_package_and_module_share_one_class(self):
+        from app.schemas.analysis_schema import AnalysisResultCreate
+
+        assert schemas.AnalysisResultCreate is AnalysisResultCreate
+
+    def test_warmup_builds_route_models(self):
+        schemas.warmup()
+
+        for name in schemas._ROUTE_MODELS:
+            assert getattr(schemas, name).__pydantic_complete__